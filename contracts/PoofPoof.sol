@@ -6,13 +6,21 @@ import "@openzeppelin/token/ERC721/extensions/ERC721Enumerable.sol";
 import "@openzeppelin/token/ERC721/extensions/ERC721URIStorage.sol";
 import "@openzeppelin/access/Ownable.sol";
 import "@openzeppelin/utils/Counters.sol";
+import "@openzeppelin/utils/Strings.sol";
+import "@openzeppelin/utils/structs/BitMaps.sol";
 
 contract PoofPoof is ERC721, ERC721URIStorage, Ownable {
+    using BitMaps for BitMaps.BitMap;
     using Counters for Counters.Counter;
+    using Strings for uint256;
 
     Counters.Counter private _tokenIdCounter;
     string public poofBaseURI;
 
+    // Tokens whose URI is derived as "<tokenId>.json" instead of stored.
+    // One storage slot covers 256 tokens.
+    BitMaps.BitMap private _derivedURIs;
+
     constructor(string memory baseURI) ERC721("PoofPoof", "POOFPOOF") {
         poofBaseURI = baseURI;
     }
@@ -28,10 +36,46 @@ contract PoofPoof is ERC721, ERC721URIStorage, Ownable {
         _setTokenURI(tokenId, uri);
     }
 
+    /**
+     * @dev Mint one token to each address, with consecutive token IDs. Their URIs
+     * are derived as "<tokenId>.json", so no per-token string is stored.
+     */
+    function batchMint(address[] calldata to) public onlyOwner {
+        _setDerivedURIs(_tokenIdCounter.current(), to.length);
+        for (uint256 i = 0; i < to.length; i++) {
+            uint256 tokenId = _tokenIdCounter.current();
+            _tokenIdCounter.increment();
+            _safeMint(to[i], tokenId);
+        }
+    }
+
+    /**
+     * @dev Mark `count` consecutive tokens, starting at `firstTokenId`, as having
+     * derived URIs. Each 256-bit word of the bitmap is written once, rather than
+     * once per token.
+     */
+    function _setDerivedURIs(uint256 firstTokenId, uint256 count) private {
+        uint256 tokenId = firstTokenId;
+        uint256 end = firstTokenId + count;
+        while (tokenId < end) {
+            uint256 offset = tokenId & 0xff;
+            uint256 bits = 256 - offset;
+            if (bits > end - tokenId) {
+                bits = end - tokenId;
+            }
+
+            // `bits` ones from `offset`; (1 << 256) would overflow, so a full word is special.
+            uint256 mask = bits == 256 ? type(uint256).max : ((1 << bits) - 1) << offset;
+            _derivedURIs._data[tokenId >> 8] |= mask;
+            tokenId += bits;
+        }
+    }
+
     // The following functions are overrides required by Solidity.
 
     function _burn(uint256 tokenId) internal override(ERC721, ERC721URIStorage) {
         super._burn(tokenId);
+        _derivedURIs.unset(tokenId);
     }
 
     function tokenURI(uint256 tokenId)
@@ -40,6 +84,11 @@ contract PoofPoof is ERC721, ERC721URIStorage, Ownable {
         override(ERC721, ERC721URIStorage)
         returns (string memory)
     {
+        if (_derivedURIs.get(tokenId)) {
+            require(_exists(tokenId), "ERC721URIStorage: URI query for nonexistent token");
+            return string(abi.encodePacked(_baseURI(), tokenId.toString(), ".json"));
+        }
+
         return super.tokenURI(tokenId);
     }
 }
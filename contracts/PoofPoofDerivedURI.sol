@@ -0,0 +1,72 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.2;
+
+import "@openzeppelin/token/ERC721/ERC721.sol";
+import "@openzeppelin/access/Ownable.sol";
+import "@openzeppelin/utils/Counters.sol";
+import "@openzeppelin/utils/Strings.sol";
+
+/**
+ * @dev A PoofPoof variant that derives each token URI as "<baseURI><tokenId>.json"
+ * instead of storing it, so minting writes no strings. Tokens only get a stored
+ * URI when an override is set for them.
+ */
+contract PoofPoofDerivedURI is ERC721, Ownable {
+    using Counters for Counters.Counter;
+    using Strings for uint256;
+
+    Counters.Counter private _tokenIdCounter;
+    string public poofBaseURI;
+
+    mapping(uint256 => string) private _tokenURIOverrides;
+
+    constructor(string memory baseURI) ERC721("PoofPoof", "POOFPOOF") {
+        poofBaseURI = baseURI;
+    }
+
+    function _baseURI() internal view override returns (string memory) {
+        return poofBaseURI;
+    }
+
+    function safeMint(address to) public onlyOwner {
+        uint256 tokenId = _tokenIdCounter.current();
+        _tokenIdCounter.increment();
+        _safeMint(to, tokenId);
+    }
+
+    function batchMint(address[] calldata to) public onlyOwner {
+        for (uint256 i = 0; i < to.length; i++) {
+            uint256 tokenId = _tokenIdCounter.current();
+            _tokenIdCounter.increment();
+            _safeMint(to[i], tokenId);
+        }
+    }
+
+    /**
+     * @dev Override the derived URI of a single token. The override is appended
+     * to the base URI, like URIs stored by `ERC721URIStorage`. Set it to an empty
+     * string to go back to the derived URI.
+     */
+    function setTokenURI(uint256 tokenId, string memory uri) public onlyOwner {
+        require(_exists(tokenId), "PoofPoofDerivedURI: URI set of nonexistent token");
+        _tokenURIOverrides[tokenId] = uri;
+    }
+
+    function tokenURI(uint256 tokenId) public view override returns (string memory) {
+        require(_exists(tokenId), "ERC721Metadata: URI query for nonexistent token");
+
+        string memory uri = _tokenURIOverrides[tokenId];
+        if (bytes(uri).length > 0) {
+            return string(abi.encodePacked(_baseURI(), uri));
+        }
+
+        return string(abi.encodePacked(_baseURI(), tokenId.toString(), ".json"));
+    }
+
+    function _burn(uint256 tokenId) internal override {
+        super._burn(tokenId);
+        if (bytes(_tokenURIOverrides[tokenId]).length > 0) {
+            delete _tokenURIOverrides[tokenId];
+        }
+    }
+}
@@ -1,5 +1,13 @@
+import click
+
 from sdk import sdk
 
 
 def main():
-    sdk.clean()
+    report = sdk.clean_pins()
+    click.echo(
+        f"Unpinned {len(report.unpinned)} pin(s) "
+        f"({len(report.not_pinned)} already gone, {len(report.failed)} failed)."
+    )
+    for content_hash, error in report.failed.items():
+        click.echo(f"Failed to unpin {content_hash}: {error}", err=True)
@@ -1,19 +1,20 @@
-from ape import project
+import click
 
-from ._utils import get_account, get_poofpoof_address, get_token_receivers
+from sdk import sdk
 
 
 def mint():
-    account = get_account(prompt="Select an account to use")
-    contract_address = get_poofpoof_address()
-    contract = project.PoofPoof.at(contract_address)
+    account = sdk.get_account(prompt="Select an account to use")
+    contract = sdk.get_poofpoof_contract()
 
-    # receivers = get_token_receivers()
-    receivers = ["0xE3747e6341E0d3430e6Ea9e2346cdDCc2F8a4b5b"]
-    token_id = 0
-    for receiver in receivers:
-        contract.safeMint(receiver, f"{token_id}.json", sender=account)
-        token_id += 1
+    # Receivers stream from the snapshot as each batch is minted.
+    receivers = sdk.get_token_receivers()
+    receipts = sdk.batch_mint(contract, receivers, sender=account)
+    click.echo(
+        f"Minted to {receivers.rows - receivers.invalid - receivers.duplicates} receiver(s) "
+        f"in {len(receipts)} transaction(s); skipped {receivers.invalid} invalid and "
+        f"{receivers.duplicates} duplicate row(s)."
+    )
 
 
 def main():
@@ -1,5 +1,16 @@
-from ._utils import pin_everything
+import click
+
+from sdk import sdk
+
+
+def _echo_progress(progress):
+    eta = f"{progress.eta:.0f}s" if progress.eta is not None else "?"
+    click.echo(
+        f"\rPinned {progress.completed}/{progress.total} ({progress.failed} failed, ETA {eta})",
+        nl=False,
+    )
 
 
 def main():
-    pin_everything()
+    sdk.pin_artwork(on_progress=_echo_progress)
+    click.echo()
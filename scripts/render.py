@@ -0,0 +1,15 @@
+import click
+
+from sdk import sdk
+
+NUMBER_OF_TOKENS = 1000
+SEED = 0
+
+
+def main():
+    tokens = sdk.render_artwork(NUMBER_OF_TOKENS, seed=SEED)
+    cached = sum(token.cached for token in tokens)
+    click.echo(
+        f"Rendered {len(tokens) - cached} artwork file(s) into '{sdk.artwork_path}' "
+        f"({cached} unchanged)."
+    )
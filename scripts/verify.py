@@ -0,0 +1,22 @@
+import click
+
+from sdk import sdk
+
+
+def verify():
+    report = sdk.verify_pins()
+    click.echo(f"Verified {report.verified} pin(s).")
+    for label, paths in (
+        ("No longer pinned", report.missing),
+        ("Deleted locally", report.deleted),
+        ("Changed locally", report.changed),
+    ):
+        for path in paths:
+            click.echo(f"{label}: {path}", err=True)
+
+    if not report.ok:
+        raise click.ClickException("Pin state is out of date; rerun 'ape run pin' to repin.")
+
+
+def main():
+    verify()
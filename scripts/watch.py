@@ -0,0 +1,12 @@
+import click
+
+from sdk import sdk
+
+
+def _echo_pinned(path, content_hash):
+    click.echo(f"Pinned '{path}' ({content_hash}).")
+
+
+def main():
+    click.echo(f"Watching '{sdk.artwork_path}'. Press Ctrl+C to stop.")
+    sdk.watch_artwork(on_pinned=_echo_pinned)
@@ -1,77 +1,317 @@
-from typing import Iterator, List, Optional
-
+import itertools
 from pathlib import Path
-import click
-from nft_project import NFTProject
-from pinata import create_pinata
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .minting import DEFAULT_BLOCK_GAS_FILL, BatchGasEstimate, iter_batches, max_batch_size
+
+# NOTE: ape, click, keyring and pydantic are slow to import, so they are imported
+#  where they are first needed. This keeps 'ape run' and 'ape console' fast.
+if TYPE_CHECKING:
+    from ape.api import AccountAPI, ReceiptAPI
+    from ape.contracts import ContractInstance
+    from ape.types import AddressType
+    from nft_project import NFTProject
+    from nft_project.generative import RenderedToken
+    from nft_project.journal import Progress
+    from nft_project.models import PinStateReport
+    from nft_project.pipeline import StageStats
+    from pinata import Pinata
+    from pinata.records import UnpinReport
 
-from ape import accounts, config, networks
-from ape.api import AccountAPI
-from ape.cli import get_user_selected_account
-from ape.types import AddressType
-from ape.utils import cached_property
-from ape_accounts import KeyfileAccount
+    from .receivers import ReceiverSource
 
 
 class PoofPoofPass:
-    def __init__(self, name: str = "poofpoof", artwork_path: Path = Path("artwork")) -> None:
+    def __init__(
+        self,
+        name: str = "poofpoof",
+        artwork_path: Path = Path("artwork"),
+        max_workers: int = 8,
+        build_path: Path = Path(".build"),
+        receivers_path: Path = Path("receivers.csv"),
+    ) -> None:
         self.name = name
-        self.pinata = create_pinata(self.name)
-        self.nft_project = NFTProject(self.name, self.pinata)
         self.artwork_path = artwork_path
+        self.receivers_path = receivers_path
+        self.build_path = build_path  # Pin state, manifests and job journals go here.
+        self.max_workers = max_workers
+        self.pipeline_stats: Dict[str, "StageStats"] = {}
+        # Created when first used.
+        self._pinata: Optional["Pinata"] = None
+        self._nft_project: Optional["NFTProject"] = None
+        self._metadata_cid: Optional[str] = None
+
+    @property
+    def pinata(self) -> "Pinata":
+        if self._pinata is None:
+            from pinata import create_pinata
+
+            self._pinata = create_pinata(self.name)
+
+        return self._pinata
+
+    @pinata.setter
+    def pinata(self, pinata: "Pinata"):
+        self._pinata = pinata
+        self._nft_project = None
+
+    @property
+    def nft_project(self) -> "NFTProject":
+        if self._nft_project is None:
+            from nft_project import NFTProject
+
+            self._nft_project = NFTProject(
+                self.name,
+                self.pinata,
+                manifest_path=self.build_path / f"{self.name}-metadata-manifest.json",
+                state_path=self.build_path / f"{self.name}-pins.sqlite",
+                journal_directory=self.build_path / "jobs",
+            )
+
+        return self._nft_project
 
     @property
     def network_name(self) -> str:
+        from ape import networks
+
         return networks.provider.network.name
 
     @property
     def artwork_file_paths(self) -> List[Path]:
         return [a for a in self.artwork_path.iterdir()]
 
-    @cached_property
+    @property
     def metadata_cid(self) -> str:
         """
         Return existing metadata CID for folder. If folder not
-        yet pinned, will pin it. Additionally, if any artwork is
-        not pinned, it will pin those now as well.
+        yet pinned, or the metadata changed since it was last
+        published, will pin it. Additionally, if any artwork is
+        not pinned, it will pin those now as well. Each artwork's
+        metadata is rendered as soon as its upload finishes; see
+        :attr:`pipeline_stats` for the throughput of each stage.
 
         Returns:
             str: The CID of the metadata JSONs folder.
         """
-        content_hash_map = self.nft_project.pin_artwork(self.artwork_path)
-        content_hashes = [f"ipfs://{cid}" for _, cid in content_hash_map.items()]
-        nft_metadata_list = self.nft_project.create_nft_data(content_hashes)
-        folder_cid = self.nft_project.pin_metadata(nft_metadata_list)
-        folder_cid = f"ipfs://{folder_cid}/"
-        return folder_cid
+        if self._metadata_cid is None:
+            from nft_project.pipeline import MetadataPipeline
+
+            pipeline = MetadataPipeline(self.nft_project)
+            result = pipeline.run(
+                self.artwork_path, max_workers=self.max_workers, job_id=self.artwork_job_id
+            )
+            self.pipeline_stats = result.stages
+            self._metadata_cid = f"ipfs://{result.cid}/"
+
+        return self._metadata_cid
+
+    @property
+    def artwork_job_id(self) -> str:
+        # Artwork uploads are journaled under this ID, so interrupted runs resume.
+        return f"{self.name}-artwork"
+
+    def pin_artwork(self, on_progress: Optional[Callable[["Progress"], None]] = None) -> Dict:
+        """
+        Pin any artwork that is not pinned yet, resuming an interrupted run.
+
+        Args:
+            on_progress (Optional[Callable]): Called with the progress after each file.
+
+        Returns:
+            Dict: Artwork file names to content hashes.
+        """
+
+        return self.nft_project.pin_artwork(
+            self.artwork_path,
+            max_workers=self.max_workers,
+            job_id=self.artwork_job_id,
+            on_progress=on_progress,
+        )
+
+    def watch_artwork(
+        self, on_pinned: Optional[Callable[[Path, str], None]] = None, debounce: float = 2.0
+    ):
+        """
+        Pin the artwork, then keep pinning new or changed files as they land in the
+        artwork directory, until interrupted.
+
+        Args:
+            on_pinned (Optional[Callable]): Called with each file's path and content
+              hash once it is pinned.
+            debounce (float): Seconds a file must stay unchanged before it is pinned.
+        """
+
+        watcher = self.nft_project.watch_artwork(
+            self.artwork_path,
+            max_workers=self.max_workers,
+            debounce=debounce,
+            on_pinned=on_pinned,
+        )
+        watcher.run()
+
+    def render_artwork(
+        self, count: int, seed: int = 0, template_path: Path = Path("base.svg")
+    ) -> List["RenderedToken"]:
+        """
+        Render ``count`` generative variants of the ``base.svg`` template into the
+        artwork directory, across a process pool. Combinations are chosen by
+        ``seed``, and variants rendered by an earlier run are not rendered again.
+
+        Args:
+            count (int): The number of tokens.
+            seed (int): Chooses the trait combinations.
+            template_path (Path): The SVG template.
+
+        Returns:
+            List[RenderedToken]: Each token's artwork path and attributes.
+        """
+        from nft_project.generative import GenerativeRenderer
+
+        from .traits import POOFPOOF_TRAITS
+
+        renderer = GenerativeRenderer(
+            template_path,
+            POOFPOOF_TRAITS,
+            output_path=self.artwork_path,
+            manifest_path=self.build_path / f"{self.name}-render-manifest.json",
+        )
+        return renderer.render(count, seed=seed)
+
+    def verify_pins(self) -> "PinStateReport":
+        """
+        Reconcile the local pin state database with Pinata.
+        """
+
+        return self.nft_project.verify_pins()
+
+    def get_account(self, prompt: Optional[str] = None) -> "AccountAPI":
+        from ape import accounts
+        from ape.cli import get_user_selected_account
+        from ape_accounts import KeyfileAccount
 
-    def get_account(self, prompt: Optional[str] = None) -> AccountAPI:
         prompt = prompt or "Select an account"
         if self.network_name == "local":
             return accounts.test_accounts[0]
 
         return get_user_selected_account(cls=KeyfileAccount, prompt_message=prompt)
 
-    def get_poofpoof_address(self) -> Optional[AddressType]:
+    def get_poofpoof_address(self) -> Optional["AddressType"]:
+        import click
+        from ape import config
+
         network_deployments = config.deployments["ethereum"].get(self.network_name) or []
         if network_deployments:
             return [d for d in network_deployments if d["contract_type"] == "PoofPoof"][0]["address"]
         else:
             click.echo(f"No address for network '{self.network_name}'.", err=True)
 
-    def get_token_receivers(self, token_id: int) -> Iterator[str]:
-        # TODO: Figure out how to populate token receivers list.
-        _ = token_id
-        receivers = {"lester": "0x4e3b9a9f52d66E62f596A7b8A258Aff9AeeB15C2"}
-        yield from receivers.values()
-    
-    def clean_pins(self):
-        directory_pin = sdk.pinata.get_hash(self.name)
-        image_pins = [self.pinata.get_hash(a.name) for a in self.artwork_file_paths]
-        self.pinata.unpin(directory_pin, ignore_errors=True)
-        for pin in image_pins:
-            self.pinata.unpin(pin, ignore_errors=True)
+    def get_poofpoof_contract(self) -> "ContractInstance":
+        from ape import project
+
+        return project.PoofPoof.at(self.get_poofpoof_address())
+
+    def batch_mint(
+        self,
+        contract: "ContractInstance",
+        receivers: Iterable[str],
+        sender: "AccountAPI",
+        batch_size: Optional[int] = None,
+        block_gas_fill: float = DEFAULT_BLOCK_GAS_FILL,
+    ) -> List["ReceiptAPI"]:
+        """
+        Mint one token per receiver using ``batchMint``, with as many receivers per
+        transaction as fit under a fraction of the block gas limit.
+
+        Args:
+            contract (ContractInstance): The deployed PoofPoof contract.
+            receivers (Iterable[str]): The receiver addresses, in token ID order. They
+              are consumed one batch at a time, so this can be a generator, such as
+              :meth:`get_token_receivers`.
+            sender (AccountAPI): The contract owner.
+            batch_size (Optional[int]): The number of receivers per transaction.
+              Defaults to the largest size estimated to fit.
+            block_gas_fill (float): The fraction of the block gas limit to use per
+              transaction when estimating the batch size.
+
+        Returns:
+            List[ReceiptAPI]: One receipt per transaction.
+        """
+
+        receivers = iter(receivers)
+        probe = list(itertools.islice(receivers, 2))
+        if not probe:
+            return []
+
+        if batch_size is None:
+            from ape import chain
+
+            estimate = self.estimate_batch_mint_gas(contract, probe, sender)
+            gas_limit = chain.blocks.head.gas_limit
+            batch_size = max_batch_size(estimate, gas_limit, fill=block_gas_fill)
+
+        return [
+            contract.batchMint(batch, sender=sender)
+            for batch in iter_batches(itertools.chain(probe, receivers), batch_size)
+        ]
+
+    def estimate_batch_mint_gas(
+        self, contract: "ContractInstance", receivers: Sequence[str], sender: "AccountAPI"
+    ) -> BatchGasEstimate:
+        probe = list(receivers[:2]) if len(receivers) > 1 else [receivers[0]] * 2
+        one = contract.batchMint.estimate_gas_cost(probe[:1], sender=sender)
+        two = contract.batchMint.estimate_gas_cost(probe, sender=sender)
+        return BatchGasEstimate.from_probes(one, two)
+
+    def get_token_receivers(
+        self, path: Optional[Path] = None, column: str = "address"
+    ) -> "ReceiverSource":
+        """
+        Stream the receivers, in token ID order, from a CSV or JSON-lines snapshot.
+        Addresses are validated, checksummed and deduplicated as they are read.
+
+        Args:
+            path (Optional[Path]): The snapshot. Defaults to :attr:`receivers_path`.
+            column (str): The CSV column or JSON field holding the address.
+
+        Returns:
+            :class:`~sdk.receivers.ReceiverSource`: Iterate over it for the addresses;
+            it counts the rows, invalid rows and duplicates as it goes.
+        """
+        from .receivers import ReceiverSource
+
+        return ReceiverSource(path or self.receivers_path, column=column)
+
+    def clean_pins(self) -> "UnpinReport":
+        """
+        Unpin the metadata folder and every artwork file, resolving them from a
+        single listing and unpinning concurrently. When every unpin succeeds, the
+        local pin state, artwork journal and metadata manifest are dropped too, so
+        that the next run pins everything again.
+        """
+
+        from nft_project.project import get_artwork_paths
+
+        # Artwork in subdirectories is pinned too, so list it the same way.
+        artwork_paths = get_artwork_paths(self.artwork_path)
+        names = [self.name, *(a.name for a in artwork_paths)]
+        report = self.pinata.unpin_names(names, max_workers=self.max_workers)
+        if report.ok:
+            self.nft_project.forget_pins(job_id=self.artwork_job_id)
+            self._metadata_cid = None
+
+        return report
+
+
+_sdk: Optional[PoofPoofPass] = None
+
 
+def __getattr__(name: str):
+    # The 'sdk' singleton is created on first access.
+    if name == "sdk":
+        global _sdk
+        if _sdk is None:
+            _sdk = PoofPoofPass()
 
+        return _sdk
 
-sdk = PoofPoofPass()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,48 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# Use at most this fraction of the block gas limit per transaction, leaving room
+# for estimation error and other transactions.
+DEFAULT_BLOCK_GAS_FILL = 0.5
+
+
+class BatchGasEstimate(NamedTuple):
+    base: int  # Gas of a batch transaction with no tokens.
+    per_token: int  # Additional gas per minted token.
+
+    @classmethod
+    def from_probes(cls, one: int, two: int) -> "BatchGasEstimate":
+        """
+        Derive the estimate from the gas estimates of minting one and two tokens.
+        """
+
+        per_token = max(1, two - one)
+        return cls(base=max(0, one - per_token), per_token=per_token)
+
+
+def max_batch_size(
+    estimate: BatchGasEstimate, block_gas_limit: int, fill: float = DEFAULT_BLOCK_GAS_FILL
+) -> int:
+    """
+    The largest number of tokens one batch transaction can mint while staying
+    under ``fill`` of the block gas limit.
+    """
+
+    budget = int(block_gas_limit * fill) - estimate.base
+    return max(1, budget // estimate.per_token)
+
+
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    # Items are consumed lazily, so generators are never held in memory whole.
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+
+        yield batch
+
+
+__all__ = ["BatchGasEstimate", "iter_batches", "max_batch_size"]
@@ -1,5 +1,28 @@
-from .interfaces import IPinning
-from .models import NFT, Pin
-from .project import NFTProject
+import importlib
 
-__all__ = ["NFT", "Pin", "IPinning", "Project"]
+# Submodules are imported on first use, so that importing the package does not
+# pull in pydantic until a model is actually needed.
+_EXPORTS = {
+    "IAsyncPinning": "interfaces",
+    "IPinning": "interfaces",
+    "NFT": "models",
+    "NFTCollection": "collection",
+    "NFTProject": "project",
+    "Pin": "models",
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = ["IAsyncPinning", "IPinning", "NFT", "NFTCollection", "NFTProject", "Pin"]
@@ -0,0 +1,231 @@
+"""
+Compute IPFS content identifiers (CIDs) locally, the same way ``ipfs add`` (and
+therefore Pinata) does with its default settings: fixed-size 256 KiB chunks,
+balanced UnixFS DAG-PB trees with at most 174 links per node, and sha2-256
+multihashes. CIDv0 uses DAG-PB leaves; CIDv1 uses raw leaves by default.
+"""
+
+import base64
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+MAX_LINKS = 174
+
+_SHA2_256 = 0x12
+_DAG_PB = 0x70
+_RAW = 0x55
+
+_UNIXFS_DIRECTORY = 1
+_UNIXFS_FILE = 2
+
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+Content = Union[Path, bytes]
+
+
+class _Node(NamedTuple):
+    cid: bytes  # Binary CID, as stored in DAG-PB links.
+    tsize: int  # Size of the block plus the blocks it links to.
+    file_size: int  # Size of the file data under this node.
+
+
+def compute_cid(content: Content, version: int = 0) -> str:
+    """
+    Compute the CID of a file, a directory, or in-memory file content.
+
+    Args:
+        content (Union[pathlib.Path, bytes]): A path to a file or directory,
+          or the bytes of a file.
+        version (int): The CID version, ``0`` (``Qm...``) or ``1`` (``bafy...``).
+
+    Returns:
+        str: The CID string.
+    """
+
+    if isinstance(content, Path) and content.is_dir():
+        return directory_cid(_iter_directory(content), version=version)
+
+    return _encode_cid(_file_node(content, version), version)
+
+
+def directory_cid(entries: Iterable[Tuple[str, Content]], version: int = 0) -> str:
+    """
+    Compute the CID of a directory made of the given entries, without needing the
+    directory to exist on disk.
+
+    Args:
+        entries (Iterable[Tuple[str, Content]]): Pairs of relative file paths, such as
+          ``"0.json"`` or ``"sub/0.json"``, and file contents (paths or bytes).
+        version (int): The CID version.
+
+    Returns:
+        str: The CID string.
+    """
+
+    tree: Dict = {}
+    for name, content in entries:
+        *parents, file_name = name.split("/")
+        subtree = tree
+        for parent in parents:
+            subtree = subtree.setdefault(parent, {})
+
+        subtree[file_name] = content
+
+    return _encode_cid(_directory_node(tree, version), version)
+
+
+def _file_node(content: Content, version: int) -> _Node:
+    raw_leaves = version == 1
+    if isinstance(content, Path):
+        with open(content, "rb") as file:
+            leaves = [_leaf_node(chunk, version, raw_leaves) for chunk in _read_chunks(file)]
+    else:
+        chunks = range(0, len(content), DEFAULT_CHUNK_SIZE)
+        leaves = [
+            _leaf_node(content[i : i + DEFAULT_CHUNK_SIZE], version, raw_leaves) for i in chunks
+        ]
+
+    if not leaves:
+        return _leaf_node(b"", version, raw_leaves)
+
+    # Build the balanced tree bottom-up, packing each level from the left.
+    while len(leaves) > 1:
+        leaves = [
+            _file_parent_node(leaves[i : i + MAX_LINKS], version)
+            for i in range(0, len(leaves), MAX_LINKS)
+        ]
+
+    return leaves[0]
+
+
+def _leaf_node(chunk: bytes, version: int, raw: bool) -> _Node:
+    if raw:
+        return _Node(_cid_bytes(chunk, version, _RAW), len(chunk), len(chunk))
+
+    block = _pb_node([], _unixfs_data(_UNIXFS_FILE, data=chunk, file_size=len(chunk)))
+    return _Node(_cid_bytes(block, version, _DAG_PB), len(block), len(chunk))
+
+
+def _file_parent_node(children: List[_Node], version: int) -> _Node:
+    file_size = sum(c.file_size for c in children)
+    data = _unixfs_data(
+        _UNIXFS_FILE, file_size=file_size, block_sizes=[c.file_size for c in children]
+    )
+    block = _pb_node([(c.cid, "", c.tsize) for c in children], data)
+    tsize = len(block) + sum(c.tsize for c in children)
+    return _Node(_cid_bytes(block, version, _DAG_PB), tsize, file_size)
+
+
+def _directory_node(tree: Dict, version: int) -> _Node:
+    links = []
+    for name in sorted(tree, key=lambda n: n.encode()):
+        entry = tree[name]
+        child = (
+            _directory_node(entry, version)
+            if isinstance(entry, dict)
+            else _file_node(entry, version)
+        )
+        links.append((child.cid, name, child.tsize))
+
+    block = _pb_node(links, _unixfs_data(_UNIXFS_DIRECTORY))
+    tsize = len(block) + sum(link[2] for link in links)
+    return _Node(_cid_bytes(block, version, _DAG_PB), tsize, 0)
+
+
+def _iter_directory(directory: Path) -> Iterator[Tuple[str, Path]]:
+    for path in directory.rglob("*"):
+        if path.is_file():
+            yield path.relative_to(directory).as_posix(), path
+
+
+def _read_chunks(file: BinaryIO) -> Iterator[bytes]:
+    return iter(lambda: file.read(DEFAULT_CHUNK_SIZE), b"")
+
+
+def _unixfs_data(
+    data_type: int,
+    data: bytes = b"",
+    file_size: Optional[int] = None,
+    block_sizes: Optional[List[int]] = None,
+) -> bytes:
+    message = _field(1, 0) + _varint(data_type)
+    if data:
+        message += _field(2, 2) + _varint(len(data)) + data
+    if file_size is not None:
+        message += _field(3, 0) + _varint(file_size)
+    for block_size in block_sizes or []:
+        message += _field(4, 0) + _varint(block_size)
+
+    return message
+
+
+def _pb_node(links: List[Tuple[bytes, str, int]], data: bytes) -> bytes:
+    # DAG-PB requires links to be encoded before data.
+    node = b""
+    for cid, name, tsize in links:
+        name_bytes = name.encode()
+        link = (
+            _field(1, 2)
+            + _varint(len(cid))
+            + cid
+            + _field(2, 2)
+            + _varint(len(name_bytes))
+            + name_bytes
+            + _field(3, 0)
+            + _varint(tsize)
+        )
+        node += _field(2, 2) + _varint(len(link)) + link
+
+    return node + _field(1, 2) + _varint(len(data)) + data
+
+
+def _cid_bytes(block: bytes, version: int, codec: int) -> bytes:
+    multihash = bytes([_SHA2_256, 32]) + hashlib.sha256(block).digest()
+    if version == 0:
+        if codec != _DAG_PB:
+            raise ValueError("CIDv0 only supports DAG-PB blocks.")
+
+        return multihash
+    elif version == 1:
+        return _varint(1) + _varint(codec) + multihash
+
+    raise ValueError(f"Unsupported CID version '{version}'.")
+
+
+def _encode_cid(node: _Node, version: int) -> str:
+    if version == 0:
+        return _base58(node.cid)
+
+    return "b" + base64.b32encode(node.cid).decode().lower().rstrip("=")
+
+
+def _base58(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = _BASE58_ALPHABET[remainder] + encoded
+
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return _BASE58_ALPHABET[0] * leading_zeros + encoded
+
+
+def _field(number: int, wire_type: int) -> bytes:
+    return _varint(number << 3 | wire_type)
+
+
+def _varint(value: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+__all__ = ["compute_cid", "directory_cid"]
@@ -0,0 +1,163 @@
+import json
+from json.encoder import encode_basestring_ascii  # type: ignore
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from nft_project.models import NFT
+
+CID_URI_PREFIX = "ipfs://"
+CID_URI_LENGTH = 53
+
+
+class InvalidCIDError(ValueError):
+    """
+    Raised when content hashes in a collection are not valid ``ipfs://`` URIs.
+    """
+
+    def __init__(self, invalid: List[Tuple[int, str]]):
+        examples = ", ".join(f"{i}: '{v}'" for i, v in invalid[:5])
+        more = f" (and {len(invalid) - 5} more)" if len(invalid) > 5 else ""
+        super().__init__(
+            f"Image CIDs must be '{CID_URI_PREFIX}' followed by an alphanumeric CID, "
+            f"{CID_URI_LENGTH} characters in total. Invalid: {examples}{more}."
+        )
+
+
+class NFTCollection:
+    """
+    A compact, column-oriented collection of NFTs. All image URIs are validated in
+    one pass and stored end-to-end in a single string, token IDs are generated
+    lazily from a range, and metadata JSON is rendered straight from the columns
+    without building a :class:`~nft_project.models.NFT` per token. Models are still
+    available on demand through :meth:`iter_nfts`.
+    """
+
+    __slots__ = ("_project_name", "_images", "_size", "_start_token_id", "_attributes")
+
+    def __init__(
+        self,
+        project_name: str,
+        images: Sequence[str],
+        start_token_id: int = 0,
+        attributes: Optional[Sequence[List]] = None,
+    ):
+        validate_image_cids(images)
+        if attributes is not None and len(attributes) != len(images):
+            raise ValueError("Attributes are required for every image, when given.")
+
+        self._project_name = project_name
+        self._images = "".join(images)
+        self._size = len(images)
+        self._start_token_id = start_token_id
+        self._attributes = attributes
+
+    def __len__(self) -> int:
+        return self._size
+
+    def token_ids(self) -> Iterator[int]:
+        """
+        Lazily generate the token IDs in the collection.
+        """
+
+        return iter(range(self._start_token_id, self._start_token_id + self._size))
+
+    def image(self, index: int) -> str:
+        """
+        Get the image URI at a position in the collection.
+
+        Args:
+            index (int): The position, starting at ``0``.
+
+        Returns:
+            str
+        """
+
+        start = index * CID_URI_LENGTH
+        return self._images[start : start + CID_URI_LENGTH]
+
+    def name(self, token_id: int) -> str:
+        return f"{self._project_name} Number {token_id}"
+
+    def iter_nfts(self) -> Iterator[NFT]:
+        """
+        Lazily create an :class:`~nft_project.models.NFT` model per token.
+
+        Returns:
+            Iterator[:class:`~nft_project.models.NFT`]
+        """
+
+        for index, token_id in enumerate(self.token_ids()):
+            yield NFT(
+                image=self.image(index),
+                tokenId=token_id,
+                name=self.name(token_id),
+                attributes=self._attributes[index] if self._attributes else [],
+            )
+
+    def iter_documents(self, file_name_pattern: str) -> Iterator[Tuple[int, str, bytes]]:
+        """
+        Lazily render each token's metadata JSON. The output is byte-for-byte the same
+        as ``json.dumps(nft.dict())`` for the equivalent model.
+
+        Args:
+            file_name_pattern (str): The metadata file name pattern, e.g. ``"{token_id}.json"``.
+
+        Returns:
+            Iterator[Tuple[int, str, bytes]]: Token IDs, file names, and JSON documents.
+        """
+
+        for index, token_id in enumerate(self.token_ids()):
+            document = render_metadata_document(
+                self.image(index),
+                token_id,
+                self.name(token_id),
+                self._attributes[index] if self._attributes else None,
+            )
+            yield token_id, file_name_pattern.format(token_id=token_id), document
+
+
+def render_metadata_document(
+    image: str, token_id: int, name: str, attributes: Optional[List] = None
+) -> bytes:
+    """
+    Render one token's metadata JSON, byte-for-byte the same as
+    ``json.dumps(nft.dict())`` for the equivalent model. The image URI must
+    already be validated.
+    """
+
+    attributes_json = json.dumps(attributes) if attributes else "[]"
+    document = (
+        f'{{"image": "{image}", "tokenId": {token_id}, '
+        f'"name": {encode_basestring_ascii(name)}, '
+        f'"attributes": {attributes_json}}}'
+    )
+    return document.encode()
+
+
+def validate_image_cids(images: Sequence[str]):
+    """
+    Validate every image URI at once, reporting all invalid entries together.
+
+    Args:
+        images (Sequence[str]): The ``ipfs://`` image URIs.
+
+    Raises:
+        :class:`~nft_project.collection.InvalidCIDError`
+    """
+
+    invalid = [
+        (i, v)
+        for i, v in enumerate(images)
+        if len(v) != CID_URI_LENGTH
+        or not v.startswith(CID_URI_PREFIX)
+        or not (v.isascii() and v[len(CID_URI_PREFIX) :].isalnum())
+    ]
+    if invalid:
+        raise InvalidCIDError(invalid)
+
+
+__all__ = [
+    "InvalidCIDError",
+    "NFTCollection",
+    "render_metadata_document",
+    "validate_image_cids",
+]
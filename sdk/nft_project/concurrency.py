@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+R = TypeVar("R")
+
+DEFAULT_MAX_THROTTLE_RETRIES = 8
+
+
+class AdaptiveWindow:
+    """
+    A concurrency window that halves when the remote service throttles and grows
+    back by one slot per success, up to ``max_size``. Callers block in
+    :meth:`acquire` while the window is full.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max(1, max_size)
+        self.size = self.max_size
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= self.size:
+                self._condition.wait()
+
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False):
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.size = max(1, self.size // 2)
+            elif self.size < self.max_size:
+                self.size += 1
+
+            self._condition.notify_all()
+
+
+def backoff_delay(attempt: int, base: float = 1.0) -> float:
+    """
+    An exponential backoff delay with jitter, so that throttled workers do not
+    all retry at the same moment.
+    """
+
+    return base * 2**attempt * random.uniform(0.5, 1.5)
+
+
+def run_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+    throttle_errors: Tuple[Type[Exception], ...] = (),
+    max_throttle_retries: int = DEFAULT_MAX_THROTTLE_RETRIES,
+    backoff: float = 1.0,
+    on_result: Optional[Callable[[T, R], None]] = None,
+) -> Tuple[Dict[T, R], Dict[T, Exception]]:
+    """
+    Call ``func`` on every item using a bounded worker pool. When a call raises one
+    of ``throttle_errors``, the window shrinks, the worker backs off and the item is
+    retried. Any other error is recorded for that item only.
+
+    Args:
+        func (Callable): The function to call per item.
+        items (Iterable): The items, in the order results should be returned.
+        max_in_flight (int): The maximum number of concurrent calls.
+        throttle_errors (Tuple[Type[Exception], ...]): Errors meaning "slow down".
+        max_throttle_retries (int): How many times to retry a throttled item.
+        backoff (float): The base number of seconds to back off after throttling.
+        on_result (Optional[Callable]): Called from the worker with each item and its
+          result as soon as the call succeeds, e.g. to stream results to a next stage.
+
+    Returns:
+        Tuple[Dict, Dict]: Results and errors, both keyed by item in input order.
+    """
+
+    items = list(items)
+    window = AdaptiveWindow(max_in_flight)
+
+    def call(item: T) -> R:
+        attempt = 0
+        while True:
+            window.acquire()
+            try:
+                result = func(item)
+            except throttle_errors:
+                window.release(throttled=True)
+                if attempt >= max_throttle_retries:
+                    raise
+
+                time.sleep(backoff_delay(attempt, backoff))
+                attempt += 1
+                continue
+            except BaseException:
+                window.release()
+                raise
+
+            window.release()
+            if on_result:
+                on_result(item, result)
+
+            return result
+
+    with ThreadPoolExecutor(max_workers=window.max_size) as executor:
+        futures = [(item, executor.submit(call, item)) for item in items]
+
+    results = {}
+    errors = {}
+    for item, future in futures:
+        error = future.exception()
+        if error is not None:
+            errors[item] = error
+        else:
+            results[item] = future.result()
+
+    return results, errors
+
+
+__all__ = ["AdaptiveWindow", "backoff_delay", "run_bounded"]
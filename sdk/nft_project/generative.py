@@ -0,0 +1,252 @@
+"""
+Generative artwork: render variants of an SVG template, one per combination of
+traits, straight into the artwork directory that
+:meth:`~nft_project.project.NFTProject.pin_artwork` consumes.
+
+Templates are edited as text rather than parsed, so that editor-specific markup
+and namespaces survive untouched. Each trait option can replace substrings of the
+template, such as a colour, and add layers under or over the artwork.
+"""
+
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import product
+from operator import mul
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+DEFAULT_OUTPUT_DIRECTORY = Path("artwork")
+DEFAULT_MANIFEST_DIRECTORY = Path(".build")
+
+# Up to this many combinations, all are listed and sampled without replacement.
+DENSE_COMBINATION_LIMIT = 1_000_000
+
+# Bump when rendering changes, so that cached files are rendered again.
+RENDERER_VERSION = 1
+
+Combination = Tuple[int, ...]  # The index of the chosen option, per trait.
+
+
+class TraitOption(NamedTuple):
+    value: str  # The attribute value shown in the token metadata.
+    replacements: Tuple[Tuple[str, str], ...] = ()  # (old, new) substrings of the template.
+    underlay: str = ""  # SVG drawn under the artwork.
+    overlay: str = ""  # SVG drawn over the artwork.
+    weight: float = 1.0  # Relative frequency.
+
+
+class Trait(NamedTuple):
+    name: str
+    options: Tuple[TraitOption, ...]
+
+
+class RenderedToken(NamedTuple):
+    token_id: int
+    path: Path
+    attributes: List[Dict[str, str]]
+    cached: bool  # Whether an up-to-date file already existed.
+
+
+def enumerate_combinations(traits: Sequence[Trait], count: int, seed: int = 0) -> List[Combination]:
+    """
+    Choose ``count`` distinct trait combinations, weighted by option weights. The
+    same traits and seed always give the same combinations in the same order, and a
+    larger count only adds combinations at the end.
+
+    Raises:
+        ValueError: When there are fewer than ``count`` distinct combinations.
+    """
+
+    total = _product(len(trait.options) for trait in traits)
+    if count > total:
+        raise ValueError(f"Only {total} distinct trait combinations; {count} requested.")
+
+    rng = random.Random(seed)
+    if total <= DENSE_COMBINATION_LIMIT:
+        # Weighted sampling without replacement over every combination.
+        def key(combination: Combination) -> float:
+            weight = _product(trait.options[i].weight for trait, i in zip(traits, combination))
+            return rng.random() ** (1 / weight)
+
+        everything = product(*(range(len(trait.options)) for trait in traits))
+        return sorted(everything, key=key, reverse=True)[:count]
+
+    # Too many to list: draw each trait independently and skip repeats.
+    weights = [[option.weight for option in trait.options] for trait in traits]
+    indices = [range(len(trait.options)) for trait in traits]
+    chosen: List[Combination] = []
+    seen: Set[Combination] = set()
+    while len(chosen) < count:
+        combination = tuple(rng.choices(i, w)[0] for i, w in zip(indices, weights))
+        if combination not in seen:
+            seen.add(combination)
+            chosen.append(combination)
+
+    return chosen
+
+
+def _product(values: Iterable[float]) -> float:
+    # 'math.prod()' needs Python 3.8.
+    return reduce(mul, values, 1)
+
+
+def render_svg(template: str, traits: Sequence[Trait], combination: Combination) -> str:
+    options = [trait.options[i] for trait, i in zip(traits, combination)]
+    svg = template
+    for option in options:
+        for old, new in option.replacements:
+            svg = svg.replace(old, new)
+
+    # Underlays go right after the opening <svg> tag, overlays right before its end.
+    start = svg.index(">", svg.index("<svg")) + 1
+    end = svg.rindex("</svg>")
+    underlay = "".join(option.underlay for option in options)
+    overlay = "".join(option.overlay for option in options)
+    return svg[:start] + underlay + svg[start:end] + overlay + svg[end:]
+
+
+def _cache_key(template_digest: str, traits: Sequence[Trait], combination: Combination) -> str:
+    options = [trait.options[i] for trait, i in zip(traits, combination)]
+    return hashlib.sha256(f"{template_digest}\0{options!r}".encode()).hexdigest()
+
+
+# Set in each worker process once, instead of pickling the template for every task.
+_worker_template = ""
+_worker_traits: Sequence[Trait] = ()
+
+
+def _init_worker(template: str, traits: Sequence[Trait]):
+    global _worker_template, _worker_traits
+    _worker_template = template
+    _worker_traits = traits
+
+
+def _render_file(job: Tuple[Path, Combination]):
+    path, combination = job
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(render_svg(_worker_template, _worker_traits, combination))
+    os.replace(temp_path, path)
+
+
+class GenerativeRenderer:
+    """
+    Renders token artwork from an SVG template across a process pool. Files are
+    named by zero-padded token ID, so that sorting them, as ``pin_artwork`` does,
+    keeps token order. A manifest records the cache key of each file: files whose
+    template and trait options are unchanged are not rendered again, and files from
+    a previous, larger run are removed.
+
+    Args:
+        template_path (Union[str, Path]): The SVG template.
+        traits (Sequence[:class:`~nft_project.generative.Trait`]): The traits.
+        output_path (Union[str, Path]): The artwork directory to write into.
+        manifest_path (Optional[Union[str, Path]]): The render cache manifest.
+        max_workers (Optional[int]): The number of processes. Defaults to the CPU count.
+    """
+
+    def __init__(
+        self,
+        template_path: Union[str, Path],
+        traits: Sequence[Trait],
+        output_path: Union[str, Path] = DEFAULT_OUTPUT_DIRECTORY,
+        manifest_path: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.template_path = Path(template_path)
+        self.traits = list(traits)
+        self.output_path = Path(output_path)
+        self.manifest_path = Path(
+            manifest_path
+            or DEFAULT_MANIFEST_DIRECTORY / f"{self.template_path.stem}-render-manifest.json"
+        )
+        self.max_workers = max_workers
+
+    def render(self, count: int, seed: int = 0) -> List[RenderedToken]:
+        """
+        Render ``count`` tokens with trait combinations chosen by ``seed``.
+
+        Returns:
+            List[:class:`~nft_project.generative.RenderedToken`]: In token ID order.
+        """
+
+        template = self.template_path.read_text()
+        template_digest = hashlib.sha256(f"{RENDERER_VERSION}\0{template}".encode()).hexdigest()
+        combinations = enumerate_combinations(self.traits, count, seed=seed)
+        width = len(str(max(count - 1, 0)))
+        previous = self._load_manifest()
+        previous_names = {entry["token_id"]: name for name, entry in previous.items()}
+        manifest: Dict[str, Dict] = {}
+        tokens = []
+        jobs = []
+        renames = []
+        for token_id, combination in enumerate(combinations):
+            path = self.output_path / f"{token_id:0{width}d}.svg"
+            key = _cache_key(template_digest, self.traits, combination)
+            attributes = [
+                {"trait_type": trait.name, "value": trait.options[i].value}
+                for trait, i in zip(self.traits, combination)
+            ]
+            # The file may have a different name if the number of digits changed.
+            previous_path = self.output_path / previous_names.get(token_id, path.name)
+            cached = previous.get(previous_path.name, {}).get("key") == key
+            cached = cached and previous_path.is_file()
+            if not cached:
+                jobs.append((path, combination))
+            elif previous_path != path:
+                renames.append((previous_path, path))
+
+            manifest[path.name] = {"token_id": token_id, "key": key, "attributes": attributes}
+            tokens.append(RenderedToken(token_id, path, attributes, cached))
+
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        # Move through temporary names, since new names can clash with old ones.
+        moved = [(old, old.with_name(f".{old.name}.moving")) for old, _ in renames]
+        for old, temp in moved:
+            os.replace(old, temp)
+
+        for (_, temp), (_, new) in zip(moved, renames):
+            os.replace(temp, new)
+
+        if jobs:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(template, self.traits),
+            ) as executor:
+                chunksize = max(1, len(jobs) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                list(executor.map(_render_file, jobs, chunksize=chunksize))
+
+        renamed = {old.name for old, _ in renames}
+        for name in set(previous) - set(manifest) - renamed:
+            stale_path = self.output_path / name
+            if stale_path.is_file():
+                stale_path.unlink()
+
+        self._save_manifest(manifest)
+        return tokens
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not self.manifest_path.is_file():
+            return {}
+
+        return json.loads(self.manifest_path.read_text()).get("files", {})
+
+    def _save_manifest(self, files: Dict[str, Dict]):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"version": RENDERER_VERSION, "files": files}))
+        temp_path.replace(self.manifest_path)
+
+
+__all__ = [
+    "GenerativeRenderer",
+    "RenderedToken",
+    "Trait",
+    "TraitOption",
+    "enumerate_combinations",
+    "render_svg",
+]
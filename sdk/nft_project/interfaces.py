@@ -1,6 +1,7 @@
+import tempfile
 from abc import abstractmethod
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Type
 
 from nft_project.models import Pin
 
@@ -11,6 +12,11 @@ class IPinning:
     work with a :class:`~nft_project.project.NFTProject`.
     """
 
+    # Errors that mean the pinning service is throttling us and the call should be
+    # retried more slowly rather than failed. Leave empty when the client retries
+    # throttled requests itself, so that they are not retried twice.
+    throttle_errors: Tuple[Type[Exception], ...] = ()
+
     @abstractmethod
     def get_pins(self) -> List[Pin]:
         ...
@@ -20,10 +26,83 @@ class IPinning:
     def get_hash(self, file_name: str):
         ...
 
+    def get_pin(self, content_hash: str) -> Optional[Pin]:
+        """
+        Get the pin for the given content hash, if it is pinned. Implementations
+        should override this when they can look up a hash more cheaply.
+        """
+
+        for pin in self.get_pins():
+            if pin.content_hash == content_hash:
+                return pin
+
+        return None
+
     @abstractmethod
     def pin_file(self, file_path: Path) -> str:
         ...
 
+    def pin_directory(self, directory_name: str, files: Sequence[Tuple[str, bytes]]) -> str:
+        """
+        Pin a directory made of in-memory files. Implementations should override
+        this to upload the files directly; by default, they are written to a
+        temporary directory which is then pinned with :meth:`pin_file`.
+
+        Args:
+            directory_name (str): The name of the directory.
+            files (Sequence[Tuple[str, bytes]]): Pairs of relative file paths and contents.
+
+        Returns:
+            str: The content hash of the directory.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / directory_name
+            for file_name, content in files:
+                file_path = directory / file_name
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_bytes(content)
+
+            return self.pin_file(directory)
+
     @abstractmethod
     def unpin(self, ipfs_hash: str):
         ...
+
+
+class IAsyncPinning:
+    """
+    The ``asyncio`` version of :class:`~nft_project.interfaces.IPinning`.
+    Classes that implement this interface can be driven concurrently by
+    :meth:`~nft_project.project.NFTProject.pin_artwork_async`.
+    """
+
+    throttle_errors: Tuple[Type[Exception], ...] = ()
+
+    @abstractmethod
+    async def get_pins(self) -> List[Pin]:
+        ...
+
+    @abstractmethod
+    async def get_hash(self, file_name: str):
+        ...
+
+    async def get_pin(self, content_hash: str) -> Optional[Pin]:
+        """
+        Like :meth:`IPinning.get_pin`. Implementations should override this when
+        they can look up a hash more cheaply.
+        """
+
+        for pin in await self.get_pins():
+            if pin.content_hash == content_hash:
+                return pin
+
+        return None
+
+    @abstractmethod
+    async def pin_file(self, file_path: Path) -> str:
+        ...
+
+    @abstractmethod
+    async def unpin(self, ipfs_hash: str):
+        ...
@@ -0,0 +1,152 @@
+"""
+Append-only journals of completed pin results, so interrupted bulk pin jobs can be
+resumed without asking the pinning service about work that already finished.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional, Union
+
+DEFAULT_JOURNAL_DIRECTORY = Path(".build") / "jobs"
+
+
+class JournalEntry(NamedTuple):
+    cid: str
+    size: int
+    mtime_ns: int
+
+
+class PinJournal:
+    """
+    A JSON-lines file of ``{"path", "cid", "size", "mtime_ns"}`` records, one per
+    pinned file, appended as each file completes. A line cut short by a crash is
+    ignored when the journal is loaded.
+
+    Args:
+        path (Union[str, pathlib.Path]): The journal file. Created on first write.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_job(
+        cls, job_id: str, directory: Union[str, Path] = DEFAULT_JOURNAL_DIRECTORY
+    ) -> "PinJournal":
+        return cls(Path(directory) / f"{job_id}.jsonl")
+
+    def load(self) -> Dict[str, JournalEntry]:
+        """
+        Get the completed results by path. Later records win.
+        """
+
+        if not self.path.is_file():
+            return {}
+
+        entries = {}
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    entries[record["path"]] = JournalEntry(
+                        record["cid"], record["size"], record["mtime_ns"]
+                    )
+                except (ValueError, KeyError):
+                    continue
+
+        return entries
+
+    def record(self, path: Path, cid: str):
+        stat = path.stat()
+        line = json.dumps(
+            {"path": str(path), "cid": cid, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as file:
+                file.write(line + "\n")
+
+    def is_current(self, path: Path, entry: JournalEntry) -> bool:
+        """
+        Whether the file is unchanged since it was journaled.
+        """
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+
+        return entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns
+
+    def delete(self):
+        with self._lock:
+            if self.path.is_file():
+                os.remove(self.path)
+
+
+class Progress(NamedTuple):
+    completed: int  # Includes files resumed from a journal or already known.
+    failed: int
+    total: int
+    elapsed: float  # Seconds.
+    eta: Optional[float]  # Estimated seconds remaining; None until there is a rate.
+
+    @property
+    def fraction(self) -> float:
+        return (self.completed + self.failed) / self.total if self.total else 1.0
+
+
+class ProgressTracker:
+    """
+    Counts completed and failed items and estimates the time remaining from the
+    rate of items completed since the tracker started, so resumed items do not
+    skew the estimate.
+    """
+
+    def __init__(self, total: int, callback: Optional[Callable[[Progress], None]] = None):
+        self.total = total
+        self.callback = callback
+        self.completed = 0
+        self.failed = 0
+        self._skipped = 0
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def skip(self, count: int):
+        """
+        Count items that were done before this run started.
+        """
+
+        with self._lock:
+            self.completed += count
+            self._skipped += count
+
+        self._report()
+
+    def complete(self, failed: bool = False):
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+        self._report()
+
+    def snapshot(self) -> Progress:
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            done_now = self.completed + self.failed - self._skipped
+            remaining = self.total - self.completed - self.failed
+            eta = remaining * elapsed / done_now if done_now else None
+            return Progress(self.completed, self.failed, self.total, elapsed, eta)
+
+    def _report(self):
+        if self.callback:
+            self.callback(self.snapshot())
+
+
+__all__ = ["JournalEntry", "PinJournal", "Progress", "ProgressTracker"]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from pydantic import BaseModel, validator
 
@@ -32,4 +32,42 @@ class Pin(BaseModel):
     file_name: str
 
 
-__all__ = ["NFT", "Pin"]
+class MetadataManifest(BaseModel):
+    """
+    A record of the last published metadata folder: its content hash, a
+    fingerprint of the whole collection, and a fingerprint per token ID.
+    """
+
+    cid: str
+    fingerprint: str
+    tokens: Dict[int, str] = {}
+
+
+class MetadataPublishResult(BaseModel):
+    """
+    The outcome of publishing metadata: the folder's content hash, whether it was
+    pinned again, and the token IDs that were added, changed, or removed.
+    """
+
+    cid: str
+    republished: bool
+    changed_token_ids: List[int] = []
+
+
+class PinStateReport(BaseModel):
+    """
+    The outcome of reconciling the local pin state with the pinning service:
+    how many entries checked out, and the paths that did not.
+    """
+
+    verified: int = 0
+    missing: List[str] = []  # No longer pinned remotely.
+    deleted: List[str] = []  # The local file is gone.
+    changed: List[str] = []  # The local file changed since it was pinned.
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.deleted or self.changed)
+
+
+__all__ = ["NFT", "MetadataManifest", "MetadataPublishResult", "Pin", "PinStateReport"]
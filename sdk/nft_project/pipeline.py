@@ -0,0 +1,197 @@
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from nft_project.journal import Progress
+from nft_project.project import (
+    DEFAULT_ARTWORK_DIRECTORY,
+    MetadataDocument,
+    NFTProject,
+    get_artwork_paths,
+)
+
+DEFAULT_QUEUE_SIZE = 64
+
+_DONE = object()
+
+
+class StageStats:
+    """
+    Throughput counters for one pipeline stage. ``busy`` is the time spent doing
+    the stage's own work; ``elapsed`` runs from its first to its last item.
+    """
+
+    __slots__ = ("name", "items", "busy", "started_at", "finished_at", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        Items per second of elapsed time.
+        """
+
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def start(self):
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.perf_counter()
+
+    def add(self, items: int = 1, busy: float = 0.0):
+        with self._lock:
+            self.items += items
+            self.busy += busy
+
+    def finish(self):
+        with self._lock:
+            self.finished_at = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"<StageStats {self.name}: {self.items} item(s) in {self.elapsed:.3f}s, "
+            f"{self.throughput:.1f}/s, busy {self.busy:.3f}s>"
+        )
+
+
+class PipelineResult(NamedTuple):
+    cid: str  # The content hash of the metadata folder.
+    artwork_hashes: Dict[str, str]  # Artwork file names to content hashes.
+    republished: bool
+    stages: Dict[str, StageStats]
+
+
+class MetadataPipeline:
+    """
+    Pins artwork and publishes metadata as a streaming pipeline. Each artwork's
+    metadata is rendered as soon as its upload finishes, while the other uploads are
+    still in flight, and the stages are connected by a bounded queue so a slow
+    consumer holds the uploads back instead of buffering without limit. The
+    metadata folder is published once every document is rendered, because its
+    content hash depends on all of them.
+
+    Args:
+        project (:class:`~nft_project.project.NFTProject`): The project to publish.
+        queue_size (int): The maximum number of pinned artworks waiting to be rendered.
+    """
+
+    def __init__(self, project: NFTProject, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.project = project
+        self.queue_size = queue_size
+        self.stages: Dict[str, StageStats] = {}
+
+    def run(
+        self,
+        artwork_path: Union[str, Path] = DEFAULT_ARTWORK_DIRECTORY,
+        max_workers: int = 1,
+        job_id: Optional[str] = None,
+        on_progress: Optional[Callable[[Progress], None]] = None,
+    ) -> PipelineResult:
+        """
+        Pin the artwork and publish its metadata. Token IDs follow the sorted artwork
+        paths, as with :meth:`~nft_project.project.NFTProject.pin_artwork`. The
+        metadata folder is only republished when it changed.
+
+        Args:
+            artwork_path (Union[str, Path]): The artwork file or directory.
+            max_workers (int): The maximum number of concurrent uploads.
+            job_id (Optional[str]): Journal uploads under this ID so that the job can be
+              resumed. See :meth:`~nft_project.project.NFTProject.pin_artwork`.
+            on_progress (Optional[Callable]): Called with the upload progress.
+
+        Raises:
+            :class:`~nft_project.project.PinArtworkError`: When any file fails to pin.
+
+        Returns:
+            :class:`~nft_project.pipeline.PipelineResult`
+        """
+
+        token_ids = {path: i for i, path in enumerate(get_artwork_paths(artwork_path))}
+        self.stages = {name: StageStats(name) for name in ("pin", "render", "publish")}
+        pinned: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        documents: List[Optional[MetadataDocument]] = [None] * len(token_ids)
+        render_errors: List[BaseException] = []
+
+        def on_pinned(path: Path, content_hash: str):
+            self.stages["pin"].add()
+            pinned.put((path, content_hash))
+
+        render_thread = threading.Thread(
+            target=self._render, args=(pinned, token_ids, documents, render_errors), daemon=True
+        )
+        render_thread.start()
+
+        self.stages["pin"].start()
+        try:
+            artwork_hashes = self.project.pin_artwork(
+                artwork_path,
+                max_workers=max_workers,
+                on_pinned=on_pinned,
+                job_id=job_id,
+                on_progress=on_progress,
+            )
+        finally:
+            # Uploads run concurrently, so the whole stage counts as busy.
+            self.stages["pin"].finish()
+            self.stages["pin"].add(0, busy=self.stages["pin"].elapsed)
+            pinned.put(_DONE)
+            render_thread.join()
+
+        if render_errors:
+            raise render_errors[0]
+
+        publish = self.stages["publish"]
+        publish.start()
+        started = time.perf_counter()
+        result = self.project.publish_metadata_documents(documents)  # type: ignore
+        publish.add(len(documents), busy=time.perf_counter() - started)
+        publish.finish()
+        return PipelineResult(result.cid, artwork_hashes, result.republished, self.stages)
+
+    def _render(
+        self,
+        pinned: "queue.Queue",
+        token_ids: Dict[Path, int],
+        documents: List[Optional[MetadataDocument]],
+        errors: List[BaseException],
+    ):
+        render = self.stages["render"]
+        while True:
+            item = pinned.get()
+            if item is _DONE:
+                render.finish()
+                return
+
+            if errors:
+                continue  # Keep draining so the pin workers are not blocked.
+
+            path, content_hash = item
+            render.start()
+            started = time.perf_counter()
+            token_id = token_ids[path]
+            try:
+                documents[token_id] = self.project.create_metadata_document(
+                    token_id, f"ipfs://{content_hash}"
+                )
+            except BaseException as err:
+                errors.append(err)
+
+            render.add(busy=time.perf_counter() - started)
+
+
+__all__ = ["MetadataPipeline", "PipelineResult", "StageStats"]
@@ -1,14 +1,34 @@
+import asyncio
+import hashlib
 import json
-import os
-import shutil
-import tempfile
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
-
-from nft_project.interfaces import IPinning
-from nft_project.models import NFT
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from nft_project.cid import compute_cid, directory_cid
+from nft_project.collection import NFTCollection, render_metadata_document, validate_image_cids
+from nft_project.concurrency import DEFAULT_MAX_THROTTLE_RETRIES, backoff_delay, run_bounded
+from nft_project.interfaces import IAsyncPinning, IPinning
+from nft_project.journal import DEFAULT_JOURNAL_DIRECTORY, PinJournal, Progress, ProgressTracker
+from nft_project.models import NFT, MetadataManifest, MetadataPublishResult, PinStateReport
+from nft_project.state import (
+    METADATA_PATH_PREFIX,
+    PinStateEntry,
+    PinStateStore,
+    file_digest,
+    is_unchanged,
+    reconcile,
+)
+
+if TYPE_CHECKING:
+    from nft_project.watch import ArtworkWatcher
 
 DEFAULT_ARTWORK_DIRECTORY = "artwork"
+DEFAULT_DEBOUNCE = 2.0
+DEFAULT_MANIFEST_DIRECTORY = Path(".build")
+
+NFTData = Union[List[NFT], NFTCollection]
+MetadataDocument = Tuple[int, str, bytes]  # Token ID, file name and JSON document.
 
 
 class NFTProjectError(Exception):
@@ -26,6 +46,19 @@ class MetadataFileNameError(NFTProjectError):
         super().__init__(f"Was unable to form file name from pattern {pattern}.")
 
 
+class PinArtworkError(NFTProjectError):
+    """
+    Raised when some artwork files failed to pin. The hashes of the files that
+    did pin are kept on the error so that the work is not lost.
+    """
+
+    def __init__(self, artwork_hashes: Dict[str, str], errors: Dict[str, Exception]):
+        self.artwork_hashes = artwork_hashes
+        self.errors = errors
+        names = ", ".join(errors)
+        super().__init__(f"Failed to pin {len(errors)} artwork file(s): {names}.")
+
+
 class NFTProject:
     """
     A class representing the active NFT project.
@@ -34,14 +67,65 @@ class NFTProject:
     def __init__(
         self,
         name: str,
-        ipfs_client: IPinning,
+        ipfs_client: Union[IPinning, IAsyncPinning],
         metadata_file_pattern: str = "{token_id}.json",
         nft_data_modifier: Optional[Callable[[NFT], NFT]] = None,
+        content_addressed: bool = False,
+        manifest_path: Optional[Union[str, Path]] = None,
+        state_path: Optional[Union[str, Path]] = None,
+        journal_directory: Optional[Union[str, Path]] = None,
     ) -> None:
         self._name = name
         self._ipfs = ipfs_client
         self._metadata_file_pattern = metadata_file_pattern
         self._nft_data_modifier = nft_data_modifier
+        self._content_addressed = content_addressed
+        self._manifest_path = Path(
+            manifest_path or DEFAULT_MANIFEST_DIRECTORY / f"{name}-metadata-manifest.json"
+        )
+        self._state = PinStateStore(state_path) if state_path else None
+        self._journal_directory = Path(journal_directory or DEFAULT_JOURNAL_DIRECTORY)
+
+    @property
+    def pin_state(self) -> Optional[PinStateStore]:
+        """
+        The local pin state database, when the project was given a ``state_path``.
+        """
+
+        return self._state
+
+    def verify_pins(self) -> PinStateReport:
+        """
+        Reconcile the local pin state with the pinning service in one listing.
+        Entries that are no longer pinned are dropped, so the next run pins them again.
+
+        Returns:
+            :class:`~nft_project.models.PinStateReport`
+        """
+
+        if not self._state:
+            raise NFTProjectError("Project has no pin state database.")
+
+        return reconcile(self._state, self._ipfs)
+
+    def forget_pins(self, job_id: Optional[str] = None):
+        """
+        Drop everything recorded locally about what is pinned: the pin state
+        database, the metadata manifest and, given its ID, the job's journal. Call
+        this after unpinning, so that the next run pins everything again.
+
+        Args:
+            job_id (Optional[str]): The ID of the journaled artwork job to delete.
+        """
+
+        if self._state:
+            self._state.clear()
+
+        if job_id:
+            PinJournal.for_job(job_id, self._journal_directory).delete()
+
+        if self._manifest_path.is_file():
+            self._manifest_path.unlink()
 
     def create_nft_data(self, content_hashes: List[str]) -> List[NFT]:
         """
@@ -54,14 +138,27 @@ class NFTProject:
             List[:class:`~project_nft.models.NFT`]: A list of NFT pydantic models.
         """
 
-        token_id = 0
         nft_data = []
-        for cid in content_hashes:
+        for token_id, cid in enumerate(content_hashes):
             nft_metadata_dict = self.create_nft(cid, token_id)
             nft_data.append(nft_metadata_dict)
 
         return nft_data
 
+    def create_nft_collection(self, content_hashes: List[str]) -> NFTCollection:
+        """
+        Create a compact :class:`~nft_project.collection.NFTCollection` from already-pinned
+        content hashes. Prefer this over :meth:`create_nft_data` for large collections.
+
+        Args:
+            content_hashes (List[str]): Content hashes from pinned metadata files.
+
+        Returns:
+            :class:`~nft_project.collection.NFTCollection`
+        """
+
+        return NFTCollection(self._name, content_hashes)
+
     def create_nft(self, cid: str, index: int, attributes: Dict = None) -> NFT:
         """
         Create an NFT model object.
@@ -85,73 +182,598 @@ class NFTProject:
         return nft
 
     def pin_artwork(
-        self, artwork_path: Optional[Union[str, Path]] = DEFAULT_ARTWORK_DIRECTORY
+        self,
+        artwork_path: Optional[Union[str, Path]] = DEFAULT_ARTWORK_DIRECTORY,
+        max_workers: int = 1,
+        on_pinned: Optional[Callable[[Path, str], None]] = None,
+        job_id: Optional[str] = None,
+        on_progress: Optional[Callable[[Progress], None]] = None,
     ) -> Dict:
         """
         Pin your artwork to IPFS.
-        *NOTE*: Only pins if not already pinned.
+        *NOTE*: Only pins if not already pinned. By default, a file counts as pinned
+        when a pin with the same file name exists. When the project is content-addressed,
+        CIDs are computed locally instead: identical content is uploaded at most once,
+        renamed or changed files are detected, and the returned dictionary is keyed by
+        path relative to the artwork directory. When the project has a pin state
+        database, files whose size, modification time, or content match their record
+        are not checked against the pinning service at all.
 
         Args:
             artwork_path (Union[str, Path]): The path to the artwork file or list of files.
               If list contains directories, they will be flattened to files. This method
               does not pin directories.
+            max_workers (int): The maximum number of files to check and upload at once.
+              When the pinning service throttles, fewer files are kept in flight.
+            on_pinned (Optional[Callable[[pathlib.Path, str], None]]): Called with each
+              file's path and content hash as soon as it is known to be pinned, from
+              the worker thread that pinned it.
+            job_id (Optional[str]): Journal each result under this ID as it completes.
+              Rerunning with the same ID resumes the job: files journaled and unchanged
+              since are skipped without any network calls.
+            on_progress (Optional[Callable[[:class:`~nft_project.journal.Progress`], None]]):
+              Called with the progress and estimated time remaining after each file.
+
+        Raises:
+            :class:`~nft_project.project.PinArtworkError`: When any file fails to pin.
+              The hashes of the files that did pin are available on the error.
+
+        Returns:
+            Dict: A dictionary of file names to their content IPFS hashes, ordered by path.
+        """
+
+        artwork_paths = get_artwork_paths(artwork_path)
+        journal = PinJournal.for_job(job_id, self._journal_directory) if job_id else None
+        resumed = _load_journaled_hashes(journal, artwork_paths) if journal else {}
+        known, pending, changed = self._check_pin_state(
+            [p for p in artwork_paths if p not in resumed], max_workers
+        )
+        known.update(resumed)
+        progress = ProgressTracker(len(artwork_paths), on_progress)
+        progress.skip(len(known))
+        if on_pinned:
+            for path, content_hash in known.items():
+                on_pinned(path, content_hash)
+
+        def pinned(path: Path, content_hash: str):
+            if journal:
+                journal.record(path, content_hash)
+
+            progress.complete()
+            if on_pinned:
+                on_pinned(path, content_hash)
+
+        if not self._content_addressed:
+            results, errors = run_bounded(
+                partial(self._pin_artwork_file, changed=changed),
+                [p for p in artwork_paths if p in pending],
+                max_in_flight=max_workers,
+                throttle_errors=self._ipfs.throttle_errors,
+                on_result=pinned,
+            )
+        else:
+            results, errors = self._pin_artwork_by_content(
+                [p for p in artwork_paths if p in pending], max_workers, on_pinned=pinned
+            )
+
+        key = self.artwork_key(artwork_path)
+        for _ in errors:
+            progress.complete(failed=True)
+
+        self._record_pin_state(pending, results)
+        results = {
+            p: known[p] if p in known else results[p] for p in artwork_paths if p not in errors
+        }
+        return _collect_artwork_hashes(results, errors, key=key)
+
+    async def pin_artwork_async(
+        self,
+        artwork_path: Optional[Union[str, Path]] = DEFAULT_ARTWORK_DIRECTORY,
+        max_in_flight: int = 16,
+    ) -> Dict:
+        """
+        Pin your artwork to IPFS using an :class:`~nft_project.interfaces.IAsyncPinning`
+        client, with up to ``max_in_flight`` files checked and uploaded at once.
+        *NOTE*: Only pins if not already pinned. Like :meth:`pin_artwork`, files are
+        skipped when they match the pin state database, files whose recorded content
+        changed are uploaded without a lookup by name, and content-addressed projects
+        upload identical content at most once and key results by relative path.
+
+        Args:
+            artwork_path (Union[str, Path]): The path to the artwork file or directory.
+            max_in_flight (int): The maximum number of concurrent uploads.
+
+        Raises:
+            :class:`~nft_project.project.PinArtworkError`: When any file fails to pin.
+
+        Returns:
+            Dict: A dictionary of file names to their content IPFS hashes, ordered by path.
+        """
+
+        artwork_paths = get_artwork_paths(artwork_path)
+        # Hashing files for the pin state blocks, so it runs outside the event loop.
+        known, pending, changed = await asyncio.get_running_loop().run_in_executor(
+            None, self._check_pin_state, artwork_paths, max_in_flight
+        )
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def bounded(call: Callable[[], Awaitable[str]]) -> str:
+            attempt = 0
+            async with semaphore:
+                while True:
+                    try:
+                        return await call()
+                    except self._ipfs.throttle_errors:
+                        if attempt >= DEFAULT_MAX_THROTTLE_RETRIES:
+                            raise
+
+                        # Keep the slot while backing off so fewer requests are in flight.
+                        await asyncio.sleep(backoff_delay(attempt))
+                        attempt += 1
+
+        async def pin(path: Path) -> str:
+            is_changed = path in changed
+            content_hash = None if is_changed else await self._ipfs.get_hash(path.name)
+            return content_hash or await self._ipfs.pin_file(path)
+
+        pending_paths = [p for p in artwork_paths if p in pending]
+        if self._content_addressed:
+            results, errors = await self._pin_artwork_by_content_async(
+                pending_paths, max_in_flight, bounded
+            )
+        else:
+            results, errors = await _gather_by_key(
+                {p: bounded(partial(pin, p)) for p in pending_paths}
+            )
+
+        self._record_pin_state(pending, results)
+        results = {
+            p: known[p] if p in known else results[p] for p in artwork_paths if p not in errors
+        }
+        return _collect_artwork_hashes(results, errors, key=self.artwork_key(artwork_path))
+
+    def _pin_artwork_by_content(
+        self,
+        artwork_paths: List[Path],
+        max_workers: int,
+        on_pinned: Optional[Callable[[Path, str], None]] = None,
+    ) -> Tuple[Dict[Path, str], Dict[Path, Exception]]:
+        # Pinata pins as CIDv0, so that is what local CIDs must be computed as.
+        local_hashes, errors = run_bounded(compute_cid, artwork_paths, max_in_flight=max_workers)
+
+        # Upload each distinct content once, using the first path that has it.
+        uploads: Dict[str, Path] = {}
+        paths_by_hash: Dict[str, List[Path]] = {}
+        for path, content_hash in local_hashes.items():
+            uploads.setdefault(content_hash, path)
+            paths_by_hash.setdefault(content_hash, []).append(path)
+
+        def notify(content_hash: str, pinned_hash: str):
+            for path in paths_by_hash[content_hash]:
+                on_pinned(path, pinned_hash)
+
+        def pin(content_hash: str) -> str:
+            if self._ipfs.get_pin(content_hash):
+                return content_hash
+
+            return self._ipfs.pin_file(uploads[content_hash])
+
+        pinned, pin_errors = run_bounded(
+            pin,
+            list(uploads),
+            max_in_flight=max_workers,
+            throttle_errors=self._ipfs.throttle_errors,
+            on_result=notify if on_pinned else None,
+        )
+        results = {}
+        for path, content_hash in local_hashes.items():
+            if content_hash in pinned:
+                results[path] = pinned[content_hash]
+            else:
+                errors[path] = pin_errors[content_hash]
+
+        return results, errors
+
+    async def _pin_artwork_by_content_async(
+        self,
+        artwork_paths: List[Path],
+        max_in_flight: int,
+        bounded: Callable[[Callable[[], Awaitable[str]]], Awaitable[str]],
+    ) -> Tuple[Dict[Path, str], Dict[Path, Exception]]:
+        # Like '_pin_artwork_by_content()', with hashing kept off the event loop.
+        local_hashes, errors = await asyncio.get_running_loop().run_in_executor(
+            None, partial(run_bounded, compute_cid, artwork_paths, max_in_flight=max_in_flight)
+        )
+        uploads: Dict[str, Path] = {}
+        for path, content_hash in local_hashes.items():
+            uploads.setdefault(content_hash, path)
+
+        async def pin(content_hash: str) -> str:
+            if await self._ipfs.get_pin(content_hash):
+                return content_hash
+
+            return await self._ipfs.pin_file(uploads[content_hash])
+
+        pinned, pin_errors = await _gather_by_key(
+            {content_hash: bounded(partial(pin, content_hash)) for content_hash in uploads}
+        )
+        results = {}
+        for path, content_hash in local_hashes.items():
+            if content_hash in pinned:
+                results[path] = pinned[content_hash]
+            else:
+                errors[path] = pin_errors[content_hash]
+
+        return results, errors
+
+    def watch_artwork(
+        self,
+        artwork_path: Union[str, Path] = DEFAULT_ARTWORK_DIRECTORY,
+        max_workers: int = 1,
+        debounce: float = DEFAULT_DEBOUNCE,
+        on_pinned: Optional[Callable[[Path, str], None]] = None,
+        use_inotify: bool = True,
+    ) -> "ArtworkWatcher":
+        """
+        Watch an artwork directory and pin files as they are added or changed. See
+        :class:`~nft_project.watch.ArtworkWatcher`.
+
+        Args:
+            artwork_path (Union[str, Path]): The artwork directory.
+            max_workers (int): The maximum number of files to upload at once.
+            debounce (float): Seconds a file must stay unchanged before it is pinned,
+              so that files still being written are not pinned half-way.
+            on_pinned (Optional[Callable[[pathlib.Path, str], None]]): Called with each
+              file's path and content hash once it is pinned.
+            use_inotify (bool): Use inotify where available instead of polling.
+
+        Returns:
+            :class:`~nft_project.watch.ArtworkWatcher`: Call ``run()`` to watch until
+            interrupted, or ``start()`` and then ``poll()`` to drive it yourself.
+        """
+        from nft_project.watch import ArtworkWatcher
+
+        return ArtworkWatcher(
+            self,
+            artwork_path,
+            max_workers=max_workers,
+            debounce=debounce,
+            on_pinned=on_pinned,
+            use_inotify=use_inotify,
+        )
+
+    def pin_artwork_changes(
+        self, artwork_paths: List[Path], max_workers: int = 1
+    ) -> Tuple[Dict[Path, str], Dict[Path, Exception]]:
+        """
+        Pin files known to be new or changed, such as those reported by
+        :class:`~nft_project.watch.ArtworkWatcher`. Unlike :meth:`pin_artwork`, they
+        are not looked up by name first; the pin state still skips unchanged content.
+
+        Args:
+            artwork_paths (List[pathlib.Path]): The files to pin.
+            max_workers (int): The maximum number of files to upload at once.
 
         Returns:
-            Dict: A dictionary of file names to their content IPFS hashes.
+            Tuple[Dict, Dict]: The content hash and the error of each file, by path.
         """
 
-        artwork_path = Path(artwork_path)
-        artwork_hashes = {}
-        artwork_paths = list(artwork_path.rglob("*.*")) if artwork_path.is_dir() else [artwork_path]
+        known, pending, _ = self._check_pin_state(artwork_paths, max_workers)
+        if self._content_addressed:
+            results, errors = self._pin_artwork_by_content(list(pending), max_workers)
+        else:
+            results, errors = run_bounded(
+                self._ipfs.pin_file,
+                list(pending),
+                max_in_flight=max_workers,
+                throttle_errors=self._ipfs.throttle_errors,
+            )
+
+        self._record_pin_state(pending, results)
+        return {**known, **results}, errors
+
+    def artwork_key(self, artwork_path: Union[str, Path]) -> Callable[[Path], str]:
+        """
+        How :meth:`pin_artwork` keys its results for files under ``artwork_path``:
+        by file name, or by relative path when the project is content-addressed.
 
-        for artwork_path in artwork_paths:
-            content_hash = self._ipfs.get_hash(artwork_path.name)
-            if not content_hash:
-                # Pin artwork if it is not already pinned.
-                content_hash = self._ipfs.pin_file(artwork_path)
+        Args:
+            artwork_path (Union[str, Path]): The artwork directory.
 
-            artwork_hashes[artwork_path.name] = content_hash
+        Returns:
+            Callable[[pathlib.Path], str]: Maps a file's path to its key.
+        """
+
+        if self._content_addressed:
+            return partial(_relative_name, Path(artwork_path))
+
+        return lambda p: p.name
+
+    def _check_pin_state(
+        self, artwork_paths: List[Path], max_workers: int
+    ) -> Tuple[Dict[Path, str], Dict[Path, Optional[PinStateEntry]], Set[Path]]:
+        # Split the files into those known to be pinned already, with their CIDs, and
+        # the rest, with the state to record once they are pinned. Also returns the
+        # pending files whose recorded content changed, as their old pins are stale.
+        if not self._state:
+            return {}, {p: None for p in artwork_paths}, set()
+
+        entries = self._state.lookup(artwork_paths)
+        stats = {p: p.stat() for p in artwork_paths}
+        known = {
+            p: entries[p].cid
+            for p in artwork_paths
+            if p in entries and is_unchanged(entries[p], stats[p])
+        }
+        digests, errors = run_bounded(
+            file_digest, [p for p in artwork_paths if p not in known], max_in_flight=max_workers
+        )
+        # Unreadable files are left for the pinning step to report.
+        pending: Dict[Path, Optional[PinStateEntry]] = {p: None for p in errors}
+        changed = set()
+        touched = []
+        for path, digest in digests.items():
+            stat = stats[path]
+            entry = PinStateEntry(str(path), stat.st_size, stat.st_mtime_ns, digest, "")
+            if path in entries and entries[path].digest == digest:
+                # Only the modification time changed.
+                known[path] = entries[path].cid
+                touched.append(entry._replace(cid=entries[path].cid))
+            else:
+                pending[path] = entry
+                if path in entries:
+                    changed.add(path)
+
+        if touched:
+            self._state.record(touched)
+
+        return known, pending, changed
+
+    def _record_pin_state(
+        self, pending: Dict[Path, Optional[PinStateEntry]], results: Dict[Path, str]
+    ):
+        if self._state:
+            self._state.record(
+                pending[path]._replace(cid=content_hash)
+                for path, content_hash in results.items()
+                if pending[path]
+            )
+
+    def _pin_artwork_file(self, artwork_path: Path, changed: Set[Path]) -> str:
+        # A pin with the same name holds the old content of a changed file.
+        content_hash = None if artwork_path in changed else self._ipfs.get_hash(artwork_path.name)
+        if not content_hash:
+            # Pin artwork if it is not already pinned.
+            content_hash = self._ipfs.pin_file(artwork_path)
 
-        return artwork_hashes
+        return content_hash
 
-    def pin_metadata(self, nft_data: List[NFT]) -> str:
+    def pin_metadata(self, nft_data: NFTData, incremental: bool = False) -> str:
         """
         Pin NFT metadata. Provide it a list of :class:`nft_project.models.NFT` objects
-        and it will create a temporary directory containing equivalent JSON files and
-        then it will pin the whole directory to IPFS.
+        and it will pin a directory containing equivalent JSON files to IPFS. The JSON
+        documents are built in memory and handed to the pinning client directly, so the
+        filesystem and the working directory are left untouched.
 
         Args:
-            nft_data (List[:class:`project_nft.models.NFT`]): The list of NFT models.
+            nft_data (Union[List[:class:`project_nft.models.NFT`],
+              :class:`~nft_project.collection.NFTCollection`]): The list of NFT models,
+              or a collection.
+            incremental (bool): Only republish when the metadata changed since the last
+              publish recorded in the manifest. See :meth:`publish_metadata`.
 
         Returns:
             str: The content IPFS hash of the newly pinned directory.
         """
 
-        content_hash = self._ipfs.get_hash(self._name)
-        if content_hash:
-            return content_hash
+        if incremental:
+            return self.publish_metadata(nft_data).cid
 
-        # Create and pin metadata JSON files to IPFS
-        with tempfile.TemporaryDirectory() as temp_dir:
-            owd = os.getcwd()
+        if not self._content_addressed:
+            content_hash = self._ipfs.get_hash(self._name)
+            if content_hash:
+                return content_hash
 
-            try:
-                os.chdir(temp_dir)
-                project_path = Path(self._name)
-                shutil.rmtree(project_path, ignore_errors=True)
-                project_path.mkdir()
+        documents = self._create_metadata_documents(nft_data)
+        return self._pin_metadata_documents(documents)
 
-                for nft in nft_data:
-                    metadata_file_name = self._metadata_file_pattern.format(token_id=nft.tokenId)
-                    if not metadata_file_name:
-                        raise MetadataFileNameError(self._metadata_file_pattern)
+    def publish_metadata(self, nft_data: NFTData) -> MetadataPublishResult:
+        """
+        Pin NFT metadata only if it changed since it was last published. Each token's
+        metadata is fingerprinted and compared against the manifest written by the
+        previous publish, so an unchanged collection costs a single hash comparison
+        and no network calls.
 
-                    metadata_file_path = project_path / metadata_file_name
-                    metadata_file_path.write_text(json.dumps(nft.dict()))
+        Args:
+            nft_data (Union[List[:class:`project_nft.models.NFT`],
+              :class:`~nft_project.collection.NFTCollection`]): The list of NFT models,
+              or a collection.
 
-                content_hash = self._ipfs.pin_file(project_path)
+        Returns:
+            :class:`~nft_project.models.MetadataPublishResult`: The folder's content IPFS
+            hash, whether it was republished, and which token IDs changed.
+        """
+
+        return self.publish_metadata_documents(self._create_metadata_documents(nft_data))
+
+    def publish_metadata_documents(
+        self, documents: List[MetadataDocument]
+    ) -> MetadataPublishResult:
+        """
+        Like :meth:`publish_metadata`, for documents already rendered with
+        :meth:`create_metadata_document`.
 
-            finally:
-                os.chdir(owd)
+        Args:
+            documents (List[Tuple[int, str, bytes]]): Token IDs, file names, and JSON
+              documents.
+
+        Returns:
+            :class:`~nft_project.models.MetadataPublishResult`
+        """
+
+        token_fingerprints = {
+            token_id: hashlib.sha256(file_name.encode() + b"\0" + document).hexdigest()
+            for token_id, file_name, document in documents
+        }
+        fingerprint = hashlib.sha256(
+            "".join(token_fingerprints[t] for t in sorted(token_fingerprints)).encode()
+        ).hexdigest()
+
+        manifest = self._load_manifest()
+        if manifest and manifest.fingerprint == fingerprint:
+            return MetadataPublishResult(cid=manifest.cid, republished=False)
+
+        previous = manifest.tokens if manifest else {}
+        changed_token_ids = sorted(
+            token_id
+            for token_id in set(previous) | set(token_fingerprints)
+            if previous.get(token_id) != token_fingerprints.get(token_id)
+        )
+        content_hash = self._pin_metadata_documents(documents)
+        self._save_manifest(
+            MetadataManifest(cid=content_hash, fingerprint=fingerprint, tokens=token_fingerprints)
+        )
+        return MetadataPublishResult(
+            cid=content_hash, republished=True, changed_token_ids=changed_token_ids
+        )
+
+    def create_metadata_document(
+        self, token_id: int, image: str, attributes: Optional[List] = None
+    ) -> MetadataDocument:
+        """
+        Render the metadata JSON of a single token, the same way :meth:`pin_metadata`
+        renders whole collections.
+
+        Args:
+            token_id (int): The token ID.
+            image (str): The ``ipfs://`` image URI.
+            attributes (Optional[List]): The token's attributes.
+
+        Returns:
+            Tuple[int, str, bytes]: The token ID, file name, and JSON document.
+        """
+
+        file_name = self._metadata_file_pattern.format(token_id=token_id)
+        if not file_name:
+            raise MetadataFileNameError(self._metadata_file_pattern)
+
+        if self._nft_data_modifier:
+            nft = self.create_nft(image, token_id, attributes=attributes)
+            return token_id, file_name, json.dumps(nft.dict()).encode()
+
+        validate_image_cids([image])
+        name = f"{self._name} Number {token_id}"
+        return token_id, file_name, render_metadata_document(image, token_id, name, attributes)
+
+    def _create_metadata_documents(self, nft_data: NFTData) -> List[MetadataDocument]:
+        if not self._metadata_file_pattern.format(token_id=0):
+            raise MetadataFileNameError(self._metadata_file_pattern)
+
+        if isinstance(nft_data, NFTCollection):
+            if not self._nft_data_modifier:
+                return list(nft_data.iter_documents(self._metadata_file_pattern))
+
+            # Modifiers work on models, so the fast path cannot be used.
+            nft_data = [self._nft_data_modifier(nft) for nft in nft_data.iter_nfts()]
+
+        documents = []
+        for nft in nft_data:
+            metadata_file_name = self._metadata_file_pattern.format(token_id=nft.tokenId)
+            if not metadata_file_name:
+                raise MetadataFileNameError(self._metadata_file_pattern)
+
+            documents.append((nft.tokenId, metadata_file_name, json.dumps(nft.dict()).encode()))
+
+        return documents
+
+    def _pin_metadata_documents(self, documents: List[MetadataDocument]) -> str:
+        files = [(file_name, document) for _, file_name, document in documents]
+        state_entry = None
+        if self._state:
+            digest = hashlib.sha256()
+            for file_name, document in files:
+                digest.update(file_name.encode() + b"\0" + document + b"\0")
+
+            size = sum(len(document) for _, document in files)
+            state_entry = PinStateEntry(
+                f"{METADATA_PATH_PREFIX}{self._name}", size, 0, digest.hexdigest(), ""
+            )
+            recorded = self._state.get(state_entry.path)
+            if recorded and recorded.digest == state_entry.digest:
+                return recorded.cid
+
+        content_hash = None
+        if self._content_addressed:
+            content_hash = directory_cid(files)
+            if not self._ipfs.get_pin(content_hash):
+                content_hash = None
+
+        # Pin metadata JSON documents straight from memory.
+        content_hash = content_hash or self._ipfs.pin_directory(self._name, files)
+        if state_entry:
+            self._state.record([state_entry._replace(cid=content_hash)])
 
         return content_hash
+
+    def _load_manifest(self) -> Optional[MetadataManifest]:
+        if not self._manifest_path.is_file():
+            return None
+
+        return MetadataManifest.parse_file(self._manifest_path)
+
+    def _save_manifest(self, manifest: MetadataManifest):
+        self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._manifest_path.with_suffix(".tmp")
+        temp_path.write_text(manifest.json())
+        temp_path.replace(self._manifest_path)
+
+
+def get_artwork_paths(artwork_path: Union[str, Path]) -> List[Path]:
+    """
+    The artwork files under ``artwork_path``, in token order, or just
+    ``artwork_path`` when it is a file.
+    """
+
+    artwork_path = Path(artwork_path)
+    return sorted(artwork_path.rglob("*.*")) if artwork_path.is_dir() else [artwork_path]
+
+
+def _load_journaled_hashes(journal: PinJournal, artwork_paths: List[Path]) -> Dict[Path, str]:
+    entries = journal.load()
+    return {
+        path: entries[str(path)].cid
+        for path in artwork_paths
+        if str(path) in entries and journal.is_current(path, entries[str(path)])
+    }
+
+
+async def _gather_by_key(
+    awaitables: Dict[Any, Awaitable[str]],
+) -> Tuple[Dict[Any, str], Dict[Any, Exception]]:
+    # Await everything concurrently, splitting the outcomes into results and errors.
+    outcomes = await asyncio.gather(*awaitables.values(), return_exceptions=True)
+    results = {}
+    errors = {}
+    for key, outcome in zip(awaitables, outcomes):
+        if isinstance(outcome, BaseException):
+            errors[key] = outcome
+        else:
+            results[key] = outcome
+
+    return results, errors
+
+
+def _relative_name(root: Path, path: Path) -> str:
+    return path.relative_to(root).as_posix() if root.is_dir() else path.name
+
+
+def _collect_artwork_hashes(
+    results: Dict[Path, str],
+    errors: Dict[Path, Exception],
+    key: Callable[[Path], str] = lambda p: p.name,
+) -> Dict:
+    artwork_hashes = {key(path): content_hash for path, content_hash in results.items()}
+    if errors:
+        raise PinArtworkError(artwork_hashes, {key(path): err for path, err in errors.items()})
+
+    return artwork_hashes
@@ -0,0 +1,200 @@
+"""
+A local SQLite record of what has been pinned, so that reruns only reach the
+pinning service for new or changed files. The database runs in WAL mode and every
+write takes the write lock up front (``BEGIN IMMEDIATE``), so several processes,
+such as parallel CI jobs, can share one file.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from nft_project.interfaces import IPinning
+from nft_project.models import PinStateReport
+
+DEFAULT_BUSY_TIMEOUT = 30.0
+METADATA_PATH_PREFIX = "metadata:"
+
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pins (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    cid TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class PinStateEntry(NamedTuple):
+    path: str  # A file path, or "metadata:<name>" for a metadata folder.
+    size: int
+    mtime_ns: int
+    digest: str  # The sha256 of the content.
+    cid: str
+
+
+class PinStateStore:
+    """
+    Records the size, modification time, content digest and CID of each pinned
+    artwork file and metadata folder.
+
+    Args:
+        path (Union[str, pathlib.Path]): The database file. Created if missing.
+        timeout (float): Seconds to wait for another process holding the write lock.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = DEFAULT_BUSY_TIMEOUT):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._write() as cursor:
+            cursor.execute(_SCHEMA)
+
+    def get(self, path: str) -> Optional[PinStateEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT path, size, mtime_ns, digest, cid FROM pins WHERE path = ?", (path,)
+            ).fetchone()
+
+        return PinStateEntry(*row) if row else None
+
+    def entries(self) -> List[PinStateEntry]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT path, size, mtime_ns, digest, cid FROM pins ORDER BY path"
+            ).fetchall()
+
+        return [PinStateEntry(*row) for row in rows]
+
+    def lookup(self, paths: Iterable[Path]) -> Dict[Path, PinStateEntry]:
+        """
+        Get the recorded entries for the given files, if any.
+        """
+
+        paths = list(paths)
+        found = {}
+        with self._lock:
+            # Stay under SQLite's default limit on the number of query parameters.
+            for i in range(0, len(paths), 500):
+                batch = {str(p): p for p in paths[i : i + 500]}
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT path, size, mtime_ns, digest, cid FROM pins "
+                    f"WHERE path IN ({placeholders})",
+                    list(batch),
+                ).fetchall()
+                found.update({batch[row[0]]: PinStateEntry(*row) for row in rows})
+
+        return found
+
+    def record(self, entries: Iterable[PinStateEntry]):
+        """
+        Insert or replace entries, all in one transaction.
+        """
+
+        now = time.time()
+        with self._write() as cursor:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO pins (path, size, mtime_ns, digest, cid, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(*entry, now) for entry in entries],
+            )
+
+    def remove(self, paths: Iterable[str]):
+        with self._write() as cursor:
+            cursor.executemany("DELETE FROM pins WHERE path = ?", [(p,) for p in paths])
+
+    def clear(self):
+        with self._write() as cursor:
+            cursor.execute("DELETE FROM pins")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def is_unchanged(entry: PinStateEntry, stat: os.stat_result) -> bool:
+    """
+    Whether a file still has the size and modification time it was recorded with.
+    """
+
+    return entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns
+
+
+def reconcile(store: PinStateStore, ipfs_client: IPinning) -> PinStateReport:
+    """
+    Check every recorded entry against a single listing of the pinning service and
+    against the local files. Entries whose CID is no longer pinned, or whose file
+    is gone, are removed so that the next run pins them again.
+
+    Args:
+        store (:class:`~nft_project.state.PinStateStore`): The pin state.
+        ipfs_client (:class:`~nft_project.interfaces.IPinning`): The pinning client.
+
+    Returns:
+        :class:`~nft_project.models.PinStateReport`
+    """
+
+    pinned = {pin.content_hash for pin in ipfs_client.get_pins()}
+    report = PinStateReport()
+    for entry in store.entries():
+        is_file = not entry.path.startswith(METADATA_PATH_PREFIX)
+        if entry.cid not in pinned:
+            report.missing.append(entry.path)
+        elif is_file and not os.path.isfile(entry.path):
+            report.deleted.append(entry.path)
+        elif is_file and not is_unchanged(entry, os.stat(entry.path)):
+            report.changed.append(entry.path)
+        else:
+            report.verified += 1
+
+    # Changed files are kept: their digest still tells whether they really changed.
+    store.remove(report.missing + report.deleted)
+    return report
+
+
+__all__ = [
+    "PinStateEntry",
+    "PinStateStore",
+    "file_digest",
+    "is_unchanged",
+    "reconcile",
+]
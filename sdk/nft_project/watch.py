@@ -0,0 +1,417 @@
+"""
+Watch mode: pin artwork as it lands in the artwork directory. On Linux, changes are
+reported by inotify (through ``ctypes``, no extra dependency); elsewhere, or when
+inotify is unavailable, the directory is polled with ``os.scandir``. Either way,
+only the files that changed are looked at, and nothing is relisted from the pinning
+service.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from nft_project.project import (
+    DEFAULT_ARTWORK_DIRECTORY,
+    DEFAULT_DEBOUNCE,
+    NFTProject,
+    PinArtworkError,
+)
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Files that are still being written or are editor scratch files.
+_TEMPORARY_SUFFIXES = frozenset({".crdownload", ".part", ".swp", ".tmp"})
+
+# From <sys/inotify.h>.
+_IN_MODIFY = 0x2
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+Changes = Tuple[Set[Path], Set[Path]]  # Changed or added paths, and deleted paths.
+
+
+def is_artwork_file(path: Path) -> bool:
+    """
+    Whether a path is a finished artwork file, matching ``pin_artwork``'s ``*.*``
+    but leaving out hidden and temporary files that are still being written.
+    """
+
+    name = path.name
+    return (
+        "." in name
+        and not name.startswith(".")
+        and not name.endswith("~")
+        and path.suffix not in _TEMPORARY_SUFFIXES
+    )
+
+
+def _scan(root: Path) -> Dict[Path, Tuple[int, int]]:
+    # The size and modification time of every file under the root.
+    found = {}
+    directories = [root]
+    while directories:
+        try:
+            entries = list(os.scandir(directories.pop()))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(Path(entry.path))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    found[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+            except FileNotFoundError:
+                continue
+
+    return found
+
+
+class PollingWatcher:
+    """
+    Detects changes by comparing ``os.scandir`` snapshots of the directory tree.
+    """
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._snapshot = _scan(root)
+
+    def poll(self, timeout: float) -> Changes:
+        time.sleep(min(timeout, self.interval))
+        snapshot = _scan(self.root)
+        changed = {p for p, stat in snapshot.items() if self._snapshot.get(p) != stat}
+        deleted = set(self._snapshot) - set(snapshot)
+        self._snapshot = snapshot
+        return changed, deleted
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """
+    Detects changes with Linux inotify, watching every directory in the tree.
+    Directories created later are watched as soon as they appear.
+
+    Raises:
+        OSError: When inotify is not available.
+    """
+
+    def __init__(self, root: Path):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux.")
+
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise _errno_error("inotify_init1")
+
+        self._directories: Dict[int, Path] = {}
+        self._add_tree(root)
+
+    def poll(self, timeout: float) -> Changes:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set(), set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set(), set()
+
+        changed: Set[Path] = set()
+        deleted: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped, so report everything and let the caller sort it out.
+                changed.update(_scan(self.root))
+                continue
+            elif mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                self._directories.pop(wd, None)
+                continue
+
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may land in a new directory before it is watched.
+                    self._add_tree(path)
+                    changed.update(_scan(path))
+                elif mask & _IN_MOVED_FROM:
+                    # Everything under it is gone from the tree.
+                    self._remove_tree(path)
+                    deleted.add(path)
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                deleted.add(path)
+                changed.discard(path)
+            else:
+                changed.add(path)
+                deleted.discard(path)
+
+        return changed, deleted
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _add_tree(self, root: Path):
+        for directory in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                if directory == self.root:
+                    raise _errno_error("inotify_add_watch")
+
+                continue  # Removed again before it could be watched.
+
+            self._directories[wd] = directory
+
+    def _remove_tree(self, root: Path):
+        for wd, directory in list(self._directories.items()):
+            if directory == root or root in directory.parents:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._directories[wd]
+
+
+def _errno_error(function: str) -> OSError:
+    errno = ctypes.get_errno()
+    return OSError(errno, f"{function}: {os.strerror(errno)}")
+
+
+class ArtworkWatcher:
+    """
+    Keeps an artwork directory pinned as files are added or changed. Starting the
+    watcher pins whatever is not pinned yet with
+    :meth:`~nft_project.project.NFTProject.pin_artwork`; after that, only files
+    reported as changed are pinned, once they stay unchanged for ``debounce``
+    seconds. :attr:`hashes` is kept up to date in place, keyed the same way as
+    ``pin_artwork``'s result.
+
+    Args:
+        project (:class:`~nft_project.project.NFTProject`): The project to pin with.
+        artwork_path (Union[str, Path]): The artwork directory.
+        max_workers (int): The maximum number of files to upload at once.
+        debounce (float): Seconds a file must stay unchanged before it is pinned.
+        on_pinned (Optional[Callable[[pathlib.Path, str], None]]): Called with each
+          file's path and content hash once it is pinned.
+        use_inotify (bool): Use inotify where available instead of polling.
+    """
+
+    def __init__(
+        self,
+        project: NFTProject,
+        artwork_path: Union[str, Path] = DEFAULT_ARTWORK_DIRECTORY,
+        max_workers: int = 1,
+        debounce: float = DEFAULT_DEBOUNCE,
+        on_pinned: Optional[Callable[[Path, str], None]] = None,
+        use_inotify: bool = True,
+    ):
+        self.project = project
+        self.artwork_path = Path(artwork_path)
+        self.max_workers = max_workers
+        self.debounce = debounce
+        self.on_pinned = on_pinned
+        self.use_inotify = use_inotify
+        self.hashes: Dict[str, str] = {}
+        self.errors: Dict[str, Exception] = {}  # Retried when the file changes again.
+        self._key = project.artwork_key(self.artwork_path)
+        # Pinned paths to their keys in 'hashes' and their content hashes.
+        self._paths: Dict[Path, Tuple[str, str]] = {}
+        self._watcher: Optional[Union[InotifyWatcher, PollingWatcher]] = None
+        # Files waiting to settle, with when they last changed and their stat then.
+        self._pending: Dict[Path, Tuple[float, Optional[Tuple[int, int]]]] = {}
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if isinstance(self._watcher, InotifyWatcher) else "polling"
+
+    def start(self) -> Dict[str, str]:
+        """
+        Start watching and pin what is not pinned yet.
+
+        Returns:
+            Dict: The artwork hashes.
+        """
+
+        # Watch first, so that files landing during the initial pin are not missed.
+        self._watcher = self._create_watcher()
+
+        def pinned(path: Path, content_hash: str):
+            self._paths[path] = (self._key(path), content_hash)
+            if self.on_pinned:
+                self.on_pinned(path, content_hash)
+
+        try:
+            hashes = self.project.pin_artwork(
+                self.artwork_path, max_workers=self.max_workers, on_pinned=pinned
+            )
+        except PinArtworkError as err:
+            hashes = err.artwork_hashes
+            self.errors.update(err.errors)
+
+        self.hashes.update(hashes)
+        return self.hashes
+
+    def poll(self, timeout: float = DEFAULT_POLL_INTERVAL) -> Dict[str, str]:
+        """
+        Wait up to ``timeout`` seconds for changes, then pin the files that settled.
+        Returns early when a pending file is due to settle.
+
+        Returns:
+            Dict: The newly pinned artwork hashes.
+        """
+
+        if self._watcher is None:
+            raise RuntimeError("Watcher not started.")
+
+        if self._pending:
+            due = min(changed_at for changed_at, _ in self._pending.values()) + self.debounce
+            timeout = max(0.0, min(timeout, due - time.monotonic()))
+
+        changed, deleted = self._watcher.poll(timeout)
+        now = time.monotonic()
+        for path in deleted:
+            self._forget(path)
+
+        for path in changed:
+            if is_artwork_file(path):
+                self._pending[path] = (now, _stat(path))
+
+        settled = self._settled(now)
+        if not settled:
+            return {}
+
+        results, errors = self.project.pin_artwork_changes(settled, self.max_workers)
+        pinned = {}
+        for path, content_hash in results.items():
+            key = self._key(path)
+            pinned[key] = content_hash
+            self._paths[path] = (key, content_hash)
+            self.errors.pop(key, None)
+            if self.on_pinned:
+                self.on_pinned(path, content_hash)
+
+        self.errors.update({self._key(path): err for path, err in errors.items()})
+        self.hashes.update(pinned)
+        return pinned
+
+    def run(self, stop: Optional[threading.Event] = None, timeout: float = DEFAULT_POLL_INTERVAL):
+        """
+        Start, then watch until ``stop`` is set or the process is interrupted.
+        """
+
+        self.start()
+        try:
+            while not (stop and stop.is_set()):
+                self.poll(timeout)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+
+    def __enter__(self) -> "ArtworkWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _create_watcher(self) -> Union[InotifyWatcher, PollingWatcher]:
+        if self.use_inotify:
+            try:
+                return InotifyWatcher(self.artwork_path)
+            except (OSError, AttributeError):
+                # Not Linux, no libc inotify symbols, or out of watches.
+                pass
+
+        interval = min(DEFAULT_POLL_INTERVAL, max(self.debounce, 0.1))
+        return PollingWatcher(self.artwork_path, interval=interval)
+
+    def _forget(self, deleted: Path):
+        # The deleted path may be a directory that was moved away.
+        for path in [p for p in self._pending if p == deleted or deleted in p.parents]:
+            del self._pending[path]
+
+        for path in [p for p in self._paths if p == deleted or deleted in p.parents]:
+            key, _ = self._paths.pop(path)
+            # Keyed by name, files in different directories can share a key.
+            remaining = [content_hash for k, content_hash in self._paths.values() if k == key]
+            if remaining:
+                self.hashes[key] = remaining[-1]
+            else:
+                self.hashes.pop(key, None)
+                self.errors.pop(key, None)
+
+    def _settled(self, now: float) -> List[Path]:
+        # A file settles once it has had no events for the debounce period and its
+        # size and modification time are still what they were at the last event.
+        settled = []
+        for path, (changed_at, last_stat) in list(self._pending.items()):
+            if now - changed_at < self.debounce:
+                continue
+
+            current = _stat(path)
+            if current is None:
+                del self._pending[path]
+            elif current == last_stat:
+                del self._pending[path]
+                settled.append(path)
+            else:
+                self._pending[path] = (now, current)
+
+        return sorted(settled)
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+__all__ = ["ArtworkWatcher", "InotifyWatcher", "PollingWatcher", "is_artwork_file"]
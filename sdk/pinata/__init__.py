@@ -1,9 +1,10 @@
-from pinata.api_key import set_keys_from_prompt
-from pinata.exceptions import PinataMissingAPIKeyError
-from pinata.sdk import Pinata
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from pinata.sdk import AsyncPinata, Pinata
 
-def create_pinata(profile_name: str) -> Pinata:
+
+def create_pinata(profile_name: str) -> "Pinata":
     """
     Get or create a Pinata SDK instance with the given profile name.
     If the profile does not exist, you will be prompted to create one,
@@ -18,16 +19,26 @@ def create_pinata(profile_name: str) -> Pinata:
         :class:`~pinata.sdk.Pinata`
     """
 
+    from pinata.api_key import set_keys_from_prompt
+    from pinata.exceptions import PinataMissingAPIKeyError
+    from pinata.sdk import Pinata
+
     try:
-        pinata = Pinata.from_profile_name(profile_name)
+        return Pinata.from_profile_name(profile_name)
     except PinataMissingAPIKeyError:
         set_keys_from_prompt(profile_name)
-        pinata = Pinata.from_profile_name(profile_name)
-
-    if not pinata:
-        set_keys_from_prompt(profile_name)
 
     return Pinata.from_profile_name(profile_name)
 
 
-__all__ = ["Pinata", "create_pinata"]
+def __getattr__(name: str):
+    # The SDK classes pull in requests and pydantic, so import them on first use.
+    if name in ("AsyncPinata", "Pinata"):
+        from pinata import sdk
+
+        return getattr(sdk, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+__all__ = ["AsyncPinata", "Pinata", "create_pinata"]
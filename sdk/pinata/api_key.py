@@ -1,8 +1,10 @@
+import copy
 import json
-from typing import Dict, List, Tuple
-
-import click
-import keyring
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from pinata.exceptions import PinataMissingAPIKeyError
 
@@ -11,6 +13,10 @@ PINATA_MGMT_KEY = "pinata-mgmt"
 PROFILES_KEY = "profiles"
 DEFAULT_KEY = "default"
 
+API_KEY_ENV_VAR = "PINATA_API_KEY"
+API_SECRET_ENV_VAR = "PINATA_API_SECRET"
+CREDENTIALS_FILE_ENV_VAR = "PINATA_CREDENTIALS_FILE"
+
 
 def set_keys_from_prompt(profile_name: str):
     """
@@ -21,15 +27,24 @@ def set_keys_from_prompt(profile_name: str):
         profile_name (str): The profile name to use.
     """
 
+    import click
+
     api_key = click.prompt("Enter your Pinata API key")
     api_secret = click.prompt("Enter your Pinata API key secret")
     manager = get_key_manager()
     manager.set_key_pair(profile_name, api_key, api_secret)
 
 
+def _keyring():
+    # Importing keyring discovers its backends, which is slow; only pay for it when used.
+    import keyring
+
+    return keyring
+
+
 def _set_mgmt_dict(new_mgmt_dict: Dict):
     new_mgmt_str = json.dumps(new_mgmt_dict)
-    keyring.set_password(SERVICE_NAME, PINATA_MGMT_KEY, new_mgmt_str)
+    _keyring().set_password(SERVICE_NAME, PINATA_MGMT_KEY, new_mgmt_str)
 
 
 def _add_profile_to_mgmt(profile_name: str, mgmt: Dict):
@@ -42,18 +57,65 @@ def _add_profile_to_mgmt(profile_name: str, mgmt: Dict):
 
 
 def _get_password(username: str):
-    return keyring.get_password(SERVICE_NAME, username)
+    return _keyring().get_password(SERVICE_NAME, username)
+
+
+def _key_pair_username(profile_name: str) -> str:
+    return f"{profile_name}-key-pair"
+
+
+def _legacy_usernames(profile_name: str) -> Tuple[str, str]:
+    return f"{profile_name}-api-key", f"{profile_name}-api-secret"
 
 
 def _delete_password(username: str):
-    keyring.delete_password(SERVICE_NAME, username)
+    from keyring.errors import PasswordDeleteError
+
+    try:
+        _keyring().delete_password(SERVICE_NAME, username)
+    except PasswordDeleteError:
+        pass
+
+
+def _get_key_pair_entry(profile_name: str) -> Optional[Tuple[str, str]]:
+    entry = _get_password(_key_pair_username(profile_name))
+    try:
+        api_key, api_secret = json.loads(entry) if entry else (None, None)
+    except (ValueError, TypeError):
+        return None
+
+    return (api_key, api_secret) if api_key and api_secret else None
+
+
+def _set_key_pair_entry(profile_name: str, api_key: str, api_secret: str):
+    entry = json.dumps([api_key, api_secret])
+    _keyring().set_password(SERVICE_NAME, _key_pair_username(profile_name), entry)
 
 
 class KeyringManager:
     """
     A class that manages your API keys. Create API key profiles to use in your scripts.
+    Each key pair is stored in a single keyring entry, so looking a profile up costs one
+    backend read, and is then cached in-process. The separate key and secret entries
+    of older versions are still written, so that they can read the profile too; a
+    profile that only has those is migrated when first read.
     """
 
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._mgmt: Optional[Dict] = None
+        self._key_pairs: Dict[str, Tuple[str, str]] = {}
+
+    def invalidate(self):
+        """
+        Forget all cached credentials, e.g. after the keyring was changed by
+        another process.
+        """
+
+        with self._lock:
+            self._mgmt = None
+            self._key_pairs.clear()
+
     @property
     def mgmt(self) -> Dict:
         """
@@ -63,15 +125,12 @@ class KeyringManager:
         there is at least 1 managed profile name.
         """
 
-        mgmt_str = _get_password(PINATA_MGMT_KEY) or ""
+        with self._lock:
+            if self._mgmt is None:
+                self._mgmt = self._load_mgmt()
 
-        # Initialize the MGMT JSON if it does not already exist.
-        if not mgmt_str:
-            init_mgmt = {PROFILES_KEY: [], DEFAULT_KEY: None}
-            _set_mgmt_dict(init_mgmt)
-            return init_mgmt
+            mgmt_dict = copy.deepcopy(self._mgmt)
 
-        mgmt_dict = json.loads(mgmt_str) if mgmt_str else {}
         if PROFILES_KEY not in mgmt_dict:
             mgmt_dict[PROFILES_KEY] = []
         if DEFAULT_KEY not in mgmt_dict:
@@ -86,6 +145,17 @@ class KeyringManager:
 
         return mgmt_dict
 
+    def _load_mgmt(self) -> Dict:
+        mgmt_str = _get_password(PINATA_MGMT_KEY) or ""
+
+        # Initialize the MGMT JSON if it does not already exist.
+        if not mgmt_str:
+            init_mgmt = {PROFILES_KEY: [], DEFAULT_KEY: None}
+            _set_mgmt_dict(init_mgmt)
+            return init_mgmt
+
+        return json.loads(mgmt_str)
+
     @property
     def profile_names(self) -> List[str]:
         return self.mgmt[PROFILES_KEY]
@@ -105,12 +175,13 @@ class KeyringManager:
             api_key_secret (str): The API secret.
         """
 
-        mgmt = dict(self.mgmt)
-        if profile_name not in mgmt.get(PROFILES_KEY, []):
-            _add_profile_to_mgmt(profile_name, mgmt)
-
-        keyring.set_password(SERVICE_NAME, f"{profile_name}-api-key", api_key)
-        keyring.set_password(SERVICE_NAME, f"{profile_name}-api-secret", api_key_secret)
+        key_username, secret_username = _legacy_usernames(profile_name)
+        with self._lock:
+            self._add_profile(profile_name)
+            _set_key_pair_entry(profile_name, api_key, api_key_secret)
+            _keyring().set_password(SERVICE_NAME, key_username, api_key)
+            _keyring().set_password(SERVICE_NAME, secret_username, api_key_secret)
+            self._key_pairs[profile_name] = (api_key, api_key_secret)
 
     def delete_key_pair(self, profile_name: str):
         """
@@ -120,13 +191,15 @@ class KeyringManager:
             profile_name (str): The API key profile to remove.
         """
 
-        mgmt = dict(self.mgmt)
-        if profile_name in mgmt.get(PROFILES_KEY, []):
-            mgmt[PROFILES_KEY].remove(profile_name)
-            _set_mgmt_dict(mgmt)
+        with self._lock:
+            mgmt = self.mgmt
+            if profile_name in mgmt.get(PROFILES_KEY, []):
+                mgmt[PROFILES_KEY].remove(profile_name)
+                self._set_mgmt(mgmt)
 
-        _delete_password(f"{profile_name}-api-key")
-        _delete_password(f"{profile_name}-api-secret")
+            self._key_pairs.pop(profile_name, None)
+            for username in (_key_pair_username(profile_name), *_legacy_usernames(profile_name)):
+                _delete_password(username)
 
     def get_key_pair(self, profile_name: str) -> Tuple[str, str]:
         """
@@ -139,18 +212,22 @@ class KeyringManager:
             Tuple[str, str]
         """
 
-        api_key = _get_password(f"{profile_name}-api-key")
-        api_secret = _get_password(f"{profile_name}-api-secret")
+        with self._lock:
+            if profile_name in self._key_pairs:
+                return self._key_pairs[profile_name]
 
-        if not api_key or not api_secret:
-            raise PinataMissingAPIKeyError(profile_name)
+            key_pair = _get_key_pair_entry(profile_name)
+            if key_pair is None:
+                # Stored by an older version: read both entries and migrate them.
+                api_key, api_secret = (_get_password(u) for u in _legacy_usernames(profile_name))
+                if not api_key or not api_secret:
+                    raise PinataMissingAPIKeyError(profile_name)
 
-        # Add the profile to MGMT JSON if it for some reason is missing.
-        mgmt = dict(self.mgmt)
-        if api_key and api_secret and profile_name not in mgmt.get(PROFILES_KEY, []):
-            _add_profile_to_mgmt(profile_name, mgmt)
+                key_pair = (api_key, api_secret)
+                _set_key_pair_entry(profile_name, *key_pair)
 
-        return api_key, api_secret
+            self._key_pairs[profile_name] = key_pair
+            return key_pair
 
     def rename_key_pair(self, old_name: str, new_name: str):
         """
@@ -160,19 +237,126 @@ class KeyringManager:
             old_name (str): The name of the profile to change.
             new_name (str): The new name of the profile.
         """
-        api_key, api_secret = self.get_key_pair(old_name)
-        self.set_key_pair(new_name, api_key, api_secret)
-        self.delete_key_pair(old_name)
+        with self._lock:
+            was_default = self.default_profile_name == old_name
+            api_key, api_secret = self.get_key_pair(old_name)
+            self.set_key_pair(new_name, api_key, api_secret)
+            self.delete_key_pair(old_name)
+
+            # Change the default if needed.
+            if was_default:
+                mgmt = self.mgmt
+                mgmt[DEFAULT_KEY] = new_name
+                self._set_mgmt(mgmt)
+
+    def _add_profile(self, profile_name: str):
+        mgmt = self.mgmt
+        if profile_name not in mgmt.get(PROFILES_KEY, []):
+            _add_profile_to_mgmt(profile_name, mgmt)
+            self._mgmt = mgmt
+
+    def _set_mgmt(self, mgmt: Dict):
+        _set_mgmt_dict(mgmt)
+        self._mgmt = mgmt
+
+
+class EnvironmentKeyProvider:
+    """
+    Reads API keys from environment variables, for headless workers without a keyring.
+    ``PINATA_API_KEY_<PROFILE>`` and ``PINATA_API_SECRET_<PROFILE>`` (the profile name
+    upper-cased, with other characters replaced by ``_``) take precedence over
+    ``PINATA_API_KEY`` and ``PINATA_API_SECRET``, which apply to every profile.
+    """
+
+    def get_key_pair(self, profile_name: str) -> Optional[Tuple[str, str]]:
+        suffix = re.sub(r"[^A-Z0-9]", "_", profile_name.upper())
+        for key_var, secret_var in (
+            (f"{API_KEY_ENV_VAR}_{suffix}", f"{API_SECRET_ENV_VAR}_{suffix}"),
+            (API_KEY_ENV_VAR, API_SECRET_ENV_VAR),
+        ):
+            api_key = os.environ.get(key_var)
+            api_secret = os.environ.get(secret_var)
+            if api_key and api_secret:
+                return api_key, api_secret
+
+        return None
+
+
+class FileKeyProvider:
+    """
+    Reads API keys from a JSON file mapping profile names to key pairs, such as
+    ``{"my-profile": {"api_key": "...", "api_secret": "..."}}``. The file is read
+    once.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._profiles: Optional[Dict] = None
+
+    def get_key_pair(self, profile_name: str) -> Optional[Tuple[str, str]]:
+        if self._profiles is None:
+            self._profiles = json.loads(self.path.read_text())
+
+        profile = self._profiles.get(profile_name)
+        if not profile or not profile.get("api_key") or not profile.get("api_secret"):
+            return None
+
+        return profile["api_key"], profile["api_secret"]
+
+
+_key_manager: Optional[KeyringManager] = None
+_file_providers: Dict[str, FileKeyProvider] = {}
+
+
+def get_key_manager() -> KeyringManager:
+    """
+    Get the process-wide :class:`~pinata.api_key.KeyringManager`, which caches what
+    it reads from the keyring.
+    """
+
+    global _key_manager
+    if _key_manager is None:
+        _key_manager = KeyringManager()
+
+    return _key_manager
+
+
+def resolve_key_pair(profile_name: str) -> Tuple[str, str]:
+    """
+    Get the API key pair for a profile from the first provider that has it: the
+    environment, the JSON file named by ``PINATA_CREDENTIALS_FILE``, then the keyring.
+
+    Args:
+        profile_name (str): The name of the API key profile.
+
+    Returns:
+        Tuple[str, str]
+
+    Raises:
+        :class:`~pinata.exceptions.PinataMissingAPIKeyError`
+    """
+
+    key_pair = EnvironmentKeyProvider().get_key_pair(profile_name)
+    if key_pair:
+        return key_pair
 
-        # Change the default if needed.
-        if self.default_profile_name == old_name:
-            mgmt = dict(self.mgmt)
-            mgmt[DEFAULT_KEY] = new_name
-            _set_mgmt_dict(mgmt)
+    credentials_file = os.environ.get(CREDENTIALS_FILE_ENV_VAR)
+    if credentials_file:
+        if credentials_file not in _file_providers:
+            _file_providers[credentials_file] = FileKeyProvider(Path(credentials_file))
 
+        key_pair = _file_providers[credentials_file].get_key_pair(profile_name)
+        if key_pair:
+            return key_pair
 
-def get_key_manager():
-    return KeyringManager()
+    return get_key_manager().get_key_pair(profile_name)
 
 
-__all__ = ["get_key_manager", "set_keys_from_prompt"]
+__all__ = [
+    "EnvironmentKeyProvider",
+    "FileKeyProvider",
+    "KeyringManager",
+    "get_key_manager",
+    "resolve_key_pair",
+    "set_keys_from_prompt",
+]
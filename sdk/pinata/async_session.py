@@ -0,0 +1,151 @@
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urljoin
+
+import aiohttp
+
+from pinata.exceptions import get_pinata_http_error_class
+from pinata.logger import logger
+from pinata.response import PinataResponse
+from pinata.scheduler import RequestScheduler
+
+DEFAULT_CONNECTION_LIMIT = 100
+
+
+class _BufferedResponse:
+    """
+    The parts of a fully-read ``aiohttp`` response that
+    :class:`~pinata.response.PinataResponse` needs.
+    """
+
+    def __init__(self, status_code: int, text: str, headers: Dict[str, str]):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+
+class AsyncPinataAPISession:
+    """
+    The ``asyncio`` counterpart of :class:`~pinata.session.PinataAPISession`.
+    All clients created from the same session share one connection pool, and
+    requests are rate limited and retried by the same
+    :class:`~pinata.scheduler.RequestScheduler` policy as the synchronous session.
+    Use it as an async context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        api_secret: str,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        self._url = url
+        self._headers = {
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/json",
+            "User-Agent": "py-pinata",
+            "pinata_api_key": api_key,
+            "pinata_secret_api_key": api_secret,
+        }
+        self._connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=connection_limit)
+
+    @classmethod
+    def from_api_key(
+        cls,
+        api_key: str,
+        api_secret: str,
+        host_address: str = "https://api.pinata.cloud/",
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        scheduler: Optional[RequestScheduler] = None,
+    ) -> "AsyncPinataAPISession":
+        return cls(
+            host_address,
+            api_key,
+            api_secret,
+            connection_limit=connection_limit,
+            scheduler=scheduler,
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Created lazily so that it binds to the running event loop.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._connection_limit)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncPinataAPISession":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get(self, url, **kwargs) -> PinataResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, data=None, json=None, **kwargs) -> PinataResponse:
+        return await self.request("POST", url, data=data, json=json, **kwargs)
+
+    async def delete(self, url, **kwargs) -> PinataResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def request(
+        self, method, url, params=None, data=None, json=None, headers=None, timeout=60
+    ) -> PinataResponse:
+        url = urljoin(self._url, url)
+        logger.debug(f"{method.ljust(8)}{url}")
+        attempt = 0
+        while True:
+            # Streamed bodies are encoded afresh for every attempt.
+            body = data.aiter_chunks() if hasattr(data, "aiter_chunks") else data
+            async with self.scheduler.async_slot() as slot:
+                try:
+                    async with self.session.request(
+                        method,
+                        url,
+                        params=params,
+                        data=body,
+                        json=json,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                    ) as response:
+                        status = response.status
+                        response_headers = response.headers
+                        text = await response.text(encoding="utf-8")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    delay = self.scheduler.retry_delay(method, attempt)
+                    if delay is None:
+                        raise
+                else:
+                    slot.throttled = status == 429
+                    delay = (
+                        self.scheduler.retry_delay(method, attempt, status, response_headers)
+                        if status >= 400
+                        else None
+                    )
+                    if delay is None:
+                        break
+
+            logger.debug(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1}).")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        logger.debug(f"Response status: {status}")
+        if 200 <= status <= 399:
+            return PinataResponse(_BufferedResponse(status, text, response_headers))
+
+        error_cls = get_pinata_http_error_class(status)
+        raise error_cls(f"{status} Error for url: {url} ({text})")
+
+
+__all__ = ["AsyncPinataAPISession"]
@@ -1,6 +1,11 @@
+from typing import TYPE_CHECKING
+
 from pinata.response import PinataResponse
 from pinata.session import PinataAPISession
 
+if TYPE_CHECKING:
+    from pinata.async_session import AsyncPinataAPISession
+
 
 class PinataClient:
     def __init__(self, session: PinataAPISession, api_namespace: str):
@@ -20,4 +25,22 @@ class PinataClient:
         return f"/{self._prefix}/{uri}"
 
 
-__all__ = ["PinataClient"]
+class AsyncPinataClient:
+    def __init__(self, session: "AsyncPinataAPISession", api_namespace: str):
+        self.session = session
+        self._prefix = api_namespace
+
+    async def _post(self, uri, *args, **kwargs) -> PinataResponse:
+        return await self.session.post(self._uri(uri), *args, **kwargs)
+
+    async def _get(self, uri, *args, **kwargs) -> PinataResponse:
+        return await self.session.get(self._uri(uri), *args, **kwargs)
+
+    async def _delete(self, uri, *args, **kwargs) -> PinataResponse:
+        return await self.session.delete(self._uri(uri), *args, **kwargs)
+
+    def _uri(self, uri: str) -> str:
+        return f"/{self._prefix}/{uri}"
+
+
+__all__ = ["AsyncPinataClient", "PinataClient"]
@@ -1,9 +1,16 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Optional
 
-from pinata.clients.base import PinataClient
+from pinata.clients.base import AsyncPinataClient, PinataClient
+from pinata.records import PinRecord
 from pinata.response import PinataResponse
 from pinata.session import PinataAPISession
 
+if TYPE_CHECKING:
+    from pinata.async_session import AsyncPinataAPISession
+
+DEFAULT_PAGE_SIZE = 1000  # The maximum page size the pinList endpoint allows.
+
 
 class DataClient(PinataClient):
     def __init__(self, session: PinataAPISession):
@@ -19,6 +26,9 @@ class DataClient(PinataClient):
         pin_size_min: Optional[int] = None,
         pin_size_max: Optional[int] = None,
         status: Optional[str] = None,
+        page_limit: Optional[int] = None,
+        page_offset: Optional[int] = None,
+        stream: bool = False,
     ) -> PinataResponse:
         """
         Search pins.
@@ -42,22 +52,149 @@ class DataClient(PinataClient):
               ``"pinned"`` for just pinned records (hashes that are currently pinned). Pass
               in ``"unpinned"`` for just unpinned records (previous hashes that are no longer
               being pinned on pinata).
+            page_limit (int): The maximum number of records to return in a single page.
+            page_offset (int): The number of records to skip before the returned page.
+            stream (bool): Leave the body unread, so rows can be decoded incrementally
+              with :meth:`~pinata.response.PinataResponse.iter_items`.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        params = _create_search_params(
+            hash_contains=hash_contains,
+            pin_start=pin_start,
+            pin_end=pin_end,
+            unpin_start=unpin_start,
+            unpin_end=unpin_end,
+            pin_size_min=pin_size_min,
+            pin_size_max=pin_size_max,
+            status=status,
+            page_limit=page_limit,
+            page_offset=page_offset,
+        )
+        return self._get("pinList", params=params, stream=stream)
+
+    def search_pins_iter(
+        self, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False, **filters
+    ) -> Iterator[PinRecord]:
+        """
+        Lazily page through every pin record matching the given filters.
+        Pages are streamed and each row is decoded into a record as soon as it
+        arrives, so neither the response text nor the raw rows are ever held.
+        When prefetching, the next page is decoded in the background instead.
+
+        Args:
+            page_size (int): The number of records to request per page.
+            prefetch (bool): Request the next page in the background while
+              the current page is being consumed.
+            **filters: Keyword arguments accepted by :meth:`search_pins`.
+
+        Returns:
+            Iterator[:class:`~pinata.records.PinRecord`]
+        """
+
+        def stream_page(offset: int) -> Iterator[PinRecord]:
+            response = self.search_pins(
+                page_limit=page_size, page_offset=offset, stream=True, **filters
+            )
+            for row in response.iter_items("rows"):
+                yield PinRecord.from_row(row)
+
+        def fetch(offset: int) -> List[PinRecord]:
+            return list(stream_page(offset))
+
+        if not prefetch:
+            offset = 0
+            while True:
+                count = 0
+                for record in stream_page(offset):
+                    count += 1
+                    yield record
+
+                if count < page_size:
+                    return
+
+                offset += page_size
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            next_page = executor.submit(fetch, offset)
+            while True:
+                rows = next_page.result()
+                offset += page_size
+                if len(rows) < page_size:
+                    yield from rows
+                    return
+
+                next_page = executor.submit(fetch, offset)
+                yield from rows
+
+
+class AsyncDataClient(AsyncPinataClient):
+    def __init__(self, session: "AsyncPinataAPISession"):
+        super().__init__(session, "data")
+
+    async def search_pins(self, **kwargs) -> PinataResponse:
+        """
+        Search pins. Accepts the same keyword arguments as
+        :meth:`~pinata.clients.data.DataClient.search_pins`.
 
         Returns:
             :class:`~pinata.response.PinataResponse`
         """
-        params = {
-            "hashContains": hash_contains,
-            "pinStart": pin_start,
-            "pinEnd": pin_end,
-            "unpinStart": unpin_start,
-            "unpinEnd": unpin_end,
-            "pinSizeMin": pin_size_min,
-            "pinSizeMax": pin_size_max,
-            "status": status,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        return self._get("pinList", params=params)
-
-
-__all__ = ["DataClient"]
+        return await self._get("pinList", params=_create_search_params(**kwargs))
+
+    async def search_pins_iter(
+        self, page_size: int = DEFAULT_PAGE_SIZE, **filters
+    ) -> AsyncIterator[PinRecord]:
+        """
+        Lazily page through every pin record matching the given filters.
+
+        Args:
+            page_size (int): The number of records to request per page.
+            **filters: Keyword arguments accepted by :meth:`search_pins`.
+
+        Returns:
+            AsyncIterator[:class:`~pinata.records.PinRecord`]
+        """
+        offset = 0
+        while True:
+            response = await self.search_pins(page_limit=page_size, page_offset=offset, **filters)
+            rows = response["rows"]
+            for row in rows:
+                yield PinRecord.from_row(row)
+
+            if len(rows) < page_size:
+                return
+
+            offset += page_size
+
+
+def _create_search_params(
+    hash_contains: Optional[str] = None,
+    pin_start: Optional[str] = None,
+    pin_end: Optional[str] = None,
+    unpin_start: Optional[str] = None,
+    unpin_end: Optional[str] = None,
+    pin_size_min: Optional[int] = None,
+    pin_size_max: Optional[int] = None,
+    status: Optional[str] = None,
+    page_limit: Optional[int] = None,
+    page_offset: Optional[int] = None,
+) -> Dict:
+    params = {
+        "hashContains": hash_contains,
+        "pinStart": pin_start,
+        "pinEnd": pin_end,
+        "unpinStart": unpin_start,
+        "unpinEnd": unpin_end,
+        "pinSizeMin": pin_size_min,
+        "pinSizeMax": pin_size_max,
+        "status": status,
+        "pageLimit": page_limit,
+        "pageOffset": page_offset,
+    }
+    return {k: v for k, v in params.items() if v is not None}
+
+
+__all__ = ["AsyncDataClient", "DataClient"]
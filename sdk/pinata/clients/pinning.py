@@ -1,11 +1,15 @@
 from pathlib import Path
-from typing import IO, Dict, Union
+from typing import IO, TYPE_CHECKING, Dict, Sequence, Tuple, Union
 
-from pinata.clients.base import PinataClient
+from pinata.clients.base import AsyncPinataClient, PinataClient
+from pinata.multipart import MultipartEncoder
 from pinata.response import PinataResponse
 from pinata.session import PinataAPISession
 from pinata.utils import json_to_dict
 
+if TYPE_CHECKING:
+    from pinata.async_session import AsyncPinataAPISession
+
 
 class PinningClient(PinataClient):
     def __init__(self, session: PinataAPISession):
@@ -14,6 +18,8 @@ class PinningClient(PinataClient):
     def pin_file(self, file_path: Path) -> PinataResponse:
         """
         Add and pin any file, or directory, to Pinata's IPFS nodes.
+        Directories are uploaded recursively. The request body is streamed,
+        opening each file only while it is being sent.
 
         Args:
             file_path (pathlib.Path): The path to the file to pin.
@@ -21,13 +27,28 @@ class PinningClient(PinataClient):
         Returns:
             :class:`~pinata.response.PinataResponse`
         """
-        paths = [f for f in file_path.iterdir()] if file_path.is_dir() else [file_path]
-        files = (
-            [("file", (str(path), open(path, "rb"))) for path in paths]
+        encoder = (
+            MultipartEncoder.from_directory(file_path)
             if file_path.is_dir()
-            else [("file", open(path, "rb")) for path in paths]
+            else MultipartEncoder.from_file(file_path)
         )
-        return self._post("pinFileToIPFS", files=files)
+        return self._post("pinFileToIPFS", data=encoder, headers=encoder.headers)
+
+    def pin_directory(
+        self, directory_name: str, files: Sequence[Tuple[str, bytes]]
+    ) -> PinataResponse:
+        """
+        Add and pin a directory made of in-memory files, without writing them to disk.
+
+        Args:
+            directory_name (str): The name of the directory.
+            files (Sequence[Tuple[str, bytes]]): Pairs of relative file paths and contents.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        encoder = MultipartEncoder([(f"{directory_name}/{n}", c) for n, c in files])
+        return self._post("pinFileToIPFS", data=encoder, headers=encoder.headers)
 
     def pin_json(self, json_arg: Union[Path, IO, Dict]) -> PinataResponse:
         """
@@ -74,4 +95,82 @@ class PinningClient(PinataClient):
         return self._delete(f"unpin/{content_hash}")
 
 
-__all__ = ["PinningClient"]
+class AsyncPinningClient(AsyncPinataClient):
+    def __init__(self, session: "AsyncPinataAPISession"):
+        super().__init__(session, "pinning")
+
+    async def pin_file(self, file_path: Path) -> PinataResponse:
+        """
+        Add and pin any file, or directory, to Pinata's IPFS nodes.
+        Directories are uploaded recursively. The request body is streamed,
+        opening each file only while it is being sent.
+
+        Args:
+            file_path (pathlib.Path): The path to the file to pin.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        encoder = (
+            MultipartEncoder.from_directory(file_path)
+            if file_path.is_dir()
+            else MultipartEncoder.from_file(file_path)
+        )
+        return await self._post("pinFileToIPFS", data=encoder, headers=encoder.headers)
+
+    async def pin_directory(
+        self, directory_name: str, files: Sequence[Tuple[str, bytes]]
+    ) -> PinataResponse:
+        """
+        Add and pin a directory made of in-memory files, without writing them to disk.
+
+        Args:
+            directory_name (str): The name of the directory.
+            files (Sequence[Tuple[str, bytes]]): Pairs of relative file paths and contents.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        encoder = MultipartEncoder([(f"{directory_name}/{n}", c) for n, c in files])
+        return await self._post("pinFileToIPFS", data=encoder, headers=encoder.headers)
+
+    async def pin_json(self, json_arg: Union[Path, IO, Dict]) -> PinataResponse:
+        """
+        Add and pin any JSON object to Pinata's IPFS nodes.
+
+        Args:
+            json_arg (pathlib.Path): Either the path to a JSON file, a python dictionary,
+              or an IO stream of an opened JSON file.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        data = {"pinataContent": json_to_dict(json_arg)}
+        return await self._post("pinJSONToIPFS", json=data)
+
+    async def pin_hash(self, hash_: str) -> PinataResponse:
+        """
+        Add a hash to Pinata for asynchronous pinning.
+
+        Args:
+            hash_: The hash to pin.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        return await self._post("addHashToPinQueue", json={"hashToPin": hash_})
+
+    async def unpin(self, content_hash: str) -> PinataResponse:
+        """
+        Unpin content previously uploaded to Pinata's IPFS nodes.
+
+        Args:
+            content_hash (str): The hash of the content to stop pinning.
+
+        Returns:
+            :class:`~pinata.response.PinataResponse`
+        """
+        return await self._delete(f"unpin/{content_hash}")
+
+
+__all__ = ["AsyncPinningClient", "PinningClient"]
@@ -1,4 +1,4 @@
-from typing import Dict, Union
+from typing import Dict, Type, Union
 
 from requests.exceptions import HTTPError
 
@@ -98,22 +98,30 @@ class NoContentError(PinataException):
         super().__init__(f"No pinned content found with hash '{content_hash}'.")
 
 
+def get_pinata_http_error_class(status_code: int) -> Type[PinataHTTPError]:
+    """
+    Get the :class:`pinata.exceptions.PinataHTTPError` subclass for an HTTP status code.
+    """
+    if status_code == 400:
+        return PinataBadRequestError
+    elif status_code == 401:
+        return PinataUnauthorizedError
+    elif status_code == 403:
+        return PinataForbiddenError
+    elif status_code == 404:
+        return PinataNotFoundError
+    elif status_code == 429:
+        return PinataTooManyRequestsError
+    elif 500 <= status_code < 600:
+        return PinataInternalServiceError
+    else:
+        return PinataHTTPError
+
+
 def raise_pinata_http_error(raised_error: HTTPError):
     """
     Raise the appropriate :class:`pinata.exceptions.PinataHTTPError` based on the given
     HTTPError's response status code.
     """
-    if raised_error.response.status_code == 400:
-        raise PinataBadRequestError(raised_error)
-    elif raised_error.response.status_code == 401:
-        raise PinataUnauthorizedError(raised_error)
-    elif raised_error.response.status_code == 403:
-        raise PinataForbiddenError(raised_error)
-    elif raised_error.response.status_code == 404:
-        raise PinataNotFoundError(raised_error)
-    elif raised_error.response.status_code == 429:
-        raise PinataTooManyRequestsError(raised_error)
-    elif 500 <= raised_error.response.status_code < 600:
-        raise PinataInternalServiceError(raised_error)
-    else:
-        raise PinataHTTPError(raised_error)
+    error_cls = get_pinata_http_error_class(raised_error.response.status_code)
+    raise error_cls(raised_error)
@@ -0,0 +1,229 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from nft_project import Pin
+
+DEFAULT_INDEX_TTL = 300.0
+
+
+class PinIndex:
+    """
+    An in-process index of pinned content, mapping file names to content hashes
+    and content hashes to pin records. The index is built from a single pin listing
+    and kept up-to-date in place as content is pinned and unpinned. It is rebuilt
+    from a fresh listing once it is older than its TTL or after :meth:`invalidate`.
+    Only one listing runs at a time: concurrent lookups on a stale index wait for
+    it, and pins added or removed while it runs are kept.
+    """
+
+    def __init__(
+        self,
+        load_pins: Optional[Callable[[], Iterable[Pin]]] = None,
+        ttl: Optional[float] = DEFAULT_INDEX_TTL,
+    ):
+        self._load_pins = load_pins
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()  # Held while listing.
+        # Pins added (or removed, as None) since the current listing started.
+        self._changes: Optional[Dict[str, Optional[Pin]]] = None
+        self._names: Dict[str, List[str]] = {}
+        self._pins: Dict[str, Pin] = {}
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        ``True`` when the index has never been loaded or when it is older than its TTL.
+        A TTL of ``None`` means the index never goes stale on its own.
+        """
+
+        if self._loaded_at is None:
+            return True
+        elif self._ttl is None:
+            return False
+
+        return time.monotonic() - self._loaded_at > self._ttl
+
+    def refresh(self):
+        """
+        Rebuild the index from a single pin listing.
+        """
+
+        if self._load_pins is None:
+            raise ValueError("Index has no pin source; use 'load()' instead.")
+
+        with self._load_lock:
+            self._list_and_load()
+
+    def begin_load(self):
+        """
+        Start keeping track of pins added and removed from now on, so that a
+        following :meth:`load` of a listing fetched meanwhile does not lose them.
+        """
+
+        with self._lock:
+            if self._changes is None:
+                self._changes = {}
+
+    def cancel_load(self):
+        """
+        Stop keeping track of changes after a listing started with
+        :meth:`begin_load` failed.
+        """
+
+        with self._lock:
+            self._changes = None
+
+    def load(self, pins: Iterable[Pin]):
+        """
+        Rebuild the index from an already-fetched pin listing. Pins added or removed
+        since :meth:`begin_load` are applied on top of the listing.
+
+        Args:
+            pins (Iterable[``Pin``]): Every pin, newest first.
+        """
+
+        with self._lock:
+            self._names = {}
+            self._pins = {}
+            for pin in pins:
+                # Listings are newest-first; keep that order so the first hash wins.
+                self._pins[pin.content_hash] = pin
+                self._names.setdefault(pin.file_name, []).append(pin.content_hash)
+
+            changes, self._changes = self._changes or {}, None
+            for content_hash, changed_pin in changes.items():
+                self._discard(content_hash)
+                if changed_pin is not None:
+                    self._insert(changed_pin)
+
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Mark the index as stale so that the next lookup rebuilds it.
+        """
+
+        with self._lock:
+            self._loaded_at = None
+
+    def get_hash(self, file_name: str) -> Optional[str]:
+        """
+        Get the most recently pinned content hash for a file name.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            Optional[str]: The content IPFS hash str.
+        """
+
+        self._ensure_loaded()
+        with self._lock:
+            hashes = self._names.get(file_name)
+            return hashes[0] if hashes else None
+
+    def get_hashes(self, file_name: str) -> List[str]:
+        """
+        Get every pinned content hash for a file name, newest first.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            List[str]
+        """
+
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._names.get(file_name, []))
+
+    def get_pin(self, content_hash: str) -> Optional[Pin]:
+        """
+        Get the pin record for a content hash.
+
+        Args:
+            content_hash (str): The content IPFS hash.
+
+        Returns:
+            Optional[``Pin``]
+        """
+
+        self._ensure_loaded()
+        with self._lock:
+            return self._pins.get(content_hash)
+
+    def add(self, pin: Pin):
+        """
+        Record newly pinned content without relisting.
+
+        Args:
+            pin (``Pin``): The pin to add.
+        """
+
+        with self._lock:
+            self._discard(pin.content_hash)
+            self._insert(pin)
+            if self._changes is not None:
+                self._changes.pop(pin.content_hash, None)  # Keep the order of changes.
+                self._changes[pin.content_hash] = pin
+
+    def remove(self, content_hash: str):
+        """
+        Forget unpinned content without relisting.
+
+        Args:
+            content_hash (str): The content IPFS hash that was unpinned.
+        """
+
+        with self._lock:
+            self._discard(content_hash)
+            if self._changes is not None:
+                self._changes.pop(content_hash, None)
+                self._changes[content_hash] = None
+
+    def __contains__(self, content_hash: str) -> bool:
+        return self.get_pin(content_hash) is not None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._pins)
+
+    def _ensure_loaded(self):
+        # Indexes without a pin source are loaded explicitly by their owner.
+        if self._load_pins is not None and self.is_stale:
+            with self._load_lock:
+                # Another thread may have loaded it while this one waited.
+                if self.is_stale:
+                    self._list_and_load()
+
+    def _list_and_load(self):
+        # List without holding '_lock', so lookups and adds are not blocked meanwhile.
+        self.begin_load()
+        try:
+            pins = list(self._load_pins())  # type: ignore
+        except BaseException:
+            self.cancel_load()
+            raise
+
+        self.load(pins)
+
+    def _insert(self, pin: Pin):
+        self._pins[pin.content_hash] = pin
+        self._names.setdefault(pin.file_name, []).insert(0, pin.content_hash)
+
+    def _discard(self, content_hash: str):
+        pin = self._pins.pop(content_hash, None)
+        if pin is None:
+            return
+
+        hashes = self._names.get(pin.file_name, [])
+        if content_hash in hashes:
+            hashes.remove(content_hash)
+        if not hashes:
+            self._names.pop(pin.file_name, None)
+
+
+__all__ = ["PinIndex"]
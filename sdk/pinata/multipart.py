@@ -0,0 +1,205 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pinata.exceptions import PinError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+PartSource = Union[Path, bytes]
+
+
+class MultipartEncoder:
+    """
+    A ``multipart/form-data`` body that is streamed rather than built in memory.
+    Each file is opened only while its own part is being sent, so the number of
+    open file descriptors and the memory used stay constant no matter how many
+    files are uploaded. The total length is computed up front from file sizes, so
+    the body is sent with a ``Content-Length`` header instead of chunked encoding.
+
+    Pass an instance as the ``data`` of a request, along with its :attr:`headers`.
+    """
+
+    def __init__(
+        self,
+        parts: Sequence[Tuple[str, PartSource]],
+        field_name: str = "file",
+        boundary: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.boundary = boundary or uuid.uuid4().hex
+        self._field_name = field_name
+        self._chunk_size = chunk_size
+        self._parts: List[Tuple[bytes, PartSource, int]] = [
+            (self._part_header(file_name), source, _get_size(source)) for file_name, source in parts
+        ]
+        self._closing = f"--{self.boundary}--\r\n".encode()
+        parts_length = sum(len(header) + size + 2 for header, _, size in self._parts)
+        self._length = parts_length + len(self._closing)
+        self.seek(0)
+
+    @classmethod
+    def from_file(cls, file_path: Path, **kwargs) -> "MultipartEncoder":
+        """
+        Create an encoder uploading a single file.
+
+        Args:
+            file_path (pathlib.Path): The path to the file.
+
+        Returns:
+            :class:`~pinata.multipart.MultipartEncoder`
+        """
+
+        return cls([(file_path.name, file_path)], **kwargs)
+
+    @classmethod
+    def from_directory(cls, directory: Path, **kwargs) -> "MultipartEncoder":
+        """
+        Create an encoder uploading every file in a directory, recursively. Each file
+        is named by its path relative to the directory's parent, e.g. ``"folder/a/b.json"``,
+        which is how Pinata recognizes a directory upload.
+
+        Args:
+            directory (pathlib.Path): The path to the directory.
+
+        Returns:
+            :class:`~pinata.multipart.MultipartEncoder`
+        """
+
+        parts = [
+            (f"{directory.name}/{path.relative_to(directory).as_posix()}", path)
+            for path in _walk_files(directory)
+        ]
+        return cls(parts, **kwargs)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._iter_chunks()
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the encoded body from async code, e.g. as ``aiohttp`` request data.
+        Files are opened and read in the event loop's default executor, so that disk
+        reads do not block the loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        for header, source, size in self._parts:
+            yield header
+            if isinstance(source, Path):
+                sent = 0
+                file = await loop.run_in_executor(None, open, source, "rb")
+                try:
+                    while True:
+                        chunk = await loop.run_in_executor(None, file.read, self._chunk_size)
+                        if not chunk:
+                            break
+
+                        sent += len(chunk)
+                        yield chunk
+                finally:
+                    file.close()
+
+                if sent != size:
+                    raise PinError(str(source))
+
+            else:
+                yield source
+
+            yield b"\r\n"
+
+        yield self._closing
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Content-Type": self.content_type, "Content-Length": str(self._length)}
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read up to ``size`` bytes of the encoded body, or all remaining bytes when
+        ``size`` is negative or ``None``.
+        """
+
+        if size is None or size < 0:
+            data = bytes(self._buffer) + b"".join(self._chunks)
+            self._buffer.clear()
+            return data
+
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+
+            self._buffer += chunk
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET):
+        """
+        Rewind the body so it can be sent again, e.g. when retrying a request.
+        Only rewinding to the start is supported.
+        """
+
+        if offset != 0 or whence != os.SEEK_SET:
+            raise ValueError("MultipartEncoder can only be rewound to the start.")
+
+        self._buffer = bytearray()
+        self._chunks = self._iter_chunks()
+
+    def _part_header(self, file_name: str) -> bytes:
+        content_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        quoted_name = file_name.replace("\\", "\\\\").replace('"', "%22")
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self._field_name}"; '
+            f'filename="{quoted_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for header, source, size in self._parts:
+            yield header
+            if isinstance(source, Path):
+                sent = 0
+                with open(source, "rb") as file:
+                    for chunk in iter(lambda: file.read(self._chunk_size), b""):
+                        sent += len(chunk)
+                        yield chunk
+
+                # The Content-Length was already promised, so the file must not change.
+                if sent != size:
+                    raise PinError(str(source))
+
+            else:
+                yield source
+
+            yield b"\r\n"
+
+        yield self._closing
+
+
+def _get_size(source: PartSource) -> int:
+    return source.stat().st_size if isinstance(source, Path) else len(source)
+
+
+def _walk_files(directory: Path) -> Iterator[Path]:
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_dir():
+                yield from _walk_files(Path(entry.path))
+            elif entry.is_file():
+                yield Path(entry.path)
+
+
+__all__ = ["MultipartEncoder"]
@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional
+
+
+class PinRecord:
+    """
+    A pin record from the ``pinList`` endpoint, holding only the fields the SDK uses.
+    """
+
+    __slots__ = ("content_hash", "name", "size", "date_pinned")
+
+    def __init__(
+        self,
+        content_hash: str,
+        name: Optional[str] = None,
+        size: int = 0,
+        date_pinned: Optional[str] = None,
+    ):
+        self.content_hash = content_hash
+        self.name = name
+        self.size = size
+        self.date_pinned = date_pinned
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "PinRecord":
+        metadata = row.get("metadata") or {}
+        return cls(
+            row["ipfs_pin_hash"],
+            name=metadata.get("name"),
+            size=row.get("size") or 0,
+            date_pinned=row.get("date_pinned"),
+        )
+
+    def __repr__(self) -> str:
+        return f"<PinRecord {self.content_hash} name={self.name!r}>"
+
+
+class PinFileResult:
+    """
+    The result of pinning a file, directory or JSON document.
+    """
+
+    __slots__ = ("content_hash", "pin_size", "timestamp", "is_duplicate")
+
+    def __init__(
+        self,
+        content_hash: str,
+        pin_size: int = 0,
+        timestamp: Optional[str] = None,
+        is_duplicate: bool = False,
+    ):
+        self.content_hash = content_hash
+        self.pin_size = pin_size
+        self.timestamp = timestamp
+        self.is_duplicate = is_duplicate
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PinFileResult":
+        return cls(
+            data["IpfsHash"],
+            pin_size=data.get("PinSize") or 0,
+            timestamp=data.get("Timestamp"),
+            is_duplicate=bool(data.get("isDuplicate")),
+        )
+
+    def __repr__(self) -> str:
+        return f"<PinFileResult {self.content_hash}>"
+
+
+class UnpinReport:
+    """
+    The outcome of a bulk unpin, per content hash. Content that was already gone
+    counts as ``not_pinned`` rather than as a failure.
+    """
+
+    __slots__ = ("unpinned", "not_pinned", "failed", "unresolved")
+
+    def __init__(self):
+        self.unpinned: List[str] = []
+        self.not_pinned: List[str] = []
+        self.failed: Dict[str, Exception] = {}
+        self.unresolved: List[str] = []  # Names without any pin.
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def outcomes(self) -> Dict[str, str]:
+        """
+        Each content hash mapped to ``"unpinned"``, ``"not pinned"`` or ``"failed"``.
+        """
+
+        outcomes = {content_hash: "unpinned" for content_hash in self.unpinned}
+        outcomes.update({content_hash: "not pinned" for content_hash in self.not_pinned})
+        outcomes.update({content_hash: "failed" for content_hash in self.failed})
+        return outcomes
+
+    def __repr__(self) -> str:
+        return (
+            f"<UnpinReport unpinned={len(self.unpinned)} not_pinned={len(self.not_pinned)} "
+            f"failed={len(self.failed)}>"
+        )
+
+
+__all__ = ["PinFileResult", "PinRecord", "UnpinReport"]
@@ -1,19 +1,29 @@
+import codecs
 import json
+from typing import Any, Iterable, Iterator
 
 from pinata.exceptions import PinataResponseKeyError
+from pinata.records import PinFileResult
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+_UNSET = object()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
 
 
 class PinataResponse:
     def __init__(self, requests_response):
         self._response = requests_response
-        self._data = None
+        self._data = _UNSET
 
     @property
     def data(self):
-        try:
-            self._data = self._data or json.loads(self._response.text)
-        except ValueError:
-            self._data = self._response.text or ""
+        if self._data is _UNSET:
+            try:
+                self._data = json.loads(self._response.text)
+            except ValueError:
+                self._data = self._response.text or ""
 
         return self._data
 
@@ -23,5 +33,160 @@ class PinataResponse:
         except (KeyError, TypeError):
             raise PinataResponseKeyError(key, self._data)
 
+    def pin_result(self) -> PinFileResult:
+        """
+        Get the typed result of a pinning request.
+
+        Returns:
+            :class:`~pinata.records.PinFileResult`
+        """
+
+        try:
+            return PinFileResult.from_dict(self.data)
+        except (KeyError, TypeError, AttributeError):
+            raise PinataResponseKeyError("IpfsHash", self._data)
+
+    def iter_items(self, key: str, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[Any]:
+        """
+        Incrementally decode the array at ``key`` of a JSON object response, yielding
+        each item as soon as it has been read. The full body is never held in memory
+        when the request was made with ``stream=True``.
+
+        Args:
+            key (str): The top-level key of the array, e.g. ``"rows"``.
+            chunk_size (int): The number of bytes to read at a time.
+
+        Returns:
+            Iterator[Any]: The decoded array items.
+        """
+
+        is_buffered = getattr(self._response, "_content_consumed", True)
+        if self._data is not _UNSET or is_buffered:
+            # Already decoded, or the whole body was already read.
+            yield from self[key]
+            return
+
+        try:
+            yield from iter_json_array(self._response.iter_content(chunk_size), key)
+        finally:
+            self._response.close()
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Incrementally decode the array at ``key`` of a JSON object split across byte
+    chunks. Other top-level values are decoded and skipped.
+
+    Args:
+        chunks (Iterable[bytes]): The UTF-8 encoded JSON document.
+        key (str): The top-level key of the array.
+
+    Returns:
+        Iterator[Any]: The decoded array items.
+    """
+
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.skip_to(_WHITESPACE) == "}":
+        raise PinataResponseKeyError(key, {})
+
+    while True:
+        name = reader.decode()
+        reader.expect(":")
+        if name != key:
+            reader.decode()
+            if reader.expect(",}") == "}":
+                raise PinataResponseKeyError(key, "<streamed>")
+
+            continue
+
+        reader.expect("[")
+        if reader.skip_to(_WHITESPACE) == "]":
+            return
+
+        while True:
+            yield reader.decode()
+            if reader.expect(",]") == "]":
+                return
+
+
+class _ChunkReader:
+    """
+    A cursor over text decoded from byte chunks. Only the unread remainder of the
+    current chunks is buffered.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def skip_to(self, skipped: str) -> str:
+        """
+        Skip characters in ``skipped`` and peek at the next character.
+        """
+
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in skipped:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._read():
+                raise ValueError("Unexpected end of JSON document.")
+
+    def expect(self, characters: str) -> str:
+        character = self.skip_to(_WHITESPACE)
+        if character not in characters:
+            raise ValueError(f"Expected one of '{characters}', got '{character}'.")
+
+        self._position += 1
+        return character
+
+    def decode(self) -> Any:
+        self.skip_to(_WHITESPACE)
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+
+            # A number may continue in the next chunk.
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if (
+                is_number
+                and not self._exhausted
+                and _NUMBER_CHARACTERS.issuperset(self._buffer[end:])
+            ):
+                # Reading moves the buffer, so decode again either way.
+                self._read()
+                continue
+
+            self._position = end
+            return value
+
+    def _read(self) -> bool:
+        if self._exhausted:
+            return False
+
+        # Drop what has been consumed so memory stays bounded by the largest value.
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+
+        self._exhausted = True
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        return False
+
 
-__all__ = ["PinataResponse"]
+__all__ = ["PinataResponse", "iter_json_array"]
@@ -0,0 +1,303 @@
+import asyncio
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Iterator, List, Mapping, Optional, Tuple
+
+# Pinata's documented limit for most plans.
+DEFAULT_REQUESTS_PER_MINUTE = 180
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 5
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+TRANSIENT_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Tokens refill continuously at ``rate`` per second
+    up to ``capacity``; :meth:`acquire` blocks until a token is available. The rate
+    adapts between ``min_rate`` and ``max_rate`` (the starting rate): it halves with
+    :meth:`decrease` and grows back by a fixed step with :meth:`increase`.
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: Optional[float] = None):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min(rate, min_rate if min_rate is not None else rate / 16)
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased = False
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        wait = self._take()
+        while wait:
+            time.sleep(wait)
+            wait = self._take()
+
+    async def acquire_async(self):
+        """
+        Like :meth:`acquire`, but waits without blocking the event loop.
+        """
+
+        wait = self._take()
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self._take()
+
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for ``seconds``, e.g. after the server asked us to
+        back off, and start again from an empty bucket.
+        """
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+    def decrease(self):
+        """
+        Halve the refill rate, e.g. after being throttled. Until the next
+        :meth:`increase`, further calls do nothing, so that a burst of throttled
+        requests counts once.
+        """
+
+        with self._lock:
+            if not self._decreased:
+                self._refill(time.monotonic())
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._decreased = True
+
+    def increase(self, step: float):
+        """
+        Raise the refill rate by ``step`` tokens per second, up to ``max_rate``.
+        """
+
+        with self._lock:
+            self._decreased = False
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + step)
+
+    def _take(self) -> float:
+        # Take a token, or return how long to wait before trying again.
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return max(self._paused_until - now, (1 - self._tokens) / self.rate)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class AIMDWindow:
+    """
+    A concurrency window with additive increase and multiplicative decrease.
+    Each success grows the window by ``1 / size`` (about one slot per window of
+    successes) and each throttle halves it, so the number of requests in flight
+    converges on what the server can take. The window starts at ``initial_size``,
+    by default half of ``max_size``, and only grows while requests succeed.
+    """
+
+    def __init__(self, max_size: int, min_size: int = 1, initial_size: Optional[float] = None):
+        self.max_size = max(min_size, max_size)
+        self.min_size = min_size
+        if initial_size is None:
+            initial_size = self.max_size / 2
+
+        self.size = float(min(self.max_size, max(self.min_size, initial_size)))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.size):
+                self._condition.wait()
+
+            self.in_flight += 1
+
+    async def acquire_async(self):
+        """
+        Like :meth:`acquire`, but waits without blocking the event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.in_flight < int(self.size):
+                    self.in_flight += 1
+                    return
+
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+
+            await waiter
+
+    def release(self, throttled: bool = False):
+        with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.size = max(self.min_size, self.size / 2)
+            else:
+                self.size = min(self.max_size, self.size + 1 / self.size)
+
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+
+class RequestScheduler:
+    """
+    Decides when requests may be sent and whether failed ones are retried. Requests
+    wait for both a rate-limit token and a concurrency slot. Throttled requests
+    (``429``) are always retried, honoring ``Retry-After``; transient server errors
+    and connection failures are retried for idempotent methods only, using
+    jittered exponential backoff.
+
+    ``requests_per_minute`` is the most that is ever sent. Each throttle pauses the
+    rate limit for ``Retry-After`` and halves its rate and the concurrency window;
+    each success grows them back, by a quarter request per minute and by about one
+    slot per window of successes, so that both settle just under the account's real
+    limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        # Any minute admits at most the burst plus a minute of refills, so the refill
+        # rate leaves room for the burst: no rolling one-minute window goes over the
+        # limit (for limits of at least two requests per minute).
+        burst = max(1.0, requests_per_minute / 20)
+        rate = max(1.0, requests_per_minute - burst) / 60
+        self.bucket = TokenBucket(rate, capacity=burst)
+        self.window = AIMDWindow(max_concurrency)
+        self.rate_step = 0.25 / 60  # A request per minute for every four successes.
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    @contextmanager
+    def slot(self) -> Iterator["_SlotOutcome"]:
+        """
+        Wait for a token and a concurrency slot for the duration of one attempt.
+        Set ``throttled`` on the yielded outcome when the attempt was throttled.
+        """
+
+        self.bucket.acquire()
+        self.window.acquire()
+        outcome = _SlotOutcome()
+        try:
+            yield outcome
+        finally:
+            self._release(outcome)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator["_SlotOutcome"]:
+        """
+        Like :meth:`slot`, for requests sent from an event loop.
+        """
+
+        await self.bucket.acquire_async()
+        await self.window.acquire_async()
+        outcome = _SlotOutcome()
+        try:
+            yield outcome
+        finally:
+            self._release(outcome)
+
+    def _release(self, outcome: "_SlotOutcome"):
+        self.window.release(throttled=outcome.throttled)
+        if outcome.throttled:
+            self.bucket.decrease()
+        else:
+            self.bucket.increase(self.rate_step)
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Get the number of seconds to wait before retrying, or ``None`` when the
+        attempt should not be retried. A ``status_code`` of ``None`` means the
+        request failed to connect or timed out.
+
+        Args:
+            method (str): The HTTP method.
+            attempt (int): The number of attempts already retried.
+            status_code (Optional[int]): The response status code.
+            headers (Optional[Mapping[str, str]]): The response headers.
+
+        Returns:
+            Optional[float]
+        """
+
+        if attempt >= self.max_retries:
+            return None
+
+        delay = min(self.max_backoff, self.backoff * 2**attempt) * random.uniform(0.5, 1.5)
+        if status_code == 429:
+            retry_after = _parse_retry_after((headers or {}).get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+            self.bucket.pause(delay)
+            return delay
+
+        is_transient = status_code is None or status_code in TRANSIENT_STATUS_CODES
+        if is_transient and method.upper() in IDEMPOTENT_METHODS:
+            return delay
+
+        return None
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _SlotOutcome:
+    __slots__ = ("throttled",)
+
+    def __init__(self):
+        self.throttled = False
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+__all__ = ["AIMDWindow", "RequestScheduler", "TokenBucket"]
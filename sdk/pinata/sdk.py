@@ -1,38 +1,60 @@
+import asyncio
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from nft_project import IPinning, Pin
-from pinata.api_key import get_key_manager
-from pinata.clients.data import DataClient
-from pinata.clients.pinning import PinningClient
+from nft_project import IAsyncPinning, IPinning, Pin
+from nft_project.concurrency import run_bounded
+from pinata.api_key import resolve_key_pair
+from pinata.clients.data import DEFAULT_PAGE_SIZE, AsyncDataClient, DataClient
+from pinata.clients.pinning import AsyncPinningClient, PinningClient
 from pinata.exceptions import (
     NoContentError,
     PinataBadRequestError,
+    PinataHTTPError,
     PinataInternalServiceError,
+    PinataNotFoundError,
     PinError,
 )
+from pinata.index import DEFAULT_INDEX_TTL, PinIndex
+from pinata.records import PinRecord, UnpinReport
 from pinata.session import PinataAPISession
 
+DEFAULT_UNPIN_WORKERS = 8
+
+# The errors 'unpin()' ignores when asked to; only some mean "not pinned".
+UNPIN_ERRORS = (PinataBadRequestError, PinataNotFoundError, PinataInternalServiceError)
+# Pinata answers 500 with this reason when the content is not pinned.
+NOT_PINNED_REASON = "CURRENT_USER_HAS_NOT_PINNED_CID"
+
 
 class Pinata(IPinning):
-    def __init__(self, pinning_client: PinningClient, data_client: DataClient):
+    # The session's scheduler already retries throttled requests.
+    throttle_errors = ()
+
+    def __init__(
+        self,
+        pinning_client: PinningClient,
+        data_client: DataClient,
+        index_ttl: Optional[float] = DEFAULT_INDEX_TTL,
+    ):
         self.pinning = pinning_client
         self.data = data_client
+        self.index = PinIndex(self.iter_pins, ttl=index_ttl)
 
     @classmethod
-    def from_profile_name(cls, profile_name: str) -> "Pinata":
+    def from_profile_name(cls, profile_name: str, **kwargs) -> "Pinata":
         """
         Create an instance of the Pinata SDK from a stored profile name.
 
         Args:
             profile_name (str): The name of the API key profile to use.
+            **kwargs: Additional keyword arguments for :meth:`from_api_key`.
         """
-        key_manager = get_key_manager()
-        api_key, api_secret = key_manager.get_key_pair(profile_name)
-        return cls.from_api_key(api_key, api_secret)
+        api_key, api_secret = resolve_key_pair(profile_name)
+        return cls.from_api_key(api_key, api_secret, **kwargs)
 
     @classmethod
-    def from_api_key(cls, api_key: str, api_secret: str) -> "Pinata":
+    def from_api_key(cls, api_key: str, api_secret: str, **kwargs) -> "Pinata":
         """
         Create an instance of the Pinata SDK from an API key.
         `Guide on API key <https://docs.pinata.cloud/user/generate-api-key>`__.
@@ -40,8 +62,11 @@ class Pinata(IPinning):
         Args:
             api_key (str): The API key.
             api_secret (str): The API secret.
+            **kwargs: Additional keyword arguments for
+              :meth:`~pinata.session.PinataAPISession.from_api_key`, such as
+              ``concurrency`` or ``http2``.
         """
-        session = PinataAPISession.from_api_key(api_key, api_secret)
+        session = PinataAPISession.from_api_key(api_key, api_secret, **kwargs)
         pinning_client = PinningClient(session)
         data_client = DataClient(session)
         return cls(pinning_client, data_client)
@@ -54,27 +79,59 @@ class Pinata(IPinning):
             List[``Pin``]
         """
 
-        pins = self.data.search_pins(status="pinned")["rows"]
-        return [Pin(content_hash=p["ipfs_pin_hash"], file_name=p["metadata"]["name"]) for p in pins]
+        return list(self.iter_pins())
+
+    def iter_pins(self, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True) -> Iterator[Pin]:
+        """
+        Lazily iterate over all pins, one page at a time.
+
+        Args:
+            page_size (int): The number of pins to request per page.
+            prefetch (bool): Request the next page in the background while
+              the current page is being consumed.
 
-    def get_hash(self, file_name: str) -> Optional[str]:
+        Returns:
+            Iterator[``Pin``]
+        """
+
+        records = self.data.search_pins_iter(
+            page_size=page_size, prefetch=prefetch, status="pinned"
+        )
+        for record in records:
+            yield _to_pin(record)
+
+    def get_hash(self, file_name: str, refresh: bool = False) -> Optional[str]:
         """
         Get the hash of a pinned file by file name.
-        **NOTE**: Returns the first hash it finds for the given name.
+        **NOTE**: Returns the most recent hash it finds for the given name.
+        Lookups use the local :class:`~pinata.index.PinIndex`, which only lists
+        pins when it is first used or has expired.
 
         Args:
             file_name (str): The name of the file.
+            refresh (bool): Rebuild the pin index from a fresh listing first.
 
         Returns:
             Optional[str]: The content IPFS hash str.
         """
 
-        pins = self.get_pins()
-        for pin in pins:
-            if pin.file_name == file_name:
-                return pin.content_hash
+        if refresh:
+            self.index.refresh()
+
+        return self.index.get_hash(file_name)
+
+    def get_pin(self, content_hash: str) -> Optional[Pin]:
+        """
+        Get the pin for a content hash from the local pin index.
+
+        Args:
+            content_hash (str): The content IPFS hash.
+
+        Returns:
+            Optional[``Pin``]
+        """
 
-        return None
+        return self.index.get_pin(content_hash)
 
     def pin_file(self, file_path: Path) -> str:
         """
@@ -95,7 +152,31 @@ class Pinata(IPinning):
         except PinataBadRequestError as err:
             raise PinError(file_path) from err
 
-        return response.data["IpfsHash"]
+        content_hash = response.pin_result().content_hash
+        self.index.add(Pin(content_hash=content_hash, file_name=file_path.name))
+        return content_hash
+
+    def pin_directory(self, directory_name: str, files: Sequence[Tuple[str, bytes]]) -> str:
+        """
+        Add and pin a directory made of in-memory files. The files are streamed
+        straight into the upload; nothing is written to disk.
+
+        Args:
+            directory_name (str): The name of the directory.
+            files (Sequence[Tuple[str, bytes]]): Pairs of relative file paths and contents.
+
+        Returns:
+            str: The content IPFS hash of the directory.
+        """
+
+        try:
+            response = self.pinning.pin_directory(directory_name, files)
+        except PinataBadRequestError as err:
+            raise PinError(directory_name) from err
+
+        content_hash = response.pin_result().content_hash
+        self.index.add(Pin(content_hash=content_hash, file_name=directory_name))
+        return content_hash
 
     def unpin(self, content_hash: str, ignore_errors: bool = False):
         """
@@ -110,8 +191,266 @@ class Pinata(IPinning):
         """
         try:
             self.pinning.unpin(content_hash)
-        except PinataInternalServiceError as err:
+        except UNPIN_ERRORS as err:
+            is_not_pinned = _is_not_pinned(err)
+            if not (is_not_pinned or ignore_errors):
+                raise
+
+            self.index.remove(content_hash)
+            if ignore_errors:
+                return
+
+            raise NoContentError(content_hash) from err
+
+        self.index.remove(content_hash)
+
+    def unpin_many(
+        self, content_hashes: Iterable[str], max_workers: int = DEFAULT_UNPIN_WORKERS
+    ) -> UnpinReport:
+        """
+        Unpin many content hashes concurrently. Requests go through the session's
+        scheduler, so its rate limit applies and throttled requests are retried after
+        ``Retry-After``; when retries run out, fewer unpins are kept in flight.
+
+        Args:
+            content_hashes (Iterable[str]): The hashes of the content to stop pinning.
+            max_workers (int): The maximum number of unpins in flight.
+
+        Returns:
+            :class:`~pinata.records.UnpinReport`
+        """
+
+        content_hashes = list(dict.fromkeys(content_hashes))
+        results, errors = run_bounded(
+            self._unpin_or_report_missing,
+            content_hashes,
+            max_workers,
+            throttle_errors=self.throttle_errors,
+        )
+        report = UnpinReport()
+        for content_hash in content_hashes:
+            if content_hash in errors:
+                report.failed[content_hash] = errors[content_hash]
+            elif results[content_hash]:
+                report.unpinned.append(content_hash)
+            else:
+                report.not_pinned.append(content_hash)
+
+        return report
+
+    def unpin_names(
+        self, file_names: Iterable[str], max_workers: int = DEFAULT_UNPIN_WORKERS
+    ) -> UnpinReport:
+        """
+        Unpin every pin with any of the given file names. The names are resolved from
+        a single fresh listing, then unpinned with :meth:`unpin_many`.
+
+        Args:
+            file_names (Iterable[str]): The names of the files or directories.
+            max_workers (int): The maximum number of unpins in flight.
+
+        Returns:
+            :class:`~pinata.records.UnpinReport`
+        """
+
+        self.index.refresh()
+        content_hashes = []
+        unresolved = []
+        for file_name in file_names:
+            hashes = self.index.get_hashes(file_name)
+            content_hashes.extend(hashes)
+            if not hashes:
+                unresolved.append(file_name)
+
+        report = self.unpin_many(content_hashes, max_workers=max_workers)
+        report.unresolved = unresolved
+        return report
+
+    def _unpin_or_report_missing(self, content_hash: str) -> bool:
+        try:
+            self.unpin(content_hash)
+        except NoContentError:
+            return False
+
+        return True
+
+
+class AsyncPinata(IAsyncPinning):
+    """
+    The ``asyncio`` version of :class:`~pinata.sdk.Pinata`. Its clients share
+    one connection pool, so many uploads can be awaited concurrently, e.g.
+    with ``asyncio.gather()``. Use it as an async context manager, or call
+    :meth:`close` when done.
+    """
+
+    throttle_errors = ()
+
+    def __init__(
+        self,
+        pinning_client: AsyncPinningClient,
+        data_client: AsyncDataClient,
+        index_ttl: Optional[float] = DEFAULT_INDEX_TTL,
+    ):
+        self.pinning = pinning_client
+        self.data = data_client
+        self.index = PinIndex(ttl=index_ttl)
+        self._index_lock = asyncio.Lock()
+
+    @classmethod
+    def from_profile_name(cls, profile_name: str, **kwargs) -> "AsyncPinata":
+        """
+        Create an instance of the async Pinata SDK from a stored profile name.
+
+        Args:
+            profile_name (str): The name of the API key profile to use.
+        """
+        api_key, api_secret = resolve_key_pair(profile_name)
+        return cls.from_api_key(api_key, api_secret, **kwargs)
+
+    @classmethod
+    def from_api_key(cls, api_key: str, api_secret: str, **kwargs) -> "AsyncPinata":
+        """
+        Create an instance of the async Pinata SDK from an API key.
+
+        Args:
+            api_key (str): The API key.
+            api_secret (str): The API secret.
+            **kwargs: Additional keyword arguments for
+              :meth:`~pinata.async_session.AsyncPinataAPISession.from_api_key`,
+              such as ``host_address``.
+        """
+        from pinata.async_session import AsyncPinataAPISession
+
+        session = AsyncPinataAPISession.from_api_key(api_key, api_secret, **kwargs)
+        return cls(AsyncPinningClient(session), AsyncDataClient(session))
+
+    async def close(self):
+        await self.pinning.session.close()
+
+    async def __aenter__(self) -> "AsyncPinata":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_pins(self) -> List[Pin]:
+        """
+        Get all pins.
+
+        Returns:
+            List[``Pin``]
+        """
+
+        return [_to_pin(record) async for record in self.data.search_pins_iter(status="pinned")]
+
+    async def get_hash(self, file_name: str, refresh: bool = False) -> Optional[str]:
+        """
+        Get the most recent hash of a pinned file by file name.
+        Concurrent callers share a single listing when the index needs loading.
+
+        Args:
+            file_name (str): The name of the file.
+            refresh (bool): Rebuild the pin index from a fresh listing first.
+
+        Returns:
+            Optional[str]: The content IPFS hash str.
+        """
+
+        if refresh:
+            self.index.invalidate()
+
+        await self._ensure_index_loaded()
+        return self.index.get_hash(file_name)
+
+    async def get_pin(self, content_hash: str) -> Optional[Pin]:
+        """
+        Get the pin for a content hash from the local pin index.
+
+        Args:
+            content_hash (str): The content IPFS hash.
+
+        Returns:
+            Optional[``Pin``]
+        """
+
+        await self._ensure_index_loaded()
+        return self.index.get_pin(content_hash)
+
+    async def pin_file(self, file_path: Path) -> str:
+        """
+        Add and pin any file, or directory, to Pinata's IPFS nodes.
+
+        Args:
+            file_path (pathlib.Path): The path to the file to pin.
+
+        Returns:
+            str: The content IPFS hash.
+        """
+
+        is_json = file_path.suffix == ".json"
+        try:
+            response = await (
+                self.pinning.pin_json(file_path) if is_json else self.pinning.pin_file(file_path)
+            )
+        except PinataBadRequestError as err:
+            raise PinError(file_path) from err
+
+        content_hash = response.pin_result().content_hash
+        self.index.add(Pin(content_hash=content_hash, file_name=file_path.name))
+        return content_hash
+
+    async def unpin(self, content_hash: str, ignore_errors: bool = False):
+        """
+        Unpin content previously uploaded to Pinata's IPFS nodes.
+
+        Args:
+            content_hash (str): The hash of the content to stop pinning.
+            ignore_errors (bool): Ignore known errors.
+        """
+        try:
+            await self.pinning.unpin(content_hash)
+        except UNPIN_ERRORS as err:
+            is_not_pinned = _is_not_pinned(err)
+            if not (is_not_pinned or ignore_errors):
+                raise
+
+            self.index.remove(content_hash)
             if ignore_errors:
                 return
 
             raise NoContentError(content_hash) from err
+
+        self.index.remove(content_hash)
+
+    async def _ensure_index_loaded(self):
+        if not self.index.is_stale:
+            return
+
+        async with self._index_lock:
+            # Another task may have loaded it while this one waited.
+            if not self.index.is_stale:
+                return
+
+            self.index.begin_load()
+            try:
+                pins = await self.get_pins()
+            except BaseException:
+                self.index.cancel_load()
+                raise
+
+            self.index.load(pins)
+
+
+def _is_not_pinned(err: PinataHTTPError) -> bool:
+    if isinstance(err, (PinataBadRequestError, PinataNotFoundError)):
+        return True
+
+    # Synchronous errors wrap the 'requests' error, asynchronous ones carry the body.
+    response = getattr(err.args[0] if err.args else None, "response", None)
+    body = response.text if response is not None else str(err)
+    return NOT_PINNED_REASON in body
+
+
+def _to_pin(record: PinRecord) -> Pin:
+    # Records are already typed, so skip pydantic's validation.
+    return Pin.construct(content_hash=record.content_hash, file_name=record.name or "")
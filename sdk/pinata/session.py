@@ -1,21 +1,47 @@
+import logging
+import time
+from typing import Optional
 from urllib.parse import urljoin, urlparse
 
 from requests import HTTPError
-from requests.sessions import HTTPAdapter, Request, Session
+from requests.exceptions import ConnectionError, Timeout
+from requests.sessions import Request, Session
 
 from pinata.auth import PinataAuth
 from pinata.exceptions import MissingResponseError, raise_pinata_http_error
 from pinata.logger import logger
 from pinata.response import PinataResponse
+from pinata.scheduler import DEFAULT_MAX_CONCURRENCY, RequestScheduler
+from pinata.tracing import NULL_TRACER, Span, Tracer, normalize_endpoint
+from pinata.transport import (
+    HTTP2Transport,
+    PoolStats,
+    RequestsTransport,
+    Transport,
+    pool_size_for_concurrency,
+)
 from pinata.utils import format_dict
 
 
 class PinataAPISession:
-    def __init__(self, url: str, auth: PinataAuth, session: Session):
+    def __init__(
+        self,
+        url: str,
+        auth: PinataAuth,
+        session: Session,
+        scheduler: Optional[RequestScheduler] = None,
+        transport: Optional[Transport] = None,
+        tracer: Optional[Tracer] = None,
+    ):
         self._url = url
         self._auth = auth
         self._session = session
         self._headers = self._session.headers.copy()
+        self.scheduler = scheduler or RequestScheduler()
+        self.transport = transport or RequestsTransport(
+            session, pool_size=pool_size_for_concurrency(self.scheduler.window.max_size)
+        )
+        self.tracer = tracer or NULL_TRACER
 
     @classmethod
     def from_api_key(
@@ -23,17 +49,56 @@ class PinataAPISession:
         api_key: str,
         api_secret: str,
         host_address: str = "https://api.pinata.cloud/",
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        scheduler: Optional[RequestScheduler] = None,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
+        tracer: Optional[Tracer] = None,
     ) -> "PinataAPISession":
-        adapter = HTTPAdapter(pool_connections=200, pool_maxsize=4, pool_block=True)
+        """
+        Create a session from an API key.
+
+        Args:
+            api_key (str): The API key.
+            api_secret (str): The API secret.
+            host_address (str): The base URL of the API.
+            concurrency (int): The maximum number of requests in flight. The connection
+              pool is sized to match.
+            scheduler (Optional[:class:`~pinata.scheduler.RequestScheduler`]): A custom
+              request scheduler. Overrides ``concurrency``.
+            transport (Optional[:class:`~pinata.transport.Transport`]): A custom transport.
+            http2 (bool): Multiplex requests over HTTP/2 (requires ``httpx[http2]``).
+            tracer (Optional[:class:`~pinata.tracing.Tracer`]): Receives a span per request
+              attempt, e.g. a :class:`~pinata.tracing.RecordingTracer`. Disabled by default.
+
+        Returns:
+            :class:`~pinata.session.PinataAPISession`
+        """
+        scheduler = scheduler or RequestScheduler(max_concurrency=concurrency)
         session = Session()
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
         session.headers = {
             "Accept-Encoding": "gzip, deflate",
             "Connection": "keep-alive",
         }
+        if transport is None:
+            pool_size = pool_size_for_concurrency(scheduler.window.max_size)
+            transport = (
+                HTTP2Transport(max_connections=pool_size)
+                if http2
+                else RequestsTransport(session, pool_size=pool_size)
+            )
+
         auth = PinataAuth(api_key, api_secret)
-        return PinataAPISession(host_address, auth, session)
+        return PinataAPISession(
+            host_address, auth, session, scheduler=scheduler, transport=transport, tracer=tracer
+        )
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """
+        Live connection pool metrics from the transport.
+        """
+        return self.transport.stats()
 
     def get(self, url, **kwargs):
         return self.request("GET", url, **kwargs)
@@ -73,45 +138,118 @@ class PinataAPISession:
         cert=None,
         proxies=None,
     ):
-        request = self._prepare_request(
-            method,
-            url,
-            params=params,
-            data=data,
-            json=json,
-            headers=headers,
-            cookies=cookies,
-            files=files,
-            auth=auth,
-            hooks=hooks,
-        )
-        response = self._session.send(
-            request,
-            stream=stream,
-            timeout=timeout,
-            verify=True,
-            cert=cert,
-            proxies=proxies,
-        )
+        attempt = 0
+        while True:
+            request = self._prepare_request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json,
+                headers=dict(headers or {}),
+                cookies=cookies,
+                files=files,
+                auth=auth,
+                hooks=hooks,
+            )
+            tracing = self.tracer.enabled
+            with self.scheduler.slot() as slot:
+                if tracing:
+                    started_at = time.time()
+                    started = time.perf_counter()
+
+                try:
+                    response = self.transport.send(
+                        request,
+                        stream=stream,
+                        timeout=timeout,
+                        verify=True,
+                        cert=cert,
+                        proxies=proxies,
+                    )
+                except (ConnectionError, Timeout) as err:
+                    if tracing:
+                        self._trace(request, None, attempt, started_at, started, error=err)
+
+                    delay = self.scheduler.retry_delay(method, attempt)
+                    if delay is None:
+                        raise
+
+                    response = None
+                else:
+                    if tracing:
+                        self._trace(request, response, attempt, started_at, started)
+
+                    slot.throttled = response.status_code == 429
+                    delay = (
+                        self.scheduler.retry_delay(
+                            method, attempt, response.status_code, response.headers
+                        )
+                        if response.status_code >= 400
+                        else None
+                    )
+
+            if delay is None:
+                break
+
+            logger.debug(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1}).")
+            if response is not None:
+                response.close()
+            if hasattr(data, "seek"):
+                # Streamed bodies must be rewound before they can be sent again.
+                data.seek(0)
+
+            time.sleep(delay)
+            attempt += 1
 
         if response is not None:
-            logger.debug(f"Response status: {response.status_code}")
             if not stream:
                 # setting this manually speeds up read times
                 response.encoding = "utf-8"
-                logger.debug(f"Response data: {response.text}")
-            else:
-                logger.debug("Response data: <streamed>")
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response status: {response.status_code}")
+                data_str = "<streamed>" if stream else response.text
+                logger.debug(f"Response data: {data_str}")
 
             if 200 <= response.status_code <= 399:
                 return PinataResponse(response)
 
+            # A streamed response holds its pooled connection until it is closed.
+            response.close()
         else:
             logger.debug("ERROR: Could not retrieve response.")
 
         # If we get here, an error has occurred.
         _handle_error(method, url, response)
 
+    def _trace(self, request, response, attempt, started_at, started, error=None):
+        total = time.perf_counter() - started
+        body = request.body
+        bytes_sent = len(body) if body is not None and hasattr(body, "__len__") else 0
+        bytes_received = 0
+        if response is not None:
+            content_length = response.headers.get("Content-Length")
+            if content_length is not None:
+                bytes_received = int(content_length)
+            elif response._content_consumed:
+                bytes_received = len(response.content or b"")
+
+        span = Span(
+            request.method,
+            normalize_endpoint(urlparse(request.url).path),
+            attempt,
+            started_at,
+            total,
+            status=None if response is None else response.status_code,
+            connect=self.transport.take_connect_time(),
+            ttfb=None if response is None else response.elapsed.total_seconds(),
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            error=None if error is None else repr(error),
+        )
+        self.tracer.record(span)
+
     def _prepare_request(
         self,
         method,
@@ -137,7 +275,8 @@ class PinataAPISession:
 
         headers = _create_user_headers(headers)
 
-        _print_request(method, url, params=params, data=data, json=json)
+        if logger.isEnabledFor(logging.DEBUG):
+            _print_request(method, url, params=params, data=data, json=json)
 
         if isinstance(data, str):
             data = data.encode("utf-8")
@@ -191,4 +330,5 @@ def _print_request(method, url, params=None, data=None, json=None):
     if json:
         logger.debug(format_dict(json, "  json"))
     if data:
-        logger.debug(data, "  data")
+        data_str = data if isinstance(data, (str, bytes)) else f"<{type(data).__name__}>"
+        logger.debug(f"  data {data_str!r}")
@@ -0,0 +1,189 @@
+import bisect
+import json
+import re
+import threading
+from collections import deque
+from typing import IO, Deque, Dict, List, Optional, Sequence
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_MAX_SPANS = 10_000
+
+_HASH_SEGMENT = re.compile(r"/(Qm[1-9A-HJ-NP-Za-km-z]{44}|b[a-z2-7]{58,})(?=/|$)")
+
+
+class Span:
+    """
+    The timings and sizes of a single HTTP request attempt. Connect time includes
+    DNS resolution and is ``None`` when an existing connection was reused.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "status",
+        "attempt",
+        "started_at",
+        "connect",
+        "ttfb",
+        "transfer",
+        "total",
+        "bytes_sent",
+        "bytes_received",
+        "error",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        started_at: float,
+        total: float,
+        status: Optional[int] = None,
+        connect: Optional[float] = None,
+        ttfb: Optional[float] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: Optional[str] = None,
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.attempt = attempt
+        self.started_at = started_at
+        self.connect = connect
+        self.ttfb = ttfb
+        self.transfer = None if ttfb is None else max(0.0, total - ttfb)
+        self.total = total
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.error = error
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class LatencyHistogram:
+    """
+    A fixed-bucket latency histogram.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last bucket is unbounded.
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in.
+        """
+
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+
+        return float("inf")
+
+    def to_dict(self) -> Dict:
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Tracer:
+    """
+    Receives request spans from a :class:`~pinata.session.PinataAPISession`.
+    The base tracer is disabled: the session checks :attr:`enabled` before doing
+    any tracing work, so an unused tracer costs nothing.
+    """
+
+    enabled = False
+
+    def record(self, span: Span):
+        pass
+
+
+class RecordingTracer(Tracer):
+    """
+    A tracer keeping the most recent spans in memory, along with per-endpoint
+    latency histograms covering every span it has seen.
+    """
+
+    enabled = True
+
+    def __init__(self, max_spans: Optional[int] = DEFAULT_MAX_SPANS):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+            key = f"{span.method} {span.endpoint}"
+            if key not in self._histograms:
+                self._histograms[key] = LatencyHistogram()
+
+            self._histograms[key].observe(span.total)
+
+    def histograms(self) -> Dict[str, Dict]:
+        """
+        Get the latency histogram of each endpoint, keyed by ``"<METHOD> <endpoint>"``.
+        """
+
+        with self._lock:
+            return {key: histogram.to_dict() for key, histogram in self._histograms.items()}
+
+    def export_jsonl(self, file: IO[str]):
+        """
+        Write the recorded spans to a text stream, one JSON object per line.
+
+        Args:
+            file (IO[str]): The stream to write to.
+        """
+
+        with self._lock:
+            spans: List[Span] = list(self.spans)
+
+        for span in spans:
+            file.write(json.dumps(span.to_dict()))
+            file.write("\n")
+
+
+NULL_TRACER = Tracer()
+
+
+def normalize_endpoint(path: str) -> str:
+    """
+    Replace content hashes in a URL path so requests to the same endpoint share a
+    histogram, e.g. ``/pinning/unpin/Qm...`` becomes ``/pinning/unpin/{hash}``.
+    """
+
+    return _HASH_SEGMENT.sub("/{hash}", path)
+
+
+__all__ = [
+    "LatencyHistogram",
+    "NULL_TRACER",
+    "RecordingTracer",
+    "Span",
+    "Tracer",
+    "normalize_endpoint",
+]
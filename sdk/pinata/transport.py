@@ -0,0 +1,287 @@
+import threading
+import time
+from abc import abstractmethod
+from typing import Dict, NamedTuple, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+from requests.structures import CaseInsensitiveDict
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_POOL_CONNECTIONS = 10
+
+# Connection-specific headers that are not allowed in HTTP/2.
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+)
+
+
+def pool_size_for_concurrency(concurrency: int) -> int:
+    """
+    The connection pool size for a session allowing ``concurrency`` requests in
+    flight. Every in-flight request holds a connection, so anything smaller makes
+    callers queue on the pool instead of on the scheduler.
+    """
+
+    return max(1, concurrency)
+
+
+class PoolStats(NamedTuple):
+    """
+    A snapshot of a transport's connection pool usage. Fields that a transport
+    cannot observe are ``None``.
+    """
+
+    in_use: int  # Connections currently checked out.
+    waiting: Optional[int]  # Callers currently blocked waiting for a free connection.
+    checkouts: int  # Total connections handed out.
+    new_connections: int  # Total connections opened.
+    reuse_rate: float  # Fraction of checkouts served by an existing connection.
+    wait_time: Optional[float]  # Total seconds spent waiting for a free connection.
+    connect_time: float  # Average seconds spent opening a connection.
+
+
+class _PoolRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.new_connections = 0
+        self.wait_time = 0.0
+        self.connect_time = 0.0
+        self.local = threading.local()
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            reuse_rate = 1 - self.new_connections / self.checkouts if self.checkouts else 0.0
+            average_connect_time = (
+                self.connect_time / self.new_connections if self.new_connections else 0.0
+            )
+            return PoolStats(
+                in_use=self.in_use,
+                waiting=self.waiting,
+                checkouts=self.checkouts,
+                new_connections=self.new_connections,
+                reuse_rate=max(0.0, reuse_rate),
+                wait_time=self.wait_time,
+                connect_time=average_connect_time,
+            )
+
+    def add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+
+def _instrument_pool_class(pool_cls, recorder: _PoolRecorder):
+    class InstrumentedPool(pool_cls):
+        def _get_conn(self, timeout=None):
+            recorder.add(waiting=1)
+            started = time.perf_counter()
+            try:
+                conn = super()._get_conn(timeout=timeout)
+            finally:
+                recorder.add(waiting=-1, wait_time=time.perf_counter() - started)
+
+            recorder.add(in_use=1, checkouts=1)
+            return conn
+
+        def _put_conn(self, conn):
+            recorder.add(in_use=-1)
+            return super()._put_conn(conn)
+
+        def _new_conn(self):
+            conn = super()._new_conn()
+            recorder.add(new_connections=1)
+            connect = conn.connect
+
+            def timed_connect(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return connect(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - started
+                    recorder.local.connect_time = elapsed
+                    recorder.add(connect_time=elapsed)
+
+            conn.connect = timed_connect
+            return conn
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_cls.__name__}"
+    return InstrumentedPool
+
+
+class _InstrumentedHTTPAdapter(HTTPAdapter):
+    def __init__(self, recorder: _PoolRecorder, *args, **kwargs):
+        self._recorder = recorder
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _instrument_pool_class(HTTPConnectionPool, self._recorder),
+            "https": _instrument_pool_class(HTTPSConnectionPool, self._recorder),
+        }
+
+
+class Transport:
+    """
+    Sends prepared requests for a :class:`~pinata.session.PinataAPISession`.
+    Implement this to plug in a different HTTP stack.
+    """
+
+    @abstractmethod
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """
+        Send a prepared request and return its response.
+
+        Args:
+            request (``requests.PreparedRequest``): The request to send.
+            **kwargs: The keyword arguments of ``requests.Session.send()``,
+              such as ``stream`` and ``timeout``.
+
+        Returns:
+            ``requests.Response``
+        """
+
+    @abstractmethod
+    def stats(self) -> PoolStats:
+        """
+        Get a snapshot of the connection pool's usage.
+
+        Returns:
+            :class:`~pinata.transport.PoolStats`
+        """
+
+    def take_connect_time(self) -> Optional[float]:
+        """
+        Get, and forget, the seconds the calling thread's last request spent opening a
+        connection, or ``None`` if it reused one or the transport does not know.
+        """
+
+        return None
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport: a ``requests`` session over an instrumented, blocking
+    ``urllib3`` connection pool.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        pool_size: int = pool_size_for_concurrency(4),
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    ):
+        self.session = session or Session()
+        self._recorder = _PoolRecorder()
+        adapter = _InstrumentedHTTPAdapter(
+            self._recorder,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        return self.session.send(request, **kwargs)
+
+    def stats(self) -> PoolStats:
+        return self._recorder.snapshot()
+
+    def take_connect_time(self) -> Optional[float]:
+        connect_time = getattr(self._recorder.local, "connect_time", None)
+        self._recorder.local.connect_time = None
+        return connect_time
+
+    def close(self):
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    A transport multiplexing requests over HTTP/2 connections, which suits jobs with
+    a high fan-out to a single host. Requires ``httpx`` with HTTP/2 support
+    (``pip install "httpx[http2]"``). Responses are fully read and returned as
+    buffered ``requests`` responses. ``httpx`` does not report callers waiting on
+    its pool, so :attr:`PoolStats.waiting` and :attr:`PoolStats.wait_time` are
+    ``None``; new connections are counted from ``httpcore`` trace events.
+    """
+
+    def __init__(self, max_connections: int = pool_size_for_concurrency(4)):
+        try:
+            import httpx
+        except ImportError as err:
+            raise ImportError("HTTP/2 transport requires 'httpx[http2]' to be installed.") from err
+
+        limits = httpx.Limits(max_connections=max_connections)
+        self._client = httpx.Client(http2=True, limits=limits)
+        self._recorder = _PoolRecorder()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = iter(body)
+
+        self._recorder.add(in_use=1, checkouts=1)
+        try:
+            http2_response = self._client.request(
+                request.method,
+                request.url,
+                headers={
+                    k: v for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS
+                },
+                content=body,
+                timeout=kwargs.get("timeout"),
+                extensions={"trace": self._trace},
+            )
+        finally:
+            self._recorder.add(in_use=-1)
+
+        response = Response()
+        response.status_code = http2_response.status_code
+        response.reason = http2_response.reason_phrase
+        response.headers = CaseInsensitiveDict(http2_response.headers)
+        response.url = str(http2_response.url)
+        response.request = request
+        response.elapsed = http2_response.elapsed
+        response._content = http2_response.content
+        # The body is already read; without this, 'requests' reaches for 'raw'.
+        response._content_consumed = True
+        return response
+
+    def stats(self) -> PoolStats:
+        return self._recorder.snapshot()._replace(waiting=None, wait_time=None)
+
+    def take_connect_time(self) -> Optional[float]:
+        connect_time = getattr(self._recorder.local, "connect_time", None)
+        self._recorder.local.connect_time = None
+        return connect_time
+
+    def close(self):
+        self._client.close()
+
+    def _trace(self, event: str, info: Dict):
+        # Called by httpcore, on the thread sending the request.
+        if event == "connection.connect_tcp.started":
+            self._recorder.local.connect_started = time.perf_counter()
+        elif event == "connection.connect_tcp.complete":
+            elapsed = time.perf_counter() - self._recorder.local.connect_started
+            self._recorder.local.connect_time = elapsed
+            self._recorder.add(new_connections=1, connect_time=elapsed)
+
+
+__all__ = [
+    "HTTP2Transport",
+    "PoolStats",
+    "RequestsTransport",
+    "Transport",
+    "pool_size_for_concurrency",
+]
@@ -0,0 +1,215 @@
+"""
+Streaming sources of airdrop receivers. Snapshots are read lazily, a batch of rows
+at a time, so that memory stays bounded however many rows a snapshot has; only the
+set of addresses already seen grows, at 20 bytes of key per unique address.
+"""
+
+import csv
+import gzip
+import io
+import json
+import re
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterator, List, Set, Tuple, Union
+
+DEFAULT_ADDRESS_COLUMN = "address"
+DEFAULT_BATCH_SIZE = 10_000
+
+_ADDRESS = re.compile(r"0x[0-9a-fA-F]{40}")
+# Map hex digits to 0x20, the ASCII case bit, for digits 8-f and letters a-f.
+_HIGH_NIBBLES = bytes.maketrans(b"0123456789abcdef", b"\0" * 8 + b"\x20" * 8)
+_LETTERS = bytes.maketrans(b"0123456789abcdef", b"\0" * 10 + b"\x20" * 6)
+
+
+class InvalidReceiverError(ValueError):
+    def __init__(self, line: int, value: str):
+        self.line = line
+        self.value = value
+        super().__init__(f"Invalid receiver address {value!r} on line {line}.")
+
+
+class AddressSet:
+    """
+    A set of addresses kept as their 20 raw bytes, about half the size of a set
+    of address strings.
+    """
+
+    def __init__(self):
+        self._keys: Set[bytes] = set()
+
+    def add(self, address: str) -> bool:
+        """
+        Add an address. Returns ``False`` when it was already in the set.
+        """
+
+        key = bytes.fromhex(address[2:])
+        if key in self._keys:
+            return False
+
+        self._keys.add(key)
+        return True
+
+    def __contains__(self, address: str) -> bool:
+        return bytes.fromhex(address[2:]) in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class ReceiverSource:
+    """
+    Lazily yields checksummed receiver addresses from a CSV or JSON-lines snapshot,
+    optionally gzipped. CSV files need a header row with an address column; JSON
+    lines are either objects with an address field or bare address strings.
+
+    Rows are validated in batches: the format check runs over the whole batch,
+    then each address not seen in an earlier batch is checksummed once with
+    :func:`checksum_addresses`. Mixed-case addresses must carry a valid EIP-55
+    checksum. Invalid rows are counted and skipped, unless ``strict``.
+
+    Args:
+        path (Union[str, pathlib.Path]): The snapshot file.
+        column (str): The CSV column or JSON field holding the address.
+        batch_size (int): The number of rows validated at a time.
+        deduplicate (bool): Skip addresses that were already yielded.
+        strict (bool): Raise :class:`~sdk.receivers.InvalidReceiverError` on the
+          first invalid row instead of skipping it.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        column: str = DEFAULT_ADDRESS_COLUMN,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        deduplicate: bool = True,
+        strict: bool = False,
+    ):
+        self.path = Path(path)
+        self.column = column
+        self.batch_size = batch_size
+        self.deduplicate = deduplicate
+        self.strict = strict
+        self.rows = 0
+        self.invalid = 0
+        self.duplicates = 0
+
+    def __iter__(self) -> Iterator[str]:
+        self.rows = self.invalid = self.duplicates = 0
+        seen = AddressSet()
+        with _open_text(self.path) as file:
+            rows = self._iter_values(file)
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    return
+
+                self.rows += len(batch)
+                valid = self._validate(batch)
+                # Checksum each address new to this batch once, before deduplicating,
+                # so that a row with a bad checksum cannot hide a later valid one.
+                unique = list(dict.fromkeys(a for _, _, a in valid if a not in seen))
+                checksummed = dict(zip(unique, checksum_addresses(unique)))
+                for line, value, address in valid:
+                    if address not in checksummed:
+                        self.duplicates += 1  # Seen in an earlier batch.
+                        continue
+
+                    digits = value[2:]
+                    is_mixed_case = digits != digits.lower() and digits != digits.upper()
+                    if is_mixed_case and value != checksummed[address]:
+                        self._reject(line, value)
+                    elif self.deduplicate and not seen.add(address):
+                        self.duplicates += 1
+                    else:
+                        yield checksummed[address]
+
+    def _iter_values(self, file: IO[str]) -> Iterator[Tuple[int, str]]:
+        suffixes = [s for s in self.path.suffixes if s != ".gz"]
+        if suffixes and suffixes[-1] in (".jsonl", ".ndjson"):
+            for line, text in enumerate(file, start=1):
+                if not text.strip():
+                    continue
+
+                try:
+                    record = json.loads(text)
+                except ValueError:
+                    record = None
+
+                value = record.get(self.column) if isinstance(record, dict) else record
+                yield line, value if isinstance(value, str) else text.strip()
+        else:
+            reader = csv.DictReader(file)
+            if reader.fieldnames is None or self.column not in reader.fieldnames:
+                raise ValueError(f"'{self.path}' has no '{self.column}' column.")
+
+            for row in reader:
+                yield reader.line_num, (row[self.column] or "").strip()
+
+    def _validate(self, batch: List[Tuple[int, str]]) -> List[Tuple[int, str, str]]:
+        valid = []
+        for line, value in batch:
+            if _ADDRESS.fullmatch(value):
+                valid.append((line, value, "0x" + value[2:].lower()))
+            else:
+                self._reject(line, value)
+
+        return valid
+
+    def _reject(self, line: int, value: str):
+        if self.strict:
+            raise InvalidReceiverError(line, value)
+
+        self.invalid += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReceiverSource {self.path}: {self.rows} row(s), {self.invalid} invalid, "
+            f"{self.duplicates} duplicate(s)>"
+        )
+
+
+def checksum_addresses(addresses: List[str]) -> List[str]:
+    """
+    EIP-55 checksum addresses, whatever their case. Each address still needs its
+    own keccak hash, but the case of the whole batch is set in one pass: a letter
+    is uppercased, by clearing its 0x20 bit, where its hash nibble is 8 or more.
+
+    Args:
+        addresses (List[str]): ``0x``-prefixed hex addresses.
+
+    Raises:
+        ValueError: When any address is not 40 hex digits prefixed with ``0x``.
+
+    Returns:
+        List[str]
+    """
+
+    from eth_hash.auto import keccak
+
+    if not addresses:
+        return []
+
+    for address in addresses:
+        if not _ADDRESS.fullmatch(address):
+            raise ValueError(f"Invalid address {address!r}.")
+
+    digits = "".join(address[2:] for address in addresses).lower().encode()
+    hashes = b"".join(
+        keccak(digits[i : i + 40]).hex()[:40].encode() for i in range(0, len(digits), 40)
+    )
+    case_bits = int.from_bytes(hashes.translate(_HIGH_NIBBLES), "big") & int.from_bytes(
+        digits.translate(_LETTERS), "big"
+    )
+    mixed = (int.from_bytes(digits, "big") - case_bits).to_bytes(len(digits), "big").decode()
+    return ["0x" + mixed[i : i + 40] for i in range(0, len(mixed), 40)]
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path), encoding="utf-8", newline="")
+
+    return open(path, encoding="utf-8", newline="")
+
+
+__all__ = ["AddressSet", "InvalidReceiverError", "ReceiverSource", "checksum_addresses"]
@@ -0,0 +1,98 @@
+"""
+The PoofPoof traits, as edits of ``base.svg``: the leaf is the group ``g5801``
+filled with ``#008000``, and its stem is the path ``rect5798``.
+"""
+
+from typing import List
+
+from nft_project.generative import Trait, TraitOption
+
+_LEAF_FILL = "#008000"
+_LEAF_TRANSFORM = 'transform="translate(1.2651916,17.712682)"'
+_STEM_ID = 'id="rect5798"'
+_WIDTH, _HEIGHT = 600, 640.18695
+
+
+def _leaf(value: str, colour: str, weight: float) -> TraitOption:
+    return TraitOption(value, replacements=((_LEAF_FILL, colour),), weight=weight)
+
+
+def _background(value: str, colour: str, weight: float) -> TraitOption:
+    rect = f'<rect width="{_WIDTH}" height="{_HEIGHT}" style="fill:{colour}" />'
+    return TraitOption(value, underlay=rect, weight=weight)
+
+
+def _tilt(value: str, degrees: int, weight: float) -> TraitOption:
+    if not degrees:
+        return TraitOption(value, weight=weight)
+
+    rotate = f"rotate({degrees} {_WIDTH / 2} {_HEIGHT / 2}) "
+    tilted = _LEAF_TRANSFORM.replace('="', f'="{rotate}', 1)
+    return TraitOption(value, replacements=((_LEAF_TRANSFORM, tilted),), weight=weight)
+
+
+def _sparkles(colour: str) -> str:
+    points = ((90, 110, 9), (510, 90, 6), (470, 520, 8), (120, 560, 5), (300, 60, 4))
+    return "".join(
+        f'<circle cx="{x}" cy="{y}" r="{r}" style="fill:{colour};fill-opacity:0.9" />'
+        for x, y, r in points
+    )
+
+
+POOFPOOF_TRAITS: List[Trait] = [
+    Trait(
+        "Leaf",
+        (
+            _leaf("Green", _LEAF_FILL, 8),
+            _leaf("Lime", "#32cd32", 6),
+            _leaf("Forest", "#228b22", 6),
+            _leaf("Teal", "#008080", 4),
+            _leaf("Olive", "#808000", 4),
+            _leaf("Purple", "#800080", 2),
+            _leaf("Frost", "#b0e0e6", 2),
+            _leaf("Gold", "#d4af37", 1),
+        ),
+    ),
+    Trait(
+        "Background",
+        (
+            TraitOption("None", weight=4),
+            _background("Sky", "#87ceeb", 3),
+            _background("Sand", "#f4e3c1", 3),
+            _background("Sunset", "#ff8c69", 2),
+            _background("Night", "#191970", 2),
+            _background("Blush", "#ffc0cb", 1),
+        ),
+    ),
+    Trait(
+        "Stem",
+        (
+            TraitOption("Stem", weight=3),
+            TraitOption(
+                "Stemless",
+                replacements=((_STEM_ID, f'{_STEM_ID} display="none"'),),
+                weight=1,
+            ),
+        ),
+    ),
+    Trait(
+        "Tilt",
+        (
+            _tilt("Upright", 0, 6),
+            _tilt("Leaning Left", -10, 2),
+            _tilt("Leaning Right", 10, 2),
+            _tilt("Falling Left", -30, 1),
+            _tilt("Falling Right", 30, 1),
+        ),
+    ),
+    Trait(
+        "Sparkle",
+        (
+            TraitOption("None", weight=6),
+            TraitOption("White", overlay=_sparkles("#ffffff"), weight=2),
+            TraitOption("Gold", overlay=_sparkles("#ffd700"), weight=1),
+        ),
+    ),
+]
+
+__all__ = ["POOFPOOF_TRAITS"]
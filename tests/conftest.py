@@ -1,11 +1,22 @@
 import ape
 import pytest
+from pinata import Pinata
 
-from ..sdk import sdk as poof_sdk
+from ..sdk import PoofPoofPass
+from .pinata_emulator import PinataEmulator
 
 
 @pytest.fixture(scope="session")
-def sdk():
+def pinata_emulator():
+    with PinataEmulator() as emulator:
+        yield emulator
+
+
+@pytest.fixture(scope="session")
+def sdk(pinata_emulator, tmp_path_factory):
+    # Pin to the local emulator, keeping its pin state apart from real runs.
+    poof_sdk = PoofPoofPass(build_path=tmp_path_factory.mktemp("build"))
+    poof_sdk.pinata = Pinata.from_api_key("test", "test", host_address=pinata_emulator.url)
     return poof_sdk
 
 
@@ -0,0 +1,311 @@
+"""
+A local stand-in for the Pinata API, for tests and benchmarks. It implements the
+endpoints used by :class:`~pinata.clients.pinning.PinningClient` and
+:class:`~pinata.clients.data.DataClient`, computes real IPFS CIDs for uploaded
+content, and can inject latency, limited bandwidth, and ``429`` responses.
+
+Usage::
+
+    with PinataEmulator(latency=0.05, throttle_rate=0.1) as emulator:
+        pinata = Pinata.from_api_key("key", "secret", host_address=emulator.url)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from nft_project.cid import compute_cid, directory_cid
+
+DEFAULT_PAGE_LIMIT = 10
+MAX_PAGE_LIMIT = 1000
+
+_BOUNDARY = re.compile(r'boundary="?([^";]+)"?')
+_FILE_NAME = re.compile(r'filename="((?:[^"\\]|\\.)*)"')
+_ESCAPED = re.compile(r"\\(.)")
+
+
+class PinataEmulator:
+    """
+    A threaded HTTP server emulating the Pinata API.
+
+    Args:
+        host (str): The interface to listen on.
+        port (int): The port, or ``0`` for any free port.
+        latency (float): Seconds added to every response.
+        bandwidth (Optional[float]): Bytes per second for request and response bodies,
+          or ``None`` for no limit.
+        throttle_rate (float): The fraction of requests answered with ``429``.
+        retry_after (Optional[float]): The ``Retry-After`` seconds sent with ``429``.
+        seed (Optional[int]): Seeds the choice of throttled requests.
+        api_key (Optional[str]): Answer ``401`` to any other API key. By default, any
+          key is accepted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        throttle_rate: float = 0.0,
+        retry_after: Optional[float] = 1.0,
+        seed: Optional[int] = None,
+        api_key: Optional[str] = None,
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.api_key = api_key
+        self.pins: "OrderedDict[str, Dict]" = OrderedDict()
+        self.requests: Counter = Counter()  # Requests per endpoint, including throttled.
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.emulator = self  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def pinned(self) -> List[Dict]:
+        with self._lock:
+            return [pin for pin in self.pins.values() if pin["date_unpinned"] is None]
+
+    def start(self) -> "PinataEmulator":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "PinataEmulator":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            throttle = self._random.random() < self.throttle_rate
+            self.throttled += throttle
+            return throttle
+
+    def add_pin(self, content_hash: str, name: Optional[str], size: int) -> Dict:
+        with self._lock:
+            pin = self.pins.get(content_hash)
+            is_duplicate = pin is not None and pin["date_unpinned"] is None
+            if not is_duplicate:
+                pin = {
+                    "id": str(uuid.uuid4()),
+                    "ipfs_pin_hash": content_hash,
+                    "size": size,
+                    "user_id": "emulator",
+                    "date_pinned": _now(),
+                    "date_unpinned": None,
+                    "metadata": {"name": name, "keyvalues": None},
+                    "regions": [],
+                }
+                # Listings are newest first.
+                self.pins[content_hash] = pin
+                self.pins.move_to_end(content_hash, last=False)
+
+        return {
+            "IpfsHash": content_hash,
+            "PinSize": size,
+            "Timestamp": pin["date_pinned"],
+            "isDuplicate": is_duplicate,
+        }
+
+    def unpin(self, content_hash: str) -> bool:
+        with self._lock:
+            pin = self.pins.get(content_hash)
+            if pin is None or pin["date_unpinned"] is not None:
+                return False
+
+            pin["date_unpinned"] = _now()
+            return True
+
+    def list_pins(self, query: Dict[str, str]) -> Tuple[int, List[Dict]]:
+        status = query.get("status", "all")
+        hash_contains = query.get("hashContains")
+        name = query.get("metadata[name]")
+        limit = min(int(query.get("pageLimit", DEFAULT_PAGE_LIMIT)), MAX_PAGE_LIMIT)
+        offset = int(query.get("pageOffset", 0))
+        with self._lock:
+            rows = [
+                pin
+                for pin in self.pins.values()
+                if (status == "all" or (status == "pinned") == (pin["date_unpinned"] is None))
+                and (not hash_contains or hash_contains in pin["ipfs_pin_hash"])
+                and (not name or name in (pin["metadata"]["name"] or ""))
+            ]
+
+        return len(rows), rows[offset : offset + limit]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PinataEmulator"
+    disable_nagle_algorithm = True
+
+    @property
+    def emulator(self) -> PinataEmulator:
+        return self.server.emulator  # type: ignore
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _handle(self, method: str):
+        started = time.perf_counter()
+        url = urlparse(self.path)
+        body = self._read_body()
+        endpoint = f"{method} {re.sub(r'/unpin/.+', '/unpin/{hash}', url.path)}"
+        self.emulator.requests[endpoint] += 1
+
+        api_key = self.headers.get("pinata_api_key")
+        if api_key is None or "pinata_secret_api_key" not in self.headers:
+            status, payload = 401, {"error": "Invalid authentication credentials"}
+        elif self.emulator.api_key is not None and api_key != self.emulator.api_key:
+            status, payload = 401, {"error": "Invalid authentication credentials"}
+        elif self.emulator.should_throttle():
+            status, payload = 429, {"error": "Rate limited"}
+        else:
+            try:
+                status, payload = self._route(method, url.path, url.query, body)
+            except (ValueError, KeyError) as err:
+                status, payload = 400, {"error": f"Invalid request: {err}"}
+
+        response = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self._delay(started, len(body) + len(response))
+        self.send_response(status)
+        if status == 429 and self.emulator.retry_after is not None:
+            self.send_header("Retry-After", str(self.emulator.retry_after))
+
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def _route(self, method: str, path: str, query: str, body: bytes) -> Tuple[int, object]:
+        if method == "POST" and path == "/pinning/pinFileToIPFS":
+            return 200, self._pin_file(body)
+        elif method == "POST" and path == "/pinning/pinJSONToIPFS":
+            request = json.loads(body)
+            content = json.dumps(request["pinataContent"]).encode()
+            name = (request.get("pinataMetadata") or {}).get("name")
+            return 200, self.emulator.add_pin(compute_cid(content), name, len(content))
+        elif method == "POST" and path == "/pinning/addHashToPinQueue":
+            request = json.loads(body)
+            content_hash = request["hashToPin"]
+            name = (request.get("pinataMetadata") or {}).get("name")
+            self.emulator.add_pin(content_hash, name, 0)
+            return 200, {
+                "id": str(uuid.uuid4()),
+                "ipfsHash": content_hash,
+                "status": "prechecking",
+                "name": name,
+            }
+        elif method == "DELETE" and path.startswith("/pinning/unpin/"):
+            if not self.emulator.unpin(path[len("/pinning/unpin/") :]):
+                # Pinata answers 500, not 404, for content that is not pinned.
+                return 500, {"error": {"reason": "CURRENT_USER_HAS_NOT_PINNED_CID"}}
+
+            return 200, b"OK"
+        elif method == "GET" and path == "/data/pinList":
+            query_args = {k: v[-1] for k, v in parse_qs(query).items()}
+            count, rows = self.emulator.list_pins(query_args)
+            return 200, {"count": count, "rows": rows}
+
+        return 404, {"error": f"No route for {method} {path}"}
+
+    def _pin_file(self, body: bytes) -> Dict:
+        boundary = _BOUNDARY.search(self.headers.get("Content-Type", ""))
+        if not boundary:
+            raise ValueError("Expected multipart/form-data")
+
+        files = _parse_multipart(body, boundary.group(1).encode())
+        if not files:
+            raise ValueError("No files")
+
+        size = sum(len(content) for _, content in files)
+        if len(files) == 1 and "/" not in files[0][0]:
+            name, content = files[0]
+            return self.emulator.add_pin(compute_cid(content), name, size)
+
+        # Directory uploads prefix each file name with the directory name.
+        directory_name = files[0][0].split("/", 1)[0]
+        entries = [(name.split("/", 1)[1], content) for name, content in files]
+        return self.emulator.add_pin(directory_cid(entries), directory_name, size)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunk = self.rfile.read(size)
+                self.rfile.readline()
+                if not size:
+                    return b"".join(chunks)
+
+                chunks.append(chunk)
+
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _delay(self, started: float, transferred: int):
+        delay = self.emulator.latency
+        if self.emulator.bandwidth:
+            delay += transferred / self.emulator.bandwidth
+
+        remaining = delay - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def _parse_multipart(body: bytes, boundary: bytes) -> List[Tuple[str, bytes]]:
+    files = []
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+
+        headers, _, content = part[2:].partition(b"\r\n\r\n")
+        file_name = _FILE_NAME.search(headers.decode())
+        if file_name:
+            # Undo the encoder's quoting: backslash escapes, and '"' sent as '%22'.
+            name = _ESCAPED.sub(r"\1", file_name.group(1)).replace("%22", '"')
+            files.append((name, content[:-2]))
+
+    return files
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+__all__ = ["PinataEmulator"]
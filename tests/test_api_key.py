@@ -0,0 +1,79 @@
+import json
+from typing import Dict, List, Tuple
+
+import pytest
+from pinata import api_key
+from pinata.api_key import KeyringManager
+from pinata.exceptions import PinataMissingAPIKeyError
+
+
+class FakeKeyring:
+    def __init__(self):
+        self.passwords: Dict[Tuple[str, str], str] = {}
+        self.calls: List[Tuple[str, str]] = []
+
+    def get_password(self, service: str, username: str):
+        self.calls.append(("get", username))
+        return self.passwords.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str):
+        self.calls.append(("set", username))
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service: str, username: str):
+        self.calls.append(("delete", username))
+        self.passwords.pop((service, username), None)
+
+
+@pytest.fixture
+def keyring(monkeypatch):
+    keyring = FakeKeyring()
+    monkeypatch.setattr(api_key, "_keyring", lambda: keyring)
+    return keyring
+
+
+def test_get_key_pair_reads_one_entry(keyring):
+    KeyringManager().set_key_pair("test", "key", "secret")
+    keyring.calls.clear()
+
+    # A new process starts with an empty cache.
+    manager = KeyringManager()
+    assert manager.get_key_pair("test") == ("key", "secret")
+    assert keyring.calls == [("get", "test-key-pair")]
+
+    assert manager.get_key_pair("test") == ("key", "secret")
+    assert len(keyring.calls) == 1
+
+
+def test_set_key_pair_keeps_legacy_entries(keyring):
+    KeyringManager().set_key_pair("test", "key", "secret")
+    assert keyring.passwords[("pinata", "test-api-key")] == "key"
+    assert keyring.passwords[("pinata", "test-api-secret")] == "secret"
+
+
+def test_get_key_pair_migrates_legacy_entries(keyring):
+    keyring.passwords[("pinata", "test-api-key")] = "key"
+    keyring.passwords[("pinata", "test-api-secret")] = "secret"
+
+    assert KeyringManager().get_key_pair("test") == ("key", "secret")
+    assert json.loads(keyring.passwords[("pinata", "test-key-pair")]) == ["key", "secret"]
+
+    keyring.calls.clear()
+    assert KeyringManager().get_key_pair("test") == ("key", "secret")
+    assert keyring.calls == [("get", "test-key-pair")]
+
+
+def test_get_missing_key_pair(keyring):
+    with pytest.raises(PinataMissingAPIKeyError):
+        KeyringManager().get_key_pair("missing")
+
+    assert all(call == "get" for call, _ in keyring.calls)
+
+
+def test_delete_key_pair(keyring):
+    manager = KeyringManager()
+    manager.set_key_pair("test", "key", "secret")
+    manager.delete_key_pair("test")
+    assert not [username for _, username in keyring.passwords if username.startswith("test-")]
+    with pytest.raises(PinataMissingAPIKeyError):
+        KeyringManager().get_key_pair("test")
@@ -0,0 +1,92 @@
+import base64
+import hashlib
+
+import pytest
+from nft_project.cid import DEFAULT_CHUNK_SIZE, compute_cid, directory_cid
+
+# CIDs from 'ipfs add' with default settings ('--cid-version=1' for version 1).
+KNOWN_FILE_CIDS = [
+    (b"hello world", 0, "Qmf412jQZiuVUtdgnB36FXFX7xg5V6KEbSJ4dpQuhkLyfD"),
+    (b"hello world\n", 0, "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"),
+    (b"", 0, "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"),
+    (b"hello world", 1, "bafkreifzjut3te2nhyekklss27nh3k72ysco7y32koao5eei66wof36n5e"),
+    (b"", 1, "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"),
+]
+
+
+@pytest.mark.parametrize("content,version,expected", KNOWN_FILE_CIDS)
+def test_file_cid(tmp_path, content, version, expected):
+    path = tmp_path / "file"
+    path.write_bytes(content)
+    assert compute_cid(content, version=version) == expected
+    assert compute_cid(path, version=version) == expected
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    [
+        (0, "QmUNLLsPACCz1vLxQVkXqqLX5R1X345qqfHbsf67hvA3Nn"),
+        (1, "bafybeiczsscdsbs7ffqz55asqdf3smv6klcw3gofszvwlyarci47bgf354"),
+    ],
+)
+def test_empty_directory_cid(tmp_path, version, expected):
+    assert directory_cid([], version=version) == expected
+    assert compute_cid(tmp_path, version=version) == expected
+
+
+def test_directory_cid_matches_files_on_disk(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"hello world")
+    (tmp_path / "sub" / "b.txt").write_bytes(b"")
+    entries = [("sub/b.txt", b""), ("a.txt", tmp_path / "a.txt")]
+    assert compute_cid(tmp_path) == directory_cid(entries)
+
+
+def test_multi_chunk_raw_leaves_cid():
+    # Two raw leaves under one DAG-PB root, encoded by hand from the DAG-PB and
+    # UnixFS specs: links (field 2) come before data (field 1).
+    content = b"\xab" * DEFAULT_CHUNK_SIZE + b"tail"
+    chunks = [content[:DEFAULT_CHUNK_SIZE], content[DEFAULT_CHUNK_SIZE:]]
+    leaf_cids = [b"\x01\x55\x12\x20" + hashlib.sha256(chunk).digest() for chunk in chunks]
+    links = [
+        b"\x12\x2c\x0a\x24" + leaf_cids[0] + b"\x12\x00\x18\x80\x80\x10",  # 262144 bytes
+        b"\x12\x2a\x0a\x24" + leaf_cids[1] + b"\x12\x00\x18\x04",
+    ]
+    # UnixFS: type file, file size 262148, block sizes 262144 and 4.
+    data = b"\x08\x02\x18\x84\x80\x10\x20\x80\x80\x10\x20\x04"
+    root = b"".join(links) + b"\x0a" + bytes([len(data)]) + data
+    root_cid = b"\x01\x70\x12\x20" + hashlib.sha256(root).digest()
+    expected = "b" + base64.b32encode(root_cid).decode().lower().rstrip("=")
+
+    assert compute_cid(content, version=1) == expected
+
+
+def test_multi_chunk_dag_pb_leaves_cid():
+    content = b"\xab" * DEFAULT_CHUNK_SIZE + b"tail"
+    chunks = [content[:DEFAULT_CHUNK_SIZE], content[DEFAULT_CHUNK_SIZE:]]
+    # A UnixFS file leaf wraps its chunk: type file, data, file size.
+    leaves = [
+        b"\x0a\x8a\x80\x10\x08\x02\x12\x80\x80\x10" + chunks[0] + b"\x18\x80\x80\x10",
+        b"\x0a\x0a\x08\x02\x12\x04tail\x18\x04",
+    ]
+    leaf_hashes = [b"\x12\x20" + hashlib.sha256(leaf).digest() for leaf in leaves]
+    tsizes = [b"\x8e\x80\x10", b"\x0c"]  # 262158 and 12: each leaf's block size.
+    links = [
+        b"\x12" + bytes([39 + len(tsize)]) + b"\x0a\x22" + leaf_hash + b"\x12\x00\x18" + tsize
+        for leaf_hash, tsize in zip(leaf_hashes, tsizes)
+    ]
+    data = b"\x08\x02\x18\x84\x80\x10\x20\x80\x80\x10\x20\x04"
+    root = b"".join(links) + b"\x0a" + bytes([len(data)]) + data
+
+    assert compute_cid(content) == _base58(b"\x12\x20" + hashlib.sha256(root).digest())
+
+
+def _base58(data: bytes) -> str:
+    alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = alphabet[remainder] + encoded
+
+    return encoded
@@ -0,0 +1,44 @@
+import pytest
+from pinata import Pinata
+
+from ..sdk import PoofPoofPass
+
+PINNED_NAMES = {"clean-0.png", "clean-1.png", "clean-2.png", "clean-pins"}
+
+
+@pytest.fixture
+def poofpoof(pinata_emulator, tmp_path):
+    artwork_path = tmp_path / "artwork"
+    artwork_path.mkdir()
+    # The emulator is shared by the session, so keep file names apart from other tests.
+    for token_id in range(2):
+        (artwork_path / f"clean-{token_id}.png").write_bytes(f"clean pins {token_id}".encode())
+
+    # Artwork is pinned from subdirectories too.
+    (artwork_path / "nested").mkdir()
+    (artwork_path / "nested" / "clean-2.png").write_bytes(b"clean pins 2")
+
+    poofpoof = PoofPoofPass(
+        name="clean-pins", artwork_path=artwork_path, build_path=tmp_path / "build"
+    )
+    poofpoof.pinata = Pinata.from_api_key("test", "test", host_address=pinata_emulator.url)
+    return poofpoof
+
+
+def _pinned_names(pinata_emulator):
+    return sorted(pin["metadata"]["name"] for pin in pinata_emulator.pinned)
+
+
+def test_clean_pins_then_pin_again(poofpoof, pinata_emulator):
+    metadata_cid = poofpoof.metadata_cid
+    pinned = _pinned_names(pinata_emulator)
+    assert PINNED_NAMES <= set(pinned)
+
+    report = poofpoof.clean_pins()
+    assert report.ok
+    assert not PINNED_NAMES & set(_pinned_names(pinata_emulator))
+    assert poofpoof.nft_project.pin_state.entries() == []
+
+    # Nothing local still claims the content is pinned, so it is all pinned again.
+    assert poofpoof.metadata_cid == metadata_cid
+    assert _pinned_names(pinata_emulator) == pinned
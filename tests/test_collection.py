@@ -0,0 +1,83 @@
+import json
+import types
+
+import pytest
+from nft_project import NFT, NFTCollection, NFTProject
+from nft_project.cid import compute_cid
+from nft_project.collection import InvalidCIDError
+
+IMAGES = [f"ipfs://{compute_cid(f'collection {index}'.encode())}" for index in range(5)]
+ATTRIBUTES = [
+    [{"trait_type": "Colour", "value": "Grün ✓"}],
+    [],
+    [{"trait_type": "Size", "value": 3}, {"trait_type": "Quote", "value": 'say "hi"'}],
+    [{"trait_type": "Empty", "value": None}],
+    [{"trait_type": "Ratio", "value": 0.5}],
+]
+
+
+@pytest.mark.parametrize("attributes", [None, ATTRIBUTES])
+@pytest.mark.parametrize("project_name", ["PoofPoof", 'Naïve "Quoted" ✨'])
+def test_documents_match_models(project_name, attributes):
+    collection = NFTCollection(project_name, IMAGES, start_token_id=10, attributes=attributes)
+    documents = list(collection.iter_documents("{token_id}.json"))
+    nfts = list(collection.iter_nfts())
+
+    assert [token_id for token_id, _, _ in documents] == list(range(10, 15))
+    assert [name for _, name, _ in documents] == [f"{i}.json" for i in range(10, 15)]
+    assert [document for _, _, document in documents] == [
+        json.dumps(nft.dict()).encode() for nft in nfts
+    ]
+    assert nfts[2] == NFT(
+        image=IMAGES[2],
+        tokenId=12,
+        name=f"{project_name} Number 12",
+        attributes=attributes[2] if attributes else [],
+    )
+
+
+def test_columns():
+    collection = NFTCollection("PoofPoof", IMAGES, start_token_id=1)
+    assert len(collection) == 5
+    assert [collection.image(i) for i in range(5)] == IMAGES
+    assert collection.name(3) == "PoofPoof Number 3"
+
+    token_ids = collection.token_ids()
+    assert not isinstance(token_ids, list)
+    assert list(token_ids) == [1, 2, 3, 4, 5]
+    assert isinstance(collection.iter_nfts(), types.GeneratorType)
+
+
+def test_empty_collection():
+    collection = NFTCollection("PoofPoof", [])
+    assert len(collection) == 0
+    assert list(collection.iter_documents("{token_id}.json")) == []
+
+
+def test_invalid_images_are_reported_together():
+    images = [*IMAGES[:2], IMAGES[2][:-1], "https://example.com/0.png", IMAGES[3][:-1] + "!"]
+    with pytest.raises(InvalidCIDError) as error:
+        NFTCollection("PoofPoof", images)
+
+    message = str(error.value)
+    assert all(f"{index}: " in message for index in (2, 3, 4))
+    assert "0: " not in message and "1: " not in message
+
+
+def test_invalid_images_message_is_truncated():
+    with pytest.raises(InvalidCIDError, match=r"\(and 3 more\)"):
+        NFTCollection("PoofPoof", ["ipfs://bad"] * 8)
+
+
+def test_attributes_are_required_for_every_image():
+    with pytest.raises(ValueError):
+        NFTCollection("PoofPoof", IMAGES, attributes=ATTRIBUTES[:2])
+
+
+def test_project_collection_matches_nft_data():
+    nft_project = NFTProject("PoofPoof", None)  # type: ignore
+    collection = nft_project.create_nft_collection(IMAGES)
+    nft_data = nft_project.create_nft_data(IMAGES)
+
+    assert [nft.tokenId for nft in nft_data] == list(range(5))
+    assert list(collection.iter_nfts()) == nft_data
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+from nft_project.concurrency import AdaptiveWindow, run_bounded
+
+
+class Throttled(Exception):
+    pass
+
+
+def test_run_bounded_limits_calls_in_flight():
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def call(item):
+        with lock:
+            in_flight.append(item)
+            peak.append(len(in_flight))
+
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(item)
+
+        return item * 2
+
+    results, errors = run_bounded(call, range(20), max_in_flight=4)
+    assert list(results.items()) == [(i, i * 2) for i in range(20)]
+    assert not errors
+    assert max(peak) == 4
+
+
+def test_run_bounded_records_errors_per_item():
+    def call(item):
+        if item % 3 == 0:
+            raise ValueError(item)
+
+        return item
+
+    seen = []
+    results, errors = run_bounded(
+        call, range(7), max_in_flight=3, on_result=lambda item, result: seen.append(item)
+    )
+    assert list(results) == [1, 2, 4, 5]
+    assert list(errors) == [0, 3, 6]
+    assert all(isinstance(error, ValueError) for error in errors.values())
+    assert sorted(seen) == list(results)
+
+
+def test_run_bounded_retries_throttled_items():
+    attempts = {}
+    lock = threading.Lock()
+
+    def call(item):
+        with lock:
+            attempts[item] = attempts.get(item, 0) + 1
+            if attempts[item] <= 2:
+                raise Throttled()
+
+        return item
+
+    results, errors = run_bounded(
+        call, range(5), max_in_flight=2, throttle_errors=(Throttled,), backoff=0
+    )
+    assert list(results) == list(range(5))
+    assert not errors
+    assert attempts == {item: 3 for item in range(5)}
+
+
+def test_run_bounded_gives_up_on_items_throttled_too_often():
+    def call(item):
+        raise Throttled()
+
+    results, errors = run_bounded(
+        call,
+        ["a"],
+        max_in_flight=2,
+        throttle_errors=(Throttled,),
+        max_throttle_retries=2,
+        backoff=0,
+    )
+    assert not results
+    assert isinstance(errors["a"], Throttled)
+
+
+def test_adaptive_window_halves_on_throttle_and_grows_back():
+    window = AdaptiveWindow(8)
+    for _ in range(3):
+        window.acquire()
+
+    window.release(throttled=True)
+    assert window.size == 4
+    window.release(throttled=True)
+    window.release(throttled=True)
+    assert window.size == 1
+    assert window.in_flight == 0
+
+    for expected in range(2, 9):
+        window.acquire()
+        window.release()
+        assert window.size == expected
+
+    window.acquire()
+    window.release()
+    assert window.size == 8
+
+
+def test_adaptive_window_blocks_while_full():
+    window = AdaptiveWindow(1)
+    window.acquire()
+    acquired = threading.Event()
+
+    def acquire():
+        window.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.1)
+
+    window.release()
+    assert acquired.wait(5)
+    thread.join()
+
+
+@pytest.mark.parametrize("max_size", [0, -1])
+def test_adaptive_window_keeps_one_slot(max_size):
+    assert AdaptiveWindow(max_size).size == 1
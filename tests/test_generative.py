@@ -0,0 +1,162 @@
+from pathlib import Path
+
+import pytest
+from nft_project import generative
+from nft_project.generative import (
+    GenerativeRenderer,
+    Trait,
+    TraitOption,
+    enumerate_combinations,
+    render_svg,
+)
+from nft_project.project import get_artwork_paths
+
+BASE_SVG = Path(__file__).parent.parent / "base.svg"
+
+TEMPLATE = '<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg"><g fill="#000"/></svg>\n'
+TRAITS = [
+    Trait(
+        "Colour",
+        (
+            TraitOption("Black"),
+            TraitOption("Red", replacements=(("#000", "#f00"),)),
+            TraitOption("Blue", replacements=(("#000", "#00f"),), weight=3.0),
+        ),
+    ),
+    Trait(
+        "Background",
+        (
+            TraitOption("None"),
+            TraitOption("Sky", underlay='<rect id="sky"/>'),
+        ),
+    ),
+    Trait(
+        "Hat",
+        (
+            TraitOption("None"),
+            TraitOption("Cap", overlay='<path id="cap"/>'),
+            TraitOption("Crown", overlay='<path id="crown"/>', weight=0.1),
+        ),
+    ),
+]
+
+
+def test_combinations_are_deterministic_and_distinct():
+    combinations = enumerate_combinations(TRAITS, 18, seed=7)
+    assert combinations == enumerate_combinations(TRAITS, 18, seed=7)
+    assert combinations != enumerate_combinations(TRAITS, 18, seed=8)
+    assert len(set(combinations)) == 18
+    # A larger count only adds combinations at the end.
+    assert enumerate_combinations(TRAITS, 5, seed=7) == combinations[:5]
+
+    with pytest.raises(ValueError):
+        enumerate_combinations(TRAITS, 19)
+
+
+def test_combinations_follow_weights():
+    traits = [Trait("Rare", (TraitOption("Common", weight=100.0), TraitOption("Rare")))] + [
+        Trait(f"Filler {i}", tuple(TraitOption(str(o)) for o in range(4))) for i in range(4)
+    ]
+    first = enumerate_combinations(traits, 100, seed=1)
+    assert sum(combination[0] == 0 for combination in first) > 90
+
+
+def test_sparse_combinations(monkeypatch):
+    monkeypatch.setattr(generative, "DENSE_COMBINATION_LIMIT", 1)
+    combinations = enumerate_combinations(TRAITS, 18, seed=3)
+    assert sorted(combinations) == sorted(enumerate_combinations(TRAITS, 18, seed=4))
+    assert combinations == enumerate_combinations(TRAITS, 18, seed=3)
+    assert len(set(combinations)) == 18
+
+
+def test_render_svg():
+    svg = render_svg(TEMPLATE, TRAITS, (1, 1, 1))
+    assert svg == (
+        '<?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg">'
+        '<rect id="sky"/><g fill="#f00"/><path id="cap"/></svg>\n'
+    )
+    assert render_svg(TEMPLATE, TRAITS, (0, 0, 0)) == TEMPLATE
+
+
+def test_render_svg_keeps_editor_markup():
+    template = BASE_SVG.read_text()
+    svg = render_svg(template, TRAITS, (0, 1, 2))
+    assert svg.replace('<rect id="sky"/>', "").replace('<path id="crown"/>', "") == template
+    assert svg.index('<rect id="sky"/>') == template.index(">", template.index("<svg")) + 1
+    assert svg.endswith('<path id="crown"/></svg>\n')
+
+
+def _renderer(tmp_path, template=TEMPLATE):
+    template_path = tmp_path / "template.svg"
+    template_path.write_text(template)
+    return GenerativeRenderer(
+        template_path,
+        TRAITS,
+        output_path=tmp_path / "artwork",
+        manifest_path=tmp_path / "render-manifest.json",
+        max_workers=2,
+    )
+
+
+def _mtimes(directory):
+    return {path.name: path.stat().st_mtime_ns for path in directory.iterdir()}
+
+
+def test_renderer_writes_token_files(tmp_path):
+    renderer = _renderer(tmp_path)
+    tokens = renderer.render(12, seed=5)
+    combinations = enumerate_combinations(TRAITS, 12, seed=5)
+
+    assert [token.token_id for token in tokens] == list(range(12))
+    assert not any(token.cached for token in tokens)
+    # Zero-padded names keep token order when sorted, as 'pin_artwork()' does.
+    assert get_artwork_paths(renderer.output_path) == [token.path for token in tokens]
+    assert tokens[10].path.name == "10.svg" and tokens[0].path.name == "00.svg"
+    for token, combination in zip(tokens, combinations):
+        assert token.path.read_text() == render_svg(TEMPLATE, TRAITS, combination)
+        assert token.attributes == [
+            {"trait_type": trait.name, "value": trait.options[i].value}
+            for trait, i in zip(TRAITS, combination)
+        ]
+
+
+def test_renderer_only_renders_what_changed(tmp_path):
+    renderer = _renderer(tmp_path)
+    renderer.render(6, seed=5)
+    rendered = _mtimes(renderer.output_path)
+
+    again = renderer.render(6, seed=5)
+    assert all(token.cached for token in again)
+    assert _mtimes(renderer.output_path) == rendered
+
+    # Changing one option only renders the tokens using it again.
+    red = TRAITS[0].options[1]._replace(replacements=(("#000", "#e00"),))
+    renderer.traits[0] = TRAITS[0]._replace(
+        options=(TRAITS[0].options[0], red, TRAITS[0].options[2])
+    )
+    changed = renderer.render(6, seed=5)
+    combinations = enumerate_combinations(TRAITS, 6, seed=5)
+    assert [not token.cached for token in changed] == [c[0] == 1 for c in combinations]
+
+    # Changing the template renders everything again.
+    renderer.template_path.write_text(TEMPLATE.replace("<g", "<g id='body'"))
+    assert not any(token.cached for token in renderer.render(6, seed=5))
+
+
+def test_renderer_renames_and_removes_files(tmp_path):
+    renderer = _renderer(tmp_path)
+    renderer.render(10, seed=5)
+
+    # Eleven tokens need two digits, so existing files are renamed, not rendered again.
+    tokens = renderer.render(11, seed=5)
+    assert [token.cached for token in tokens] == [True] * 10 + [False]
+    assert sorted(path.name for path in renderer.output_path.iterdir()) == [
+        f"{token_id:02d}.svg" for token_id in range(11)
+    ]
+
+    renderer.render(3, seed=5)
+    assert sorted(path.name for path in renderer.output_path.iterdir()) == [
+        "0.svg",
+        "1.svg",
+        "2.svg",
+    ]
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Cumulative import time budget for 'import sdk', in microseconds.
+IMPORT_TIME_BUDGET = int(os.environ.get("SDK_IMPORT_TIME_BUDGET", 50_000))
+DEFERRED_MODULES = ("ape", "click", "keyring", "pydantic", "requests", "aiohttp")
+
+ROOT = Path(__file__).parent.parent
+
+
+def _import_sdk(*args):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT), str(ROOT / "sdk")])}
+    return subprocess.run(
+        [sys.executable, *args, "-c", "import sdk; import sys; print(','.join(sys.modules))"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_defers_heavy_modules():
+    loaded = set(_import_sdk().stdout.strip().split(","))
+    assert not loaded.intersection(DEFERRED_MODULES)
+
+
+def test_import_time_budget():
+    stderr = _import_sdk("-X", "importtime").stderr
+    # Lines look like 'import time:  self [us] | cumulative | imported package'.
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2] == " sdk"
+    )
+    assert cumulative <= IMPORT_TIME_BUDGET, f"'import sdk' took {cumulative}us"
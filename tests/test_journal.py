@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+import pytest
+from nft_project import IPinning, NFTProject
+from nft_project.cid import compute_cid
+from nft_project.journal import JournalEntry, PinJournal, ProgressTracker
+from nft_project.project import PinArtworkError
+
+
+class _CountingPinning(IPinning):
+    # Records every call; paths in 'failing' raise when pinned.
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def get_pins(self):
+        self.calls.append(("get_pins",))
+        return []
+
+    def get_hash(self, file_name):
+        self.calls.append(("get_hash", file_name))
+        return None
+
+    def pin_file(self, file_path):
+        self.calls.append(("pin_file", file_path.name))
+        if file_path.name in self.failing:
+            raise ConnectionError(f"Could not pin {file_path.name}.")
+
+        return compute_cid(file_path)
+
+    def unpin(self, ipfs_hash):
+        pass
+
+
+@pytest.fixture
+def artwork_path(tmp_path):
+    path = tmp_path / "artwork"
+    path.mkdir()
+    for token_id in range(5):
+        (path / f"{token_id}.png").write_bytes(f"journaled {token_id}".encode())
+
+    return path
+
+
+def _expected(artwork_path):
+    return {path.name: compute_cid(path) for path in sorted(artwork_path.iterdir())}
+
+
+def test_resume_pins_only_what_did_not_finish(tmp_path, artwork_path):
+    journal_directory = tmp_path / "jobs"
+    failing = _CountingPinning(failing={"3.png"})
+    project = NFTProject("journal", failing, journal_directory=journal_directory)
+    with pytest.raises(PinArtworkError) as error:
+        project.pin_artwork(artwork_path, job_id="drop")
+
+    assert list(error.value.errors) == ["3.png"]
+    journaled = PinJournal.for_job("drop", journal_directory).load()
+    assert sorted(Path(p).name for p in journaled) == ["0.png", "1.png", "2.png", "4.png"]
+
+    resumed = _CountingPinning()
+    progress = []
+    project = NFTProject("journal", resumed, journal_directory=journal_directory)
+    artwork_hashes = project.pin_artwork(artwork_path, job_id="drop", on_progress=progress.append)
+
+    assert artwork_hashes == _expected(artwork_path)
+    assert resumed.calls == [("get_hash", "3.png"), ("pin_file", "3.png")]
+    assert [(p.completed, p.failed, p.total) for p in progress] == [(4, 0, 5), (5, 0, 5)]
+    assert progress[0].eta is None
+    assert progress[-1].eta == 0
+
+    # A finished job resumes without any calls at all.
+    finished = _CountingPinning()
+    project = NFTProject("journal", finished, journal_directory=journal_directory)
+    assert project.pin_artwork(artwork_path, job_id="drop") == artwork_hashes
+    assert finished.calls == []
+
+
+def test_resume_repins_files_changed_since_journaled(tmp_path, artwork_path):
+    journal_directory = tmp_path / "jobs"
+    project = NFTProject("journal", _CountingPinning(), journal_directory=journal_directory)
+    project.pin_artwork(artwork_path, job_id="changed")
+
+    changed = artwork_path / "2.png"
+    changed.write_bytes(b"journaled, then changed")
+    pinning = _CountingPinning()
+    project = NFTProject("journal", pinning, journal_directory=journal_directory)
+
+    assert project.pin_artwork(artwork_path, job_id="changed") == _expected(artwork_path)
+    assert pinning.calls == [("get_hash", "2.png"), ("pin_file", "2.png")]
+
+    project.forget_pins(job_id="changed")
+    assert not PinJournal.for_job("changed", journal_directory).path.exists()
+
+
+def test_journal_ignores_cut_short_lines(tmp_path):
+    path = tmp_path / "artwork.png"
+    path.write_bytes(b"artwork")
+    journal = PinJournal(tmp_path / "job.jsonl")
+    journal.record(path, "QmFirst")
+    journal.record(path, "QmSecond")
+    with open(journal.path, "a") as file:
+        file.write('{"path": "other.png", "cid": "QmCut')
+
+    stat = os.stat(path)
+    entry = JournalEntry("QmSecond", stat.st_size, stat.st_mtime_ns)
+    assert journal.load() == {str(path): entry}
+    assert journal.is_current(path, entry)
+
+    path.write_bytes(b"artwork, changed")
+    assert not journal.is_current(path, entry)
+    path.unlink()
+    assert not journal.is_current(path, entry)
+
+
+def test_progress_estimates_from_this_run_only():
+    reports = []
+    tracker = ProgressTracker(10, reports.append)
+    tracker.skip(6)
+    tracker._started -= 2  # Two seconds for the first item of this run.
+    tracker.complete()
+    tracker.complete(failed=True)
+
+    assert [(r.completed, r.failed) for r in reports] == [(6, 0), (7, 0), (7, 1)]
+    assert reports[0].eta is None
+    assert reports[1].eta == pytest.approx(3 * reports[1].elapsed)
+    assert reports[2].fraction == 0.8
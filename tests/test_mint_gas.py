@@ -0,0 +1,56 @@
+"""
+Gas benchmark for minting: one ``safeMint`` transaction per receiver against
+chunked ``batchMint`` transactions. Run with ``ape test -s`` to see the numbers.
+"""
+
+import pytest
+
+from ..sdk.minting import iter_batches
+
+BASE_URI = "ipfs://QmaDWiD52oLVVhUscPTyPMd8ftnxuuzGPaDHPYw2stZTH7/"
+NUMBER_OF_TOKENS = 50
+BATCH_SIZE = 25
+
+
+@pytest.fixture
+def receivers(accounts):
+    addresses = [a.address for a in accounts]
+    return [addresses[i % len(addresses)] for i in range(NUMBER_OF_TOKENS)]
+
+
+def test_batch_mint_uses_less_gas(project, owner, receivers):
+    looped = owner.deploy(project.PoofPoof, BASE_URI)
+    loop_gas = sum(
+        looped.safeMint(receiver, f"{token_id}.json", sender=owner).gas_used
+        for token_id, receiver in enumerate(receivers)
+    )
+
+    batched = owner.deploy(project.PoofPoof, BASE_URI)
+    batch_gas = sum(
+        batched.batchMint(batch, sender=owner).gas_used
+        for batch in iter_batches(receivers, BATCH_SIZE)
+    )
+
+    print(
+        f"\nMinting {NUMBER_OF_TOKENS} tokens: safeMint loop {loop_gas} gas "
+        f"({loop_gas // NUMBER_OF_TOKENS}/token), batchMint {batch_gas} gas "
+        f"({batch_gas // NUMBER_OF_TOKENS}/token)."
+    )
+    assert batch_gas < loop_gas
+    for token_id in (0, NUMBER_OF_TOKENS - 1):
+        assert batched.tokenURI(token_id) == looped.tokenURI(token_id)
+
+
+def test_batch_mint_sets_derived_uris_across_bitmap_words(project, owner, accounts):
+    # The second batch spans the first two 256-token words of the bitmap.
+    receivers = [accounts[i % len(accounts)].address for i in range(260)]
+    poofpoof = owner.deploy(project.PoofPoof, BASE_URI)
+    for batch in iter_batches(receivers, 130):
+        poofpoof.batchMint(batch, sender=owner)
+
+    for token_id in (0, 129, 130, 255, 256, 259):
+        assert poofpoof.tokenURI(token_id) == f"{BASE_URI}{token_id}.json"
+
+    # Bits past the batch stay clear, so later tokens keep their stored URIs.
+    poofpoof.safeMint(receivers[0], "stored.json", sender=owner)
+    assert poofpoof.tokenURI(260) == f"{BASE_URI}stored.json"
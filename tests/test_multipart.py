@@ -0,0 +1,89 @@
+import mimetypes
+from pathlib import Path
+
+import pytest
+import requests
+import urllib3.filepost
+from pinata.exceptions import PinError
+from pinata.multipart import MultipartEncoder
+
+BOUNDARY = "multipart-test-boundary"
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = tmp_path / "folder"
+    (directory / "sub").mkdir(parents=True)
+    (directory / "0.json").write_bytes(b'{"name": "zero"}')
+    (directory / "empty.txt").write_bytes(b"")
+    (directory / "sub" / 'a "quoted" name.png').write_bytes(bytes(range(256)) * 300)
+    return directory
+
+
+def _requests_body(monkeypatch, parts):
+    # What 'requests' would build in memory for the same files.
+    monkeypatch.setattr(urllib3.filepost, "choose_boundary", lambda: BOUNDARY)
+    files = [
+        (
+            "file",
+            (
+                name,
+                source.read_bytes() if isinstance(source, Path) else source,
+                mimetypes.guess_type(name)[0] or "application/octet-stream",
+            ),
+        )
+        for name, source in parts
+    ]
+    return requests.Request("POST", "http://localhost/", files=files).prepare()
+
+
+def test_directory_body_matches_requests(monkeypatch, directory):
+    encoder = MultipartEncoder.from_directory(directory, boundary=BOUNDARY, chunk_size=1000)
+    parts = [
+        ("folder/0.json", directory / "0.json"),
+        ("folder/empty.txt", directory / "empty.txt"),
+        ('folder/sub/a "quoted" name.png', directory / "sub" / 'a "quoted" name.png'),
+    ]
+    expected = _requests_body(monkeypatch, parts)
+
+    assert encoder.read() == expected.body
+    assert encoder.headers == {
+        "Content-Type": expected.headers["Content-Type"],
+        "Content-Length": expected.headers["Content-Length"],
+    }
+    assert len(encoder) == len(expected.body)
+
+
+def test_in_memory_body_matches_requests(monkeypatch):
+    parts = [("meta/0.json", b'{"token": 0}'), ("meta/1", b"\x00\r\n--" * 100)]
+    encoder = MultipartEncoder(parts, boundary=BOUNDARY)
+    assert encoder.read() == _requests_body(monkeypatch, parts).body
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_read_in_pieces_and_rewind(monkeypatch, directory, size):
+    encoder = MultipartEncoder.from_directory(directory, boundary=BOUNDARY, chunk_size=1000)
+    body = encoder.read()
+    encoder.seek(0)
+
+    pieces = []
+    for piece in iter(lambda: encoder.read(size), b""):
+        assert len(piece) <= size
+        pieces.append(piece)
+
+    assert b"".join(pieces) == body
+
+
+async def test_async_body_matches_sync(directory):
+    encoder = MultipartEncoder.from_directory(directory, boundary=BOUNDARY, chunk_size=1000)
+    chunks = [chunk async for chunk in encoder.aiter_chunks()]
+    assert b"".join(chunks) == encoder.read()
+
+
+def test_file_changed_after_length_was_computed(tmp_path):
+    path = tmp_path / "growing.txt"
+    path.write_bytes(b"before")
+    encoder = MultipartEncoder.from_file(path, boundary=BOUNDARY)
+    path.write_bytes(b"after, and longer")
+    with pytest.raises(PinError):
+        encoder.read()
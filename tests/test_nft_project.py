@@ -0,0 +1,164 @@
+import pytest
+from nft_project import IPinning, NFTProject
+from nft_project.cid import compute_cid, directory_cid
+from pinata import AsyncPinata, Pinata
+from pinata.scheduler import RequestScheduler
+
+from .pinata_emulator import PinataEmulator
+
+
+@pytest.fixture
+def nft_project(pinata_emulator, tmp_path):
+    pinata = Pinata.from_api_key("test", "test", host_address=pinata_emulator.url)
+    return NFTProject(
+        "test",
+        pinata,
+        manifest_path=tmp_path / "manifest.json",
+        state_path=tmp_path / "pins.sqlite",
+        journal_directory=tmp_path / "jobs",
+    )
+
+
+@pytest.fixture
+def artwork_path(tmp_path):
+    path = tmp_path / "artwork"
+    path.mkdir()
+    return path
+
+
+def _image(content: bytes) -> str:
+    return f"ipfs://{compute_cid(content)}"
+
+
+def test_pin_artwork_repins_changed_file(nft_project, pinata_emulator, artwork_path):
+    artwork_file = artwork_path / "0.png"
+    artwork_file.write_bytes(b"before")
+    assert nft_project.pin_artwork(artwork_path) == {"0.png": compute_cid(b"before")}
+
+    artwork_file.write_bytes(b"after, with a new size")
+    expected_hash = compute_cid(artwork_file.read_bytes())
+    assert nft_project.pin_artwork(artwork_path) == {"0.png": expected_hash}
+    assert nft_project.pin_state.get(str(artwork_file)).cid == expected_hash
+    assert expected_hash in [pin["ipfs_pin_hash"] for pin in pinata_emulator.pinned]
+
+
+def test_watch_artwork_keeps_shared_name_after_delete(nft_project, artwork_path):
+    # Pinned by name, files in different directories share a key in the hashes.
+    first, second = artwork_path / "a" / "shared.png", artwork_path / "b" / "shared.png"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(f"watched {path.parent.name}".encode())
+
+    with nft_project.watch_artwork(artwork_path, debounce=0, use_inotify=False) as watcher:
+        expected_hash = nft_project.pin_artwork_changes([first])[0][first]
+        second.unlink()
+        watcher.poll(timeout=0.5)
+        assert watcher.hashes == {"shared.png": expected_hash}
+
+
+async def test_pin_artwork_async_content_addressed(pinata_emulator, artwork_path, tmp_path):
+    # Identical files in different directories are one upload, keyed by relative path.
+    for name in ("a", "b"):
+        path = artwork_path / name / "async-same.png"
+        path.parent.mkdir()
+        path.write_bytes(b"pinned once, asynchronously")
+
+    (artwork_path / "async-other.png").write_bytes(b"pinned asynchronously")
+    expected = {
+        "a/async-same.png": compute_cid(b"pinned once, asynchronously"),
+        "async-other.png": compute_cid(b"pinned asynchronously"),
+        "b/async-same.png": compute_cid(b"pinned once, asynchronously"),
+    }
+    async with AsyncPinata.from_api_key("test", "test", host_address=pinata_emulator.url) as pinata:
+        nft_project = NFTProject("test", pinata, content_addressed=True)
+        assert await nft_project.pin_artwork_async(artwork_path) == expected
+
+    pinned_names = [pin["metadata"]["name"] for pin in pinata_emulator.pinned]
+    assert pinned_names.count("async-same.png") == 1
+    assert pinned_names.count("async-other.png") == 1
+
+
+def test_pin_artwork_concurrently_while_throttled(tmp_path, artwork_path):
+    contents = {f"{token_id}.png": f"concurrent {token_id}".encode() for token_id in range(12)}
+    for name, content in contents.items():
+        (artwork_path / name).write_bytes(content)
+
+    # A private emulator that throttles a third of all requests.
+    with PinataEmulator(throttle_rate=0.3, retry_after=0, seed=3) as emulator:
+        scheduler = RequestScheduler(requests_per_minute=60_000, max_concurrency=4)
+        pinata = Pinata.from_api_key("test", "test", host_address=emulator.url, scheduler=scheduler)
+        nft_project = NFTProject("test", pinata, state_path=tmp_path / "pins.sqlite")
+        pinned = []
+        artwork_hashes = nft_project.pin_artwork(
+            artwork_path, max_workers=4, on_pinned=lambda path, cid: pinned.append(path.name)
+        )
+
+        assert emulator.throttled
+        assert emulator.requests["POST /pinning/pinFileToIPFS"] >= len(contents)
+
+    expected = {name: compute_cid(content) for name, content in sorted(contents.items())}
+    assert list(artwork_hashes.items()) == list(expected.items())
+    assert sorted(pinned) == sorted(contents)
+    assert sorted(pin["metadata"]["name"] for pin in emulator.pinned) == sorted(contents)
+
+
+def test_publish_metadata_only_when_it_changed(nft_project, pinata_emulator, tmp_path):
+    images = [_image(f"incremental {token_id}".encode()) for token_id in range(3)]
+    uploads = pinata_emulator.requests
+
+    first = nft_project.publish_metadata(nft_project.create_nft_data(images))
+    assert first.republished
+    assert first.changed_token_ids == [0, 1, 2]
+
+    published = uploads["POST /pinning/pinFileToIPFS"]
+    unchanged = nft_project.publish_metadata(nft_project.create_nft_data(images))
+    assert (unchanged.cid, unchanged.republished) == (first.cid, False)
+    assert uploads["POST /pinning/pinFileToIPFS"] == published
+
+    # The manifest outlives the project object.
+    reopened = NFTProject("test", nft_project._ipfs, manifest_path=tmp_path / "manifest.json")
+    assert reopened.pin_metadata(reopened.create_nft_data(images), incremental=True) == first.cid
+    assert uploads["POST /pinning/pinFileToIPFS"] == published
+
+    images[1] = _image(b"incremental, changed")
+    changed = nft_project.publish_metadata(nft_project.create_nft_data(images))
+    assert changed.republished
+    assert changed.changed_token_ids == [1]
+    documents = nft_project._create_metadata_documents(nft_project.create_nft_data(images))
+    assert changed.cid == directory_cid([(name, document) for _, name, document in documents])
+
+    removed = nft_project.publish_metadata(nft_project.create_nft_data(images[:2]))
+    assert removed.republished
+    assert removed.changed_token_ids == [2]
+
+
+class _FilePinning(IPinning):
+    # Only pins files, so directories go through the default 'pin_directory()'.
+    def __init__(self):
+        self.pinned = {}
+
+    def get_pins(self):
+        return []
+
+    def get_hash(self, file_name):
+        return None
+
+    def pin_file(self, file_path):
+        files = sorted(p for p in file_path.rglob("*") if p.is_file())
+        entries = [(p.relative_to(file_path).as_posix(), p.read_bytes()) for p in files]
+        self.pinned[file_path.name] = entries
+        return directory_cid(entries)
+
+    def unpin(self, ipfs_hash):
+        pass
+
+
+def test_pin_metadata_without_in_memory_directory_support():
+    pinning = _FilePinning()
+    nft_project = NFTProject("fallback", pinning, metadata_file_pattern="meta/{token_id}.json")
+    nft_data = nft_project.create_nft_data([_image(b"fallback 0"), _image(b"fallback 1")])
+    documents = nft_project._create_metadata_documents(nft_data)
+    expected = [(name, document) for _, name, document in documents]
+
+    assert nft_project.pin_metadata(nft_data) == directory_cid(expected)
+    assert pinning.pinned == {"fallback": expected}
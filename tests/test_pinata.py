@@ -0,0 +1,137 @@
+import pytest
+from nft_project.cid import directory_cid
+from pinata import AsyncPinata, Pinata
+from pinata.exceptions import NoContentError, PinataInternalServiceError
+
+from .pinata_emulator import PinataEmulator
+
+MISSING_HASH = "QmNLei78zWmzUdbeRB3CiUfAizWUrbeeZh5K1rhAQKCh51"
+
+
+@pytest.fixture
+def pinata(pinata_emulator):
+    return Pinata.from_api_key("test", "test", host_address=pinata_emulator.url)
+
+
+@pytest.fixture
+def listing_emulator():
+    # A private emulator, so that the number of pins and requests is known.
+    with PinataEmulator() as emulator:
+        yield emulator
+
+
+def _add_pins(emulator, count):
+    for index in range(count):
+        emulator.add_pin(f"Qm{index:044d}", f"listed-{index}.png", index)
+
+    # Unpinned content is never listed.
+    emulator.add_pin("Qm" + "u" * 44, "unpinned.png", 0)
+    emulator.unpin("Qm" + "u" * 44)
+    return [f"Qm{index:044d}" for index in reversed(range(count))]
+
+
+@pytest.fixture
+def server_error(pinata, monkeypatch):
+    def unpin(content_hash):
+        raise PinataInternalServiceError("503 Server Error: Service Unavailable")
+
+    monkeypatch.setattr(pinata.pinning, "unpin", unpin)
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@pytest.mark.parametrize("count,pages", [(0, 1), (6, 3), (7, 3)])
+def test_iter_pins_pages_through_every_pin(listing_emulator, prefetch, count, pages):
+    expected = _add_pins(listing_emulator, count)
+    pinata = Pinata.from_api_key("test", "test", host_address=listing_emulator.url)
+
+    pins = pinata.iter_pins(page_size=3, prefetch=prefetch)
+    assert [pin.content_hash for pin in pins] == expected
+    assert listing_emulator.requests["GET /data/pinList"] == pages
+
+
+def test_iter_pins_is_lazy(listing_emulator):
+    _add_pins(listing_emulator, 7)
+    pinata = Pinata.from_api_key("test", "test", host_address=listing_emulator.url)
+
+    pins = pinata.iter_pins(page_size=3, prefetch=False)
+    assert [next(pins) for _ in range(3)][-1].file_name == "listed-4.png"
+    assert listing_emulator.requests["GET /data/pinList"] == 1
+
+
+async def test_async_get_pins_pages_through_every_pin(listing_emulator):
+    expected = _add_pins(listing_emulator, 7)
+    url = listing_emulator.url
+    async with AsyncPinata.from_api_key("test", "test", host_address=url) as pinata:
+        records = [r async for r in pinata.data.search_pins_iter(page_size=3, status="pinned")]
+
+    assert [record.content_hash for record in records] == expected
+    assert listing_emulator.requests["GET /data/pinList"] == 3
+
+
+def test_unpin_missing_content(pinata):
+    with pytest.raises(NoContentError):
+        pinata.unpin(MISSING_HASH)
+
+    assert pinata.unpin(MISSING_HASH, ignore_errors=True) is None
+
+
+def test_unpin_server_error(pinata, server_error):
+    with pytest.raises(PinataInternalServiceError):
+        pinata.unpin(MISSING_HASH)
+
+    assert pinata.unpin(MISSING_HASH, ignore_errors=True) is None
+
+
+def test_unpin_many_reports_missing_content_as_not_pinned(pinata, tmp_path):
+    path = tmp_path / "unpin-many.txt"
+    path.write_text("unpin many")
+    content_hash = pinata.pin_file(path)
+
+    report = pinata.unpin_many([content_hash, MISSING_HASH])
+    assert report.unpinned == [content_hash]
+    assert report.not_pinned == [MISSING_HASH]
+    assert report.ok
+
+
+def test_unpin_many_reports_server_errors_as_failed(pinata, server_error):
+    report = pinata.unpin_many([MISSING_HASH])
+    assert list(report.failed) == [MISSING_HASH]
+    assert not report.not_pinned
+
+
+async def test_async_get_pin_and_hash(pinata_emulator, tmp_path):
+    path = tmp_path / "async-get-pin.txt"
+    path.write_text("async get pin")
+    async with AsyncPinata.from_api_key("test", "test", host_address=pinata_emulator.url) as pinata:
+        content_hash = await pinata.pin_file(path)
+        pinata.index.invalidate()
+
+        assert (await pinata.get_pin(content_hash)).file_name == path.name
+        assert await pinata.get_hash(path.name) == content_hash
+        assert await pinata.get_pin(MISSING_HASH) is None
+
+
+async def test_async_index_keeps_working_after_failed_listing(pinata_emulator, monkeypatch):
+    async with AsyncPinata.from_api_key("test", "test", host_address=pinata_emulator.url) as pinata:
+
+        async def get_pins():
+            raise PinataInternalServiceError("502 Bad Gateway")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(pinata, "get_pins", get_pins)
+            with pytest.raises(PinataInternalServiceError):
+                await pinata.get_hash("async-failed-listing.txt")
+
+        # The failed listing no longer tracks changes, so nothing lingers into the next one.
+        assert pinata.index._changes is None
+        assert await pinata.get_hash("async-failed-listing.txt") is None
+
+
+def test_pin_directory_from_memory(pinata, pinata_emulator):
+    files = [("0.json", b'{"tokenId": 0}'), ("1.json", b'{"tokenId": 1}'), ("sub/2.json", b"{}")]
+    content_hash = pinata.pin_directory("in-memory-folder", files)
+
+    assert content_hash == directory_cid(files)
+    assert pinata.get_hash("in-memory-folder") == content_hash
+    pin = next(p for p in pinata_emulator.pinned if p["ipfs_pin_hash"] == content_hash)
+    assert pin["metadata"]["name"] == "in-memory-folder"
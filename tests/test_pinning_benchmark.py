@@ -0,0 +1,112 @@
+"""
+Pinning throughput benchmark against the local Pinata emulator. Run with
+``ape test -s tests/test_pinning_benchmark.py`` to see the report. The emulated
+latency, bandwidth and throttling can be set with ``PINATA_BENCH_LATENCY``,
+``PINATA_BENCH_BANDWIDTH`` and ``PINATA_BENCH_THROTTLE_RATE``, and the client's
+rate limit with ``PINATA_BENCH_REQUESTS_PER_MINUTE``. The default rate limit is
+far above Pinata's so that it does not dominate the numbers.
+"""
+
+import os
+import time
+from typing import Dict, List
+
+import pytest
+from nft_project import NFTProject
+from nft_project.cid import compute_cid
+from nft_project.models import NFT
+from pinata import Pinata
+from pinata.scheduler import RequestScheduler
+from pinata.tracing import RecordingTracer
+
+from .pinata_emulator import PinataEmulator
+
+NUMBER_OF_FILES = 200
+FILE_SIZE = 64 * 1024
+MAX_WORKERS = 8
+LATENCY = float(os.environ.get("PINATA_BENCH_LATENCY", 0.02))
+BANDWIDTH = float(os.environ.get("PINATA_BENCH_BANDWIDTH", 0)) or None  # Bytes per second.
+THROTTLE_RATE = float(os.environ.get("PINATA_BENCH_THROTTLE_RATE", 0.05))
+REQUESTS_PER_MINUTE = float(os.environ.get("PINATA_BENCH_REQUESTS_PER_MINUTE", 60_000))
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _report(name: str, files: int, size: int, elapsed: float, tracer: RecordingTracer) -> Dict:
+    latencies = [span.total for span in tracer.spans]
+    report = {
+        "files/s": files / elapsed,
+        "MB/s": size / elapsed / 1_000_000,
+        "p50 ms": _percentile(latencies, 0.5) * 1000,
+        "p99 ms": _percentile(latencies, 0.99) * 1000,
+        "requests": len(latencies),
+        "429s": sum(span.status == 429 for span in tracer.spans),
+    }
+    print(f"\n{name}: " + ", ".join(f"{k} {v:.1f}" for k, v in report.items()))
+    return report
+
+
+@pytest.fixture
+def emulator():
+    with PinataEmulator(
+        latency=LATENCY, bandwidth=BANDWIDTH, throttle_rate=THROTTLE_RATE, retry_after=0, seed=1
+    ) as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def tracer():
+    return RecordingTracer()
+
+
+@pytest.fixture
+def nft_project(emulator, tracer, tmp_path):
+    scheduler = RequestScheduler(
+        requests_per_minute=REQUESTS_PER_MINUTE, max_concurrency=MAX_WORKERS
+    )
+    pinata = Pinata.from_api_key(
+        "key", "secret", host_address=emulator.url, scheduler=scheduler, tracer=tracer
+    )
+    return NFTProject("benchmark", pinata, manifest_path=tmp_path / "manifest.json")
+
+
+@pytest.fixture
+def artwork_path(tmp_path):
+    path = tmp_path / "artwork"
+    path.mkdir()
+    for i in range(NUMBER_OF_FILES):
+        (path / f"{i:04}.png").write_bytes(os.urandom(FILE_SIZE))
+
+    return path
+
+
+def test_pin_artwork_throughput(nft_project, emulator, tracer, artwork_path):
+    started = time.perf_counter()
+    artwork_hashes = nft_project.pin_artwork(artwork_path, max_workers=MAX_WORKERS)
+    elapsed = time.perf_counter() - started
+
+    _report("pin_artwork", NUMBER_OF_FILES, NUMBER_OF_FILES * FILE_SIZE, elapsed, tracer)
+    assert len(artwork_hashes) == len(emulator.pinned) == NUMBER_OF_FILES
+    first = artwork_path / "0000.png"
+    assert artwork_hashes[first.name] == compute_cid(first.read_bytes())
+    # The workers' lookups on the cold pin index share a single listing.
+    listings = [s for s in tracer.spans if s.endpoint.endswith("pinList") and s.status == 200]
+    assert len(listings) == 1
+
+
+def test_pin_metadata_throughput(nft_project, emulator, tracer):
+    nfts = [
+        NFT(tokenId=i, name=f"benchmark #{i}", image=f"ipfs://{compute_cid(str(i).encode())}")
+        for i in range(NUMBER_OF_FILES)
+    ]
+
+    started = time.perf_counter()
+    content_hash = nft_project.pin_metadata(nfts)
+    elapsed = time.perf_counter() - started
+
+    size = sum(pin["size"] for pin in emulator.pinned)
+    _report("pin_metadata", NUMBER_OF_FILES, size, elapsed, tracer)
+    assert [pin["ipfs_pin_hash"] for pin in emulator.pinned] == [content_hash]
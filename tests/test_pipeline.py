@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+from nft_project import IPinning, NFTProject
+from nft_project.cid import compute_cid, directory_cid
+from nft_project.pipeline import MetadataPipeline
+
+
+class _LocalPinning(IPinning):
+    # Pins by computing CIDs locally; 'before_pin' can hold an upload back.
+    def __init__(self, before_pin=None):
+        self.before_pin = before_pin
+        self.uploads = []
+
+    def get_pins(self):
+        return []
+
+    def get_hash(self, file_name):
+        return None
+
+    def pin_file(self, file_path):
+        if self.before_pin:
+            self.before_pin(file_path)
+
+        self.uploads.append(file_path.name)
+        return compute_cid(file_path)
+
+    def unpin(self, ipfs_hash):
+        pass
+
+
+@pytest.fixture
+def artwork_path(tmp_path):
+    path = tmp_path / "artwork"
+    path.mkdir()
+    for token_id in range(5):
+        (path / f"{token_id}.png").write_bytes(f"pipeline {token_id}".encode())
+
+    return path
+
+
+def _project(tmp_path, pinning, **kwargs):
+    return NFTProject("pipeline", pinning, manifest_path=tmp_path / "manifest.json", **kwargs)
+
+
+def test_pipeline_matches_serial_publish(tmp_path, artwork_path):
+    result = MetadataPipeline(_project(tmp_path, _LocalPinning())).run(artwork_path)
+
+    serial = _project(tmp_path / "serial", _LocalPinning())
+    artwork_hashes = serial.pin_artwork(artwork_path)
+    nft_data = serial.create_nft_data([f"ipfs://{cid}" for cid in artwork_hashes.values()])
+    documents = serial._create_metadata_documents(nft_data)
+
+    assert result.artwork_hashes == artwork_hashes
+    assert result.cid == serial.pin_metadata(nft_data)
+    assert result.cid == directory_cid([(name, doc) for _, name, doc in documents])
+    assert result.republished
+
+    again = MetadataPipeline(_project(tmp_path, _LocalPinning())).run(artwork_path)
+    assert (again.cid, again.republished) == (result.cid, False)
+
+
+def test_metadata_renders_while_artwork_uploads(tmp_path, artwork_path):
+    rendered = threading.Event()
+
+    def before_pin(path):
+        # The last upload waits until the first token's metadata is rendered.
+        if path.name == "4.png":
+            assert rendered.wait(5), "Rendering waited for every upload."
+
+    project = _project(tmp_path, _LocalPinning(before_pin))
+    create_metadata_document = project.create_metadata_document
+
+    def create_and_signal(*args, **kwargs):
+        document = create_metadata_document(*args, **kwargs)
+        rendered.set()
+        return document
+
+    project.create_metadata_document = create_and_signal  # type: ignore
+    pipeline = MetadataPipeline(project, queue_size=1)
+    result = pipeline.run(artwork_path)
+
+    assert len(result.artwork_hashes) == 5
+    assert {name: stats.items for name, stats in result.stages.items()} == {
+        "pin": 5,
+        "render": 5,
+        "publish": 5,
+    }
+    assert all(stats.elapsed >= stats.busy > 0 for stats in result.stages.values())
+    assert result.stages["render"].started_at < result.stages["pin"].finished_at
+
+
+def test_slow_rendering_holds_uploads_back(tmp_path, artwork_path):
+    project = _project(tmp_path, _LocalPinning())
+    create_metadata_document = project.create_metadata_document
+    in_queue = []
+    pinning = project._ipfs
+
+    def slow_create(*args, **kwargs):
+        # Uploaded but not yet rendered: this one, one queued and one waiting to be.
+        in_queue.append(len(pinning.uploads) - len(in_queue))
+        time.sleep(0.01)
+        return create_metadata_document(*args, **kwargs)
+
+    project.create_metadata_document = slow_create  # type: ignore
+    MetadataPipeline(project, queue_size=1).run(artwork_path)
+    assert max(in_queue) <= 3
+
+
+def test_render_errors_are_raised(tmp_path, artwork_path):
+    def modifier(nft):
+        raise ValueError(f"Cannot render token {nft.tokenId}.")
+
+    project = _project(tmp_path, _LocalPinning(), nft_data_modifier=modifier)
+    with pytest.raises(ValueError, match="Cannot render"):
+        MetadataPipeline(project, queue_size=1).run(artwork_path)
@@ -5,3 +5,14 @@ def test_safe_mint(poofpoof, owner, token_receiver, metadata_cid):
     actual_token_uri = poofpoof.tokenURI(0)
     expected_token_uri = f"{metadata_cid}0.json"
     assert actual_token_uri == expected_token_uri
+
+
+def test_batch_mint(project, owner, accounts, metadata_cid):
+    poofpoof = owner.deploy(project.PoofPoof, metadata_cid)
+    receivers = [a.address for a in accounts[1:4]]
+    receipt = poofpoof.batchMint(receivers, sender=owner)
+    assert receipt
+
+    for token_id, receiver in enumerate(receivers):
+        assert poofpoof.ownerOf(token_id) == receiver
+        assert poofpoof.tokenURI(token_id) == f"{metadata_cid}{token_id}.json"
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from ..sdk.receivers import ReceiverSource, checksum_addresses
+
+eth_utils = pytest.importorskip("eth_utils")
+
+# The test vectors from EIP-55.
+EIP55_ADDRESSES = [
+    # All caps.
+    "0x52908400098527886E0F7030069857D2E4169EE7",
+    "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+    # All lowercase.
+    "0xde709f2102306220921060314715629080e2fb77",
+    "0x27b1fdb04752bbc536007a920d24acb045561c26",
+    # Normal.
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+
+@pytest.mark.parametrize("case", [str.lower, str.upper, lambda a: a])
+def test_checksum_addresses_eip55_vectors(case):
+    addresses = ["0x" + case(address[2:]) for address in EIP55_ADDRESSES]
+    assert checksum_addresses(addresses) == EIP55_ADDRESSES
+
+
+def test_checksum_addresses_matches_eth_utils():
+    rng = random.Random(55)
+    addresses = ["0x" + rng.getrandbits(160).to_bytes(20, "big").hex() for _ in range(1000)]
+    expected = [eth_utils.to_checksum_address(address) for address in addresses]
+    assert checksum_addresses(addresses) == expected
+    assert checksum_addresses(addresses[:1]) == expected[:1]
+    assert checksum_addresses([]) == []
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "",
+        "0x",
+        "52908400098527886e0f7030069857d2e4169ee7",
+        "0x52908400098527886e0f7030069857d2e4169ee",
+        "0x52908400098527886e0f7030069857d2e4169ee77",
+        "0x52908400098527886e0f7030069857d2e4169eeg",
+    ],
+)
+def test_checksum_addresses_invalid(address):
+    with pytest.raises(ValueError):
+        checksum_addresses([EIP55_ADDRESSES[0], address])
+
+
+def test_receiver_source_checks_mixed_case(tmp_path):
+    bad_checksum = EIP55_ADDRESSES[4].replace("a", "A", 1)
+    path = tmp_path / "receivers.csv"
+    rows = ["address", *EIP55_ADDRESSES, bad_checksum.lower(), bad_checksum, "0x1234"]
+    path.write_text("\n".join(rows) + "\n")
+
+    source = ReceiverSource(path)
+    assert list(source) == EIP55_ADDRESSES
+    assert (source.rows, source.invalid, source.duplicates) == (11, 2, 1)
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from pinata.exceptions import PinataResponseKeyError
+from pinata.response import iter_json_array
+
+DOCUMENT = (
+    '{"count": 3, "meta": {"skipped": [1, "a \\"quoted\\" ]"]}, "rows": ['
+    '{"name": "caf\\u00e9 \\\\ \\"x\\" é✓", "size": 12345, "ratio": -1.5e-3, '
+    '"ok": true, "bad": false, "none": null}, 67890, 0.25, "tail"'
+    '], "after": {"rows": []}}'
+).encode()
+
+
+def _splits(document: bytes):
+    # Every way of cutting the document in two, then one byte at a time.
+    splits = [[document[:offset], document[offset:]] for offset in range(len(document) + 1)]
+    return splits + [[document[i : i + 1] for i in range(len(document))]]
+
+
+@pytest.mark.parametrize("chunks", _splits(DOCUMENT))
+def test_iter_json_array_across_chunk_boundaries(chunks):
+    assert list(iter_json_array(chunks, "rows")) == json.loads(DOCUMENT)["rows"]
+
+
+@pytest.mark.parametrize("chunks", _splits(b'{"count": 0, "rows": [ ]}'))
+def test_iter_json_array_empty(chunks):
+    assert list(iter_json_array(chunks, "rows")) == []
+
+
+@pytest.mark.parametrize("document", [b"{}", b'{"count": 1, "other": [1]}'])
+def test_iter_json_array_missing_key(document):
+    for chunks in _splits(document):
+        with pytest.raises(PinataResponseKeyError):
+            list(iter_json_array(chunks, "rows"))
+
+
+def test_iter_json_array_number_at_end_of_chunk():
+    assert list(iter_json_array([b'{"rows": [12', b"34", b"5.", b"5]}"], "rows")) == [12345.5]
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+from typing import Dict
+
+import pytest
+from pinata import scheduler
+from pinata.scheduler import RequestScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # A simulated clock: sleeping advances it instantly.
+    clock = SimpleNamespace(now=1000.0)
+
+    def sleep(seconds):
+        clock.now += max(seconds, 1e-6)  # Real sleeps always take some time.
+
+    fake_time = SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep, time=lambda: clock.now)
+    monkeypatch.setattr(scheduler, "time", fake_time)
+    return clock
+
+
+@pytest.mark.parametrize("requests_per_minute", [30, 180, 1000])
+def test_rate_limit_holds_over_any_minute(clock, requests_per_minute):
+    request_scheduler = RequestScheduler(requests_per_minute=requests_per_minute)
+    started = clock.now
+    admitted = []
+    while clock.now - started < 180:
+        request_scheduler.bucket.acquire()
+        admitted.append(clock.now - started)
+
+    first_minute = [t for t in admitted if t < 60]
+    assert requests_per_minute * 0.9 <= len(first_minute) <= requests_per_minute
+
+    # Every rolling one-minute window, not only the first.
+    end = 0
+    for start, admitted_at in enumerate(admitted):
+        while end < len(admitted) and admitted[end] < admitted_at + 60:
+            end += 1
+
+        assert end - start <= requests_per_minute
+
+
+def test_window_starts_below_its_cap_and_grows_while_healthy(clock):
+    request_scheduler = RequestScheduler(max_concurrency=8)
+    window = request_scheduler.window
+    assert window.size < window.max_size
+
+    for _ in range(100):
+        with request_scheduler.slot():
+            pass
+
+    assert window.size == window.max_size
+
+
+def test_throttles_lower_the_rate_until_requests_succeed(clock):
+    request_scheduler = RequestScheduler(requests_per_minute=180)
+    bucket = request_scheduler.bucket
+    max_rate = bucket.rate
+
+    # A burst of throttled requests halves the rate once.
+    for _ in range(3):
+        with request_scheduler.slot() as slot:
+            slot.throttled = True
+
+        delay = request_scheduler.retry_delay("GET", 0, 429, {"Retry-After": "2"})
+        assert delay == 2
+        clock.now += delay
+
+    assert bucket.rate == max_rate / 2
+
+    for _ in range(1000):
+        with request_scheduler.slot():
+            pass
+
+    assert bucket.rate == max_rate
+
+
+def test_rate_settles_under_a_lower_real_limit(clock):
+    # The server allows 60 requests per calendar minute; the client assumes 180.
+    request_scheduler = RequestScheduler(requests_per_minute=180)
+    started = clock.now
+    accepted: Dict[int, int] = {}
+    throttled: Dict[int, int] = {}
+    while clock.now - started < 600:
+        minute = int((clock.now - started) // 60)
+        with request_scheduler.slot() as slot:
+            slot.throttled = accepted.get(minute, 0) >= 60
+            outcomes = throttled if slot.throttled else accepted
+            outcomes[minute] = outcomes.get(minute, 0) + 1
+
+        if slot.throttled:
+            clock.now += request_scheduler.retry_delay("GET", 0, 429, {"Retry-After": "1"})
+
+    # Without adapting, about 40 requests a minute are throttled.
+    later_minutes = range(2, 10)
+    assert sum(throttled.get(m, 0) for m in later_minutes) <= 4 * len(later_minutes)
+    assert sum(accepted[m] for m in later_minutes) >= 50 * len(later_minutes)
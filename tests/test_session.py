@@ -0,0 +1,35 @@
+import threading
+
+from pinata.clients.data import DataClient
+from pinata.exceptions import PinataUnauthorizedError
+from pinata.session import PinataAPISession
+from pinata.transport import pool_size_for_concurrency
+
+from .pinata_emulator import PinataEmulator
+
+
+def test_failed_streamed_requests_release_their_connections():
+    attempts = pool_size_for_concurrency(1) + 2
+    errors = []
+    with PinataEmulator(api_key="key") as emulator:
+        session = PinataAPISession.from_api_key(
+            "wrong", "secret", host_address=emulator.url, concurrency=1
+        )
+        data = DataClient(session)
+
+        def search_pins():
+            for _ in range(attempts):
+                try:
+                    data.search_pins(stream=True)
+                except Exception as err:
+                    errors.append(err)
+
+        # If failed responses kept their connections, the call after the pool's size
+        # would block forever, so run the calls where a hang cannot stall the suite.
+        thread = threading.Thread(target=search_pins, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive(), session.pool_stats
+        assert len(errors) == attempts
+        assert all(isinstance(err, PinataUnauthorizedError) for err in errors)
+        assert session.pool_stats.in_use == 0
@@ -0,0 +1,74 @@
+"""
+Gas benchmark comparing ``PoofPoof`` (stored token URIs) with ``PoofPoofDerivedURI``
+(URIs derived from the base URI and token ID). Run with ``ape test -s`` to see the
+report.
+"""
+
+from typing import Dict
+
+import pytest
+
+BASE_URI = "ipfs://QmaDWiD52oLVVhUscPTyPMd8ftnxuuzGPaDHPYw2stZTH7/"
+NUMBER_OF_TOKENS = 10
+
+
+def _mint(contract, receiver, token_id, owner):
+    if contract.contract_type.name == "PoofPoof":
+        return contract.safeMint(receiver, f"{token_id}.json", sender=owner)
+
+    return contract.safeMint(receiver, sender=owner)
+
+
+def _measure(contract, owner, receiver, other) -> Dict[str, int]:
+    token_ids = range(NUMBER_OF_TOKENS)
+    mint_gas = [_mint(contract, receiver, token_id, owner).gas_used for token_id in token_ids]
+    transfer_gas = contract.transferFrom(receiver, other, 0, sender=receiver).gas_used
+    token_uri_gas = contract.tokenURI.estimate_gas_cost(NUMBER_OF_TOKENS - 1)
+    return {
+        # The first mint also pays for initializing the counter and balance.
+        "first mint": mint_gas[0],
+        "mint": sum(mint_gas[1:]) // (NUMBER_OF_TOKENS - 1),
+        "transfer": transfer_gas,
+        "tokenURI": token_uri_gas,
+    }
+
+
+@pytest.fixture(scope="module")
+def gas_report(project, owner, accounts):
+    receiver, other = accounts[1], accounts[2]
+    report = {
+        name: _measure(owner.deploy(getattr(project, name), BASE_URI), owner, receiver, other)
+        for name in ("PoofPoof", "PoofPoofDerivedURI")
+    }
+
+    print(f"\n{'':<20}" + "".join(f"{op:>12}" for op in report["PoofPoof"]))
+    for name, row in report.items():
+        print(f"{name:<20}" + "".join(f"{gas:>12}" for gas in row.values()))
+
+    return report
+
+
+def test_derived_uri_mint_is_cheaper(gas_report):
+    assert gas_report["PoofPoofDerivedURI"]["mint"] < gas_report["PoofPoof"]["mint"]
+
+
+def test_derived_token_uri_is_cheaper(gas_report):
+    # The stored URI costs an extra storage read; building the ID string is cheaper.
+    assert gas_report["PoofPoofDerivedURI"]["tokenURI"] < gas_report["PoofPoof"]["tokenURI"]
+
+
+def test_derived_uri_transfer_costs_the_same(gas_report):
+    # Transfers do not touch URIs; allow for differences in function dispatch.
+    stored = gas_report["PoofPoof"]["transfer"]
+    assert gas_report["PoofPoofDerivedURI"]["transfer"] <= stored * 1.01
+
+
+def test_token_uris_match(project, owner, accounts):
+    stored = owner.deploy(project.PoofPoof, BASE_URI)
+    derived = owner.deploy(project.PoofPoofDerivedURI, BASE_URI)
+    _mint(stored, accounts[1], 0, owner)
+    _mint(derived, accounts[1], 0, owner)
+    assert derived.tokenURI(0) == stored.tokenURI(0) == f"{BASE_URI}0.json"
+
+    derived.setTokenURI(0, "special.json", sender=owner)
+    assert derived.tokenURI(0) == f"{BASE_URI}special.json"
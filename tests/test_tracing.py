@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+from nft_project.cid import compute_cid
+from pinata import Pinata
+from pinata.scheduler import RequestScheduler
+from pinata.tracing import LatencyHistogram, RecordingTracer, Span, normalize_endpoint
+
+from .pinata_emulator import PinataEmulator
+
+
+@pytest.fixture
+def traced(tmp_path):
+    # A private emulator that throttles, so that some requests are retried.
+    with PinataEmulator(throttle_rate=0.5, retry_after=0, seed=12) as emulator:
+        tracer = RecordingTracer()
+        scheduler = RequestScheduler(requests_per_minute=60_000)
+        pinata = Pinata.from_api_key(
+            "test", "test", host_address=emulator.url, scheduler=scheduler, tracer=tracer
+        )
+        yield pinata, tracer, emulator
+
+
+def test_spans_cover_every_attempt(traced, tmp_path):
+    pinata, tracer, emulator = traced
+    path = tmp_path / "traced.txt"
+    path.write_bytes(b"traced content")
+    content_hash = pinata.pin_file(path)
+    pinata.get_pins()
+    pinata.unpin(content_hash)
+
+    spans = list(tracer.spans)
+    assert len(spans) == sum(emulator.requests.values())
+    assert sum(span.status == 429 for span in spans) == emulator.throttled > 0
+    assert {span.endpoint for span in spans} == {
+        "/pinning/pinFileToIPFS",
+        "/data/pinList",
+        "/pinning/unpin/{hash}",
+    }
+
+    for span in spans:
+        assert span.total >= span.ttfb >= 0
+        assert span.transfer == pytest.approx(span.total - span.ttfb)
+        assert span.bytes_received > 0
+        if span.status == 429:
+            assert span.error is None
+
+    uploads = [span for span in spans if span.endpoint == "/pinning/pinFileToIPFS"]
+    assert all(span.bytes_sent > len(b"traced content") for span in uploads)
+    assert [span.attempt for span in uploads] == list(range(len(uploads)))
+    assert uploads[-1].status == 200
+    # The first request opened a connection; later ones may reuse it.
+    assert spans[0].connect is not None and spans[0].connect >= 0
+
+
+def test_histograms_and_json_lines_export(traced, tmp_path):
+    pinata, tracer, emulator = traced
+    pinata.get_pins()
+    pinata.get_pins()
+
+    histograms = tracer.histograms()
+    assert list(histograms) == ["GET /data/pinList"]
+    assert histograms["GET /data/pinList"]["count"] == len(tracer.spans)
+
+    output = io.StringIO()
+    tracer.export_jsonl(output)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines == [span.to_dict() for span in tracer.spans]
+    assert set(lines[0]) == set(Span.__slots__)
+
+
+def test_tracing_is_off_by_default(pinata_emulator, monkeypatch):
+    pinata = Pinata.from_api_key("test", "test", host_address=pinata_emulator.url)
+    session = pinata.data.session
+
+    def trace(*args, **kwargs):
+        raise AssertionError("Traced while disabled.")
+
+    monkeypatch.setattr(session, "_trace", trace)
+    assert not session.tracer.enabled
+    pinata.get_pins()
+
+
+def test_recording_tracer_keeps_recent_spans():
+    tracer = RecordingTracer(max_spans=3)
+    for attempt in range(5):
+        tracer.record(Span("GET", "/data/pinList", attempt, 0.0, 0.01 * attempt))
+
+    assert [span.attempt for span in tracer.spans] == [2, 3, 4]
+    assert tracer.histograms()["GET /data/pinList"]["count"] == 5
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    assert histogram.quantile(0.5) == 0.0
+
+    for seconds in (0.05, 0.1, 0.5, 0.7, 5.0):
+        histogram.observe(seconds)
+
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.8) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert histogram.to_dict()["mean"] == pytest.approx(6.35 / 5)
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        (f"/pinning/unpin/{compute_cid(b'x')}", "/pinning/unpin/{hash}"),
+        (f"/pinning/unpin/{compute_cid(b'x', version=1)}", "/pinning/unpin/{hash}"),
+        (f"/ipfs/{compute_cid(b'x')}/0.json", "/ipfs/{hash}/0.json"),
+        ("/data/pinList", "/data/pinList"),
+        ("/pinning/unpin/Qmshort", "/pinning/unpin/Qmshort"),
+    ],
+)
+def test_normalize_endpoint(path, expected):
+    assert normalize_endpoint(path) == expected